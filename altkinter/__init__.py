@@ -3,32 +3,44 @@ This file initializes the altkinter package and imports the necessary modules.
 
 Available modules:
 - CustomButton from button.py
-- CustomCheckButton from check_button.py
+- CustomCheckButton, CheckButtonGroup from check_button.py
 - CustomComboBox from combobox.py
 - CustomEntry from entry.py
 - CustomLabel from label.py
 - CustomListBox from listbox.py
 - CustomProgressBar from progressbar.py
 - CustomScrollbar from scrollbar.py
-- CustomTableView from tableview.py
+- CustomTableView, ScrollGroup from tableview.py
+- ValueRange, ColorScale, RegexMatch, NumberFormat, DateFormat from formatting.py
+- Theme, Palette, register_theme, load_themes from theme.py
+- AnimationClock, clock_for, tween from animation.py
+- PrefixIndex, Autocomplete from completion.py
+- instrument: opt-in counters and timers (instrument.enable(), instrument.snapshot())
+- LagMonitor from monitor.py (or Tk.start_lag_monitor())
 """
 
 from .button import CustomButton
-from .check_button import CustomCheckButton
+from .check_button import CustomCheckButton, CheckButtonGroup
 from .combobox import CustomComboBox
 from .entry import CustomEntry
 from .label import CustomLabel
 from .listbox import CustomListBox
 from .progressbar import CustomProgressBar
 from .scrollbar import CustomScrollbar
-from .tableview import CustomTableView
+from .tableview import CustomTableView, ScrollGroup
+from .formatting import ValueRange, ColorScale, RegexMatch, NumberFormat, DateFormat
 from .progress_window import ProgressWindow
-from .theme import Theme
+from .theme import Theme, Palette, register_theme, load_themes
+from .animation import AnimationClock, clock_for, tween
+from .completion import PrefixIndex, Autocomplete
+from . import instrument
+from .monitor import LagMonitor
 from .altk import Tk, Toplevel, Frame
 from .tooltip import CanvasToolTip, ToolTip
 __all__ = [
     "CustomButton",
     "CustomCheckButton",
+    "CheckButtonGroup",
     "CustomComboBox",
     "CustomEntry",
     "CustomLabel",
@@ -36,8 +48,23 @@ __all__ = [
     "CustomProgressBar",
     "CustomScrollbar",
     "CustomTableView",
+    "ScrollGroup",
+    "ValueRange",
+    "ColorScale",
+    "RegexMatch",
+    "NumberFormat",
+    "DateFormat",
     "ProgressWindow",
     "Theme",
+    "Palette",
+    "register_theme",
+    "load_themes",
+    "AnimationClock",
+    "clock_for",
+    "tween",
+    "PrefixIndex",
+    "Autocomplete",
+    "LagMonitor",
     "Tk",
     "Toplevel",
     "Frame",
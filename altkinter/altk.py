@@ -1,17 +1,25 @@
 import tkinter as tk
 from .theme import Theme
-from ctypes import windll, byref, sizeof, wintypes
+from ctypes import byref, sizeof
+try:
+    from ctypes import windll, wintypes
+except (ImportError, ValueError):
+    # Not on Windows: there is no title bar colour to set
+    windll = None
 
 class Tk(tk.Tk):
     def __init__(self, theme_mode="light"):
         super().__init__()
         self.theme = Theme(theme_mode)
+        self.theme.register(self)
         
         self.configure(bg=self.theme.background)
         self.after_idle(self.after,100,self.set_title_bar_color)  # Set title bar color after window is created
         
     def set_title_bar_color(self):
         """Set title bar color using Windows API"""
+        if windll is None:
+            return
         hwnd = windll.user32.GetParent(self.winfo_id())
         color_value = wintypes.DWORD(int(self.theme.background.replace("#", "0x"), 16))
         try:
@@ -26,10 +34,21 @@ class Tk(tk.Tk):
             print(f"Title bar color change failed: {e}")
             
     def set_theme(self, mode):
-        """Optional: Switch theme at runtime"""
-        self.theme.set_mode(mode)
+        """Switch theme at runtime, repainting every widget using it in one pass"""
+        self.theme.switch(mode)
+
+    def _apply_theme(self):
         self.configure(bg=self.theme.background)
-        # Optionally, trigger updates on child widgets here if needed
+        self.set_title_bar_color()
+
+    def start_lag_monitor(self, overlay=False, **kwargs):
+        """Start measuring event-loop lag (see monitor.LagMonitor for the options) and return the monitor"""
+        from .monitor import LagMonitor
+        if getattr(self, 'lag_monitor', None) is None:
+            self.lag_monitor = LagMonitor(self, **kwargs).start()
+        if overlay:
+            self.lag_monitor.show_overlay()
+        return self.lag_monitor
         
     def destroy(self):
         # Make sure we destroy both windows
@@ -41,11 +60,14 @@ class Toplevel(tk.Toplevel):
     def __init__(self, master=None, theme=None, **kwargs):
         super().__init__(master, **kwargs)
         self.theme = theme or getattr(master, 'theme', Theme("light"))
+        self.theme.register(self)
         self.configure(bg=self.theme.background)
         self.after_idle(self.after, 100, self.set_title_bar_color)
 
     def set_title_bar_color(self):
         """Set title bar color using Windows API"""
+        if windll is None:
+            return
         hwnd = windll.user32.GetParent(self.winfo_id())
         color_value = wintypes.DWORD(int(self.theme.background.replace("#", "0x"), 16))
         try:
@@ -60,11 +82,20 @@ class Toplevel(tk.Toplevel):
             print(f"Title bar color change failed: {e}")
 
     def set_theme(self, mode):
-        self.theme.set_mode(mode)
+        self.theme.switch(mode)
+
+    def _apply_theme(self):
         self.configure(bg=self.theme.background)
+        self.set_title_bar_color()
 
 class Frame(tk.Frame):
     def __init__(self, master=None, theme=None, **kwargs):
         self.theme = theme or getattr(master, 'theme', Theme("light"))
+        self._themed_bg = "bg" not in kwargs
         bg = kwargs.pop("bg", self.theme.background)
-        super().__init__(master, bg=bg, **kwargs)
\ No newline at end of file
+        super().__init__(master, bg=bg, **kwargs)
+        self.theme.register(self)
+
+    def _apply_theme(self):
+        if self._themed_bg:
+            self.configure(bg=self.theme.background)
\ No newline at end of file
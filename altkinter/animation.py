@@ -0,0 +1,142 @@
+"""Shared animation clock and easing helpers.
+
+Every root window gets one ``AnimationClock`` (see ``clock_for``) that drives
+all of its running animations from a single ``after`` tick at the display
+frame rate, instead of one timer per widget. An animation is a ``step(dt)``
+callable bound to a widget; ``dt`` is the time in seconds since its previous
+frame, and returning False ends it. Animations of widgets that are not
+viewable (unmapped, or inside a withdrawn window) are paused: they are not
+stepped and their time does not advance. While nothing visible is animating
+the clock only polls every ``idle_ms``, and with no animations it stops.
+"""
+import time
+import tkinter as tk
+
+
+def linear(t):
+    return t
+
+
+def ease_in(t):
+    return t * t * t
+
+
+def ease_out(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out(t):
+    return 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+def lerp(start, end, t):
+    """Interpolate between ``start`` and ``end``."""
+    return start + (end - start) * t
+
+
+class Animation:
+    """A running animation, as returned by ``AnimationClock.add``."""
+
+    __slots__ = ("widget", "step", "last")
+
+    def __init__(self, widget, step):
+        self.widget = widget
+        self.step = step
+        self.last = None
+
+
+class AnimationClock:
+    """
+    Drive many animations from one timer.
+
+    :param root: The root window whose ``after`` schedules the tick.
+    :param fps: Target frame rate while a visible animation is running.
+    :param idle_ms: Polling interval while every animation is paused.
+    """
+
+    def __init__(self, root, fps=60, idle_ms=250):
+        self.root = root
+        self.interval = max(1, round(1000 / fps))
+        self.idle_ms = idle_ms
+        self._animations = []
+        self._after = None
+
+    def add(self, widget, step):
+        """Call ``step(dt)`` every frame while ``widget`` is viewable, until it returns False."""
+        animation = Animation(widget, step)
+        self._animations.append(animation)
+        if self._after is None:
+            self._after = self.root.after(self.interval, self._tick)
+        return animation
+
+    def remove(self, animation):
+        """Stop ``animation``; stopping one that already ended is a no-op."""
+        if animation in self._animations:
+            self._animations.remove(animation)
+        if not self._animations and self._after is not None:
+            self.root.after_cancel(self._after)
+            self._after = None
+
+    def __len__(self):
+        return len(self._animations)
+
+    def _tick(self):
+        self._after = None
+        now = time.perf_counter()
+        running = False
+        for animation in list(self._animations):
+            try:
+                viewable = animation.widget.winfo_viewable()
+            except tk.TclError:
+                # The widget was destroyed
+                self._animations.remove(animation)
+                continue
+            if not viewable:
+                animation.last = None
+                continue
+            dt = 0.0 if animation.last is None else now - animation.last
+            animation.last = now
+            running = True
+            if animation.step(dt) is False and animation in self._animations:
+                self._animations.remove(animation)
+        if self._animations:
+            spent = int((time.perf_counter() - now) * 1000)
+            delay = max(1, self.interval - spent) if running else self.idle_ms
+            self._after = self.root.after(delay, self._tick)
+
+
+def clock_for(widget):
+    """Return the animation clock of ``widget``'s root window, creating it on first use."""
+    root = widget._root()
+    clock = getattr(root, "_animation_clock", None)
+    if clock is None:
+        clock = root._animation_clock = AnimationClock(root)
+    return clock
+
+
+def tween(widget, duration, update, start=0.0, end=1.0, easing=ease_in_out, on_done=None, repeat=False):
+    """
+    Animate a value from ``start`` to ``end`` over ``duration`` seconds.
+
+    :param update: Called with the eased value on every frame, ending with ``end``.
+    :param easing: Maps linear progress in [0, 1] to eased progress.
+    :param on_done: Called once the tween finishes (never when ``repeat`` is set).
+    :param repeat: Restart from ``start`` after each run until removed.
+    :return: The Animation, to pass to ``clock_for(widget).remove`` to stop early.
+    """
+    elapsed = [0.0]
+
+    def step(dt):
+        elapsed[0] += dt
+        t = min(elapsed[0] / duration, 1.0) if duration > 0 else 1.0
+        update(lerp(start, end, easing(t)))
+        if t < 1.0:
+            return True
+        if repeat:
+            elapsed[0] = 0.0
+            return True
+        if on_done:
+            on_done()
+        return False
+
+    return clock_for(widget).add(widget, step)
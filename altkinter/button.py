@@ -1,9 +1,8 @@
 import tkinter as tk
-from PIL import Image, ImageDraw, ImageTk
 from .theme import Theme
 from .altk import Tk
+from . import sprites
 import cairo
-from io import BytesIO
 
 class CustomButton(tk.Label):
     def __init__(self, master, text="", command=None, width=100, height=30,
@@ -20,14 +19,7 @@ class CustomButton(tk.Label):
         self.text = text
 
         # Create the button image with rounded corners
-        self.image = self._create_rounded_button_image(
-            width, height, border_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.widget_bg,
-            text_color=self.theme.text,
-            text=text,
-            font=self.theme.font
-        )
+        self.image = self._create_rounded_button_image("widget_bg")
 
         # Initialize the Label widget with the image
         super().__init__(master, image=self.image, bg=parent_bg, **kwargs)
@@ -37,21 +29,23 @@ class CustomButton(tk.Label):
         self.bind("<Leave>", self.on_leave)
         self.bind("<ButtonPress-1>", self.on_click)
         self.bind("<ButtonRelease-1>", self.on_release)
+        self.theme.register(self)
 
 
-    def _create_rounded_button_image(self, width, height, radius, border_color, bg_color, text_color, text, font):
+    def _create_rounded_button_image(self, bg="widget_bg"):
+        return sprites.photo(self._render_rounded_button, self.width, self.height, self.border_radius,
+                             self.theme.palette, bg, self.text)
+
+    @staticmethod
+    def _render_rounded_button(width, height, radius, palette, bg, text):
         # Create a blank image with cairo
         surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
         context = cairo.Context(surface)
 
-        # Convert colors from hex to RGB
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (0, 2, 4))
-
-        border_rgb = hex_to_rgb(border_color)
-        bg_rgb = hex_to_rgb(bg_color)
-        text_rgb = hex_to_rgb(text_color)
+        border_rgb = palette.rgb["border"]
+        bg_rgb = palette.rgb[bg]
+        text_rgb = palette.rgb["text"]
+        font = palette.font
 
         # Draw the border
         context.set_source_rgb(*border_rgb)
@@ -85,57 +79,31 @@ class CustomButton(tk.Label):
         context.move_to(text_x, text_y)
         context.show_text(text)
 
-        # Save the cairo surface to a BytesIO object in PNG format
-        buffer = BytesIO()
-        surface.write_to_png(buffer)
-        buffer.seek(0)
+        return sprites.surface_image(surface)
+
+    def _theme_sprites(self):
+        return [(self._render_rounded_button, self.width, self.height, self.border_radius,
+                 self.theme.palette, "widget_bg", self.text)]
 
-        # Load the PNG data into a Tkinter-compatible image
-        return ImageTk.PhotoImage(data=buffer.getvalue())
+    def _apply_theme(self):
+        self.image = self._create_rounded_button_image("widget_bg")
+        self.config(image=self.image, bg=self.master.cget("bg"))
 
 
     def on_enter(self, event):
-        self.image = self._create_rounded_button_image(
-            self.width, self.height, self.border_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.hover,
-            text_color=self.theme.text,
-            text=self.text,
-            font=self.theme.font
-        )
+        self.image = self._create_rounded_button_image("hover")
         self.config(image=self.image)
 
     def on_leave(self, event):
-        self.image = self._create_rounded_button_image(
-            self.width, self.height, self.border_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.widget_bg,
-            text_color=self.theme.text,
-            text=self.text,
-            font=self.theme.font
-        )
+        self.image = self._create_rounded_button_image("widget_bg")
         self.config(image=self.image)
 
     def on_click(self, event):
-        self.image = self._create_rounded_button_image(
-            self.width, self.height, self.border_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.active,
-            text_color=self.theme.text,
-            text=self.text,
-            font=self.theme.font
-        )
+        self.image = self._create_rounded_button_image("active")
         self.config(image=self.image)
 
     def on_release(self, event):
-        self.image = self._create_rounded_button_image(
-            self.width, self.height, self.border_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.hover,
-            text_color=self.theme.text,
-            text=self.text,
-            font=self.theme.font
-        )
+        self.image = self._create_rounded_button_image("hover")
         self.config(image=self.image)
         if self.command:
             self.command()
@@ -1,9 +1,8 @@
 import tkinter as tk
 from .theme import Theme 
 from .altk import Tk
+from . import sprites
 import cairo
-from PIL import Image, ImageTk
-from io import BytesIO
 
 class CustomCheckButton(tk.Canvas):
     def __init__(self, master, text="", command=None, variable=None,
@@ -17,17 +16,14 @@ class CustomCheckButton(tk.Canvas):
                          bg=parent_bg, highlightthickness=0, bd=0, **kwargs)
 
         self.command = command
+        self.group = None
         self.checked = variable if variable is not None else tk.BooleanVar(value=False)
         self.box_width = size
         self.box_height = size
         self.box_radius = size/5
 
         # Checkbox background (rounded, using cairo)
-        self.box_image = self._create_rounded_box_image(
-            size, size, self.box_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.widget_bg
-        )
+        self.box_image = self._create_rounded_box_image("widget_bg")
         self.box = self.create_image(2, 2, anchor="nw", image=self.box_image, tags="box")
 
         # Checkmark character (instead of line drawing)
@@ -50,40 +46,39 @@ class CustomCheckButton(tk.Canvas):
                                       fill=self.theme.text,
                                       tags="label")
 
-        # Single click binding on the entire canvas
-        self.tag_bind("box", "<Button-1>", self.toggle)
-        self.tag_bind("label", "<Button-1>", self.toggle)
+        # Single click binding on the entire canvas; it covers the box and the label,
+        # so item bindings would only deliver the same click twice
         self.bind("<Button-1>", self.toggle)
 
         self.update_check()
+        self.theme.register(self)
+
+    def _create_rounded_box_image(self, bg="widget_bg"):
+        return sprites.photo(self._render_rounded_box, self.box_width, self.box_height, self.box_radius,
+                             self.theme.palette, bg)
 
-    def _create_rounded_box_image(self, width, height, radius, border_color, bg_color):
+    @staticmethod
+    def _render_rounded_box(width, height, radius, palette, bg):
         surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
         ctx = cairo.Context(surface)
 
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (0, 2, 4))
-
-        border_rgb = hex_to_rgb(border_color)
-        bg_rgb = hex_to_rgb(bg_color)
+        border_rgb = palette.rgb["border"]
+        bg_rgb = palette.rgb[bg]
 
         # Draw border
         ctx.set_source_rgb(*border_rgb)
-        self._rounded_rect(ctx, 0, 0, width, height, radius)
+        CustomCheckButton._rounded_rect(ctx, 0, 0, width, height, radius)
         ctx.fill()
 
         # Draw background (inset for border)
         ctx.set_source_rgb(*bg_rgb)
-        self._rounded_rect(ctx, 1, 1, width-2, height-2, max(1, radius-1))
+        CustomCheckButton._rounded_rect(ctx, 1, 1, width-2, height-2, max(1, radius-1))
         ctx.fill()
 
-        buffer = BytesIO()
-        surface.write_to_png(buffer)
-        buffer.seek(0)
-        return ImageTk.PhotoImage(data=buffer.getvalue())
+        return sprites.surface_image(surface)
 
-    def _rounded_rect(self, ctx, x, y, w, h, r):
+    @staticmethod
+    def _rounded_rect(ctx, x, y, w, h, r):
         # Draw a rounded rectangle path on cairo context
         ctx.new_sub_path()
         ctx.arc(x + w - r, y + r, r, -0.5 * 3.1416, 0)
@@ -93,37 +88,149 @@ class CustomCheckButton(tk.Canvas):
         ctx.close_path()
 
     def toggle(self, event=None):
-        # Prevent double-calling due to overlapping tags
-        if event:
-            event.widget.unbind("<Button-1>")
-
         current = self.checked.get()
         self.checked.set(not current)
         self.update_check()
 
         if self.command:
             self.command()
+        if self.group is not None:
+            self.group._changed(self)
+
+    def _box_role(self):
+        return "active" if self.checked.get() else "widget_bg"
 
-        self.after(50, lambda: self.bind("<Button-1>", self.toggle))  # Rebind after brief delay
+    def _theme_sprites(self):
+        return [(self._render_rounded_box, self.box_width, self.box_height, self.box_radius,
+                 self.theme.palette, self._box_role())]
+
+    def _apply_theme(self):
+        self.configure(bg=self.master.cget("bg"))
+        self.itemconfig(self.check, fill=self.theme.accent)
+        self.itemconfig(self.label, fill=self.theme.text, font=self.theme.font)
+        self.update_check()
+
+    def destroy(self):
+        if self.group is not None:
+            self.group._forget(self)
+        super().destroy()
 
     def update_check(self):
         # Update box image for checked/unchecked state
-        if self.checked.get():
-            fill = self.theme.active
-        else:
-            fill = self.theme.widget_bg
-
-        self.box_image = self._create_rounded_box_image(
-            self.box_width, self.box_height, self.box_radius,
-            border_color=self.theme.border,
-            bg_color=fill
-        )
-        self.itemconfig(self.box, image=self.box_image)
+        self._show(self.checked.get(), self._create_rounded_box_image(self._box_role()))
 
-        if self.checked.get():
-            self.itemconfig(self.check, state="normal")
-        else:
-            self.itemconfig(self.check, state="hidden")
+    def _show(self, checked, image):
+        if image is not self.box_image:
+            self.box_image = image
+            self.itemconfig(self.box, image=image)
+        self.itemconfig(self.check, state="normal" if checked else "hidden")
+
+
+class CheckButtonGroup:
+    """
+    Check buttons switched and observed together, e.g. behind a "select all".
+
+    Bulk changes fetch the checked and unchecked box images once and hand the
+    same two images to every member, touching only members whose state changes.
+    Changes, whether clicks or bulk operations, are reported to ``command``
+    once per ``debounce_ms`` quiet period (or once per idle cycle with 0).
+
+    :param buttons: Initial CustomCheckButton members.
+    :param command: Called without arguments after the group's states change.
+    :param debounce_ms: Quiet period grouping changes into one ``command`` call.
+    """
+
+    def __init__(self, buttons=(), command=None, debounce_ms=0):
+        self.buttons = []
+        self.command = command
+        self.debounce_ms = debounce_ms
+        self._after = None
+        self._after_widget = None
+        for button in buttons:
+            self.add(button)
+
+    def add(self, button):
+        """Add a CustomCheckButton to the group and return it."""
+        button.group = self
+        self.buttons.append(button)
+        return button
+
+    def create(self, master, text="", **kwargs):
+        """Create a CustomCheckButton in ``master`` as a member of the group."""
+        return self.add(CustomCheckButton(master, text=text, **kwargs))
+
+    def remove(self, button):
+        if button in self.buttons:
+            self.buttons.remove(button)
+            button.group = None
+
+    def _forget(self, button):
+        """Drop a member being destroyed, moving a pending ``command`` call off its widget."""
+        self.remove(button)
+        if self._after is not None and self._after_widget is button:
+            button.after_cancel(self._after)
+            self._after = None
+            self._after_widget = None
+            if self.buttons:
+                self._changed(self.buttons[0])
+
+    def __len__(self):
+        return len(self.buttons)
+
+    def __iter__(self):
+        return iter(self.buttons)
+
+    def get(self):
+        """Return the checked state of every member, in order."""
+        return [button.checked.get() for button in self.buttons]
+
+    def checked(self):
+        """Return the checked members."""
+        return [button for button in self.buttons if button.checked.get()]
+
+    def set_all(self, checked=True):
+        """Check (or uncheck) every member."""
+        self._apply(lambda current: checked)
+
+    def invert(self):
+        """Flip every member."""
+        self._apply(lambda current: not current)
+
+    def _apply(self, state):
+        images = {}
+        changed = False
+        for button in self.buttons:
+            current = button.checked.get()
+            checked = bool(state(current))
+            if checked == current:
+                continue
+            key = (button.box_width, button.box_height, button.box_radius, button.theme.palette, checked)
+            image = images.get(key)
+            if image is None:
+                image = images[key] = button._create_rounded_box_image("active" if checked else "widget_bg")
+            button.checked.set(checked)
+            button._show(checked, image)
+            changed = True
+        if changed:
+            self._changed(self.buttons[0])
+
+    def _changed(self, widget):
+        """Schedule one ``command`` call for a burst of changes."""
+        if self.command is None:
+            return
+        if self.debounce_ms > 0:
+            if self._after is not None:
+                self._after_widget.after_cancel(self._after)
+            self._after = widget.after(self.debounce_ms, self._notify)
+        elif self._after is None:
+            self._after = widget.after_idle(self._notify)
+        self._after_widget = widget
+
+    def _notify(self):
+        self._after = None
+        self._after_widget = None
+        if self.command:
+            self.command()
 
 
 if __name__ == "__main__":
@@ -136,5 +243,11 @@ if __name__ == "__main__":
     cb = CustomCheckButton(app, text="Enable Notifications", command=on_toggle)
     cb.pack(pady=20, padx=20)
 
+    group = CheckButtonGroup(command=lambda: print("Checked:", sum(group.get())))
+    for i in range(5):
+        group.create(app, text=f"Option {i + 1}").pack(anchor="w", padx=20)
+    cb_all = CustomCheckButton(app, text="Select all", command=lambda: group.set_all(cb_all.checked.get()))
+    cb_all.pack(anchor="w", padx=20, pady=10)
+
     app.mainloop()
 
@@ -53,6 +53,15 @@ class CustomComboBox(tk.Frame):
         # Bind the master window's configure event to update dropdown position
         self.root.bind("<Configure>", self.on_master_move)
         self.bind('<FocusIn>', lambda e: self.hide_dropdown())
+        self.theme.register(self)
+
+    def _apply_theme(self):
+        self.configure(bg=self.theme.background)
+        self.dropdown_button.configure(bg=self.theme.background)
+        self.dropdown_button.itemconfig(self.border_rect, fill=self.theme.border)
+        self.dropdown_button.itemconfig(self.bg_rect, fill=self.theme.widget_bg)
+        for item in (self.text_item, self.arrow):
+            self.dropdown_button.itemconfig(item, fill=self.theme.text, font=self.theme.font)
 
     def _create_rounded_rect(self, x1, y1, x2, y2, r, **kwargs):
         points = [
@@ -0,0 +1,242 @@
+"""Prefix completion for CustomEntry.
+
+``PrefixIndex`` keeps the terms sorted by their case-folded form, so the
+terms starting with a prefix are one contiguous range found by binary
+search. With weights, a segment tree over the sorted terms answers "heaviest
+term in a range", and the top k of a range are pulled out with a heap in
+O(k log n). The sorted terms and weights can be saved to disk, so a large
+dictionary is sorted only once.
+
+``Autocomplete`` shows the completions of a CustomEntry in one popup window
+holding a CustomListBox, created on first use and reused for every keystroke.
+"""
+import json
+import heapq
+from array import array
+from bisect import bisect_left
+from .altk import Toplevel
+from .listbox import CustomListBox
+
+
+class PrefixIndex:
+    """
+    A sorted-array index answering top-k prefix queries.
+
+    :param terms: The terms to complete.
+    :param weights: Optional scores, one per term; heavier terms are suggested first.
+        Without weights, completions come in alphabetical order.
+    """
+
+    def __init__(self, terms, weights=None):
+        terms = list(terms)
+        if weights is not None:
+            weights = list(weights)
+            if len(weights) != len(terms):
+                raise ValueError("weights must have one score per term")
+            order = sorted(range(len(terms)), key=lambda i: terms[i].casefold())
+            terms = [terms[i] for i in order]
+            weights = [weights[i] for i in order]
+        else:
+            terms.sort(key=str.casefold)
+        self._set(terms, weights)
+
+    def _set(self, terms, weights):
+        self.terms = terms
+        keys = [term.casefold() for term in terms]
+        # Share the term list when folding changes nothing, which halves memory for lower-case data
+        self._keys = terms if keys == terms else keys
+        self.weights = array("d", weights) if weights is not None else None
+        self._tree = self._build_tree() if weights is not None else None
+
+    def _build_tree(self):
+        """Build a segment tree whose nodes hold the position of the heaviest term below them."""
+        n = len(self.terms)
+        weights = self.weights
+        tree = array("l", [0]) * (2 * n)
+        tree[n:] = array("l", range(n))
+        for node in range(n - 1, 0, -1):
+            left, right = tree[2 * node], tree[2 * node + 1]
+            better = weights[left] > weights[right] or (weights[left] == weights[right] and left < right)
+            tree[node] = left if better else right
+        return tree
+
+    def _heaviest(self, lo, hi):
+        """Return the position of the heaviest term in [lo, hi), preferring the first on ties."""
+        n, tree, weights = len(self.terms), self._tree, self.weights
+        best = lo
+        lo += n
+        hi += n
+        while lo < hi:
+            if lo & 1:
+                pos = tree[lo]
+                if weights[pos] > weights[best] or (weights[pos] == weights[best] and pos < best):
+                    best = pos
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                pos = tree[hi]
+                if weights[pos] > weights[best] or (weights[pos] == weights[best] and pos < best):
+                    best = pos
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def __len__(self):
+        return len(self.terms)
+
+    def prefix_range(self, prefix):
+        """Return the [lo, hi) positions of the terms starting with ``prefix`` (case-insensitive)."""
+        key = prefix.casefold()
+        lo = bisect_left(self._keys, key)
+        hi = bisect_left(self._keys, key + "\U0010ffff", lo)
+        return lo, hi
+
+    def complete(self, prefix, k=10):
+        """Return up to ``k`` terms starting with ``prefix``, heaviest first."""
+        lo, hi = self.prefix_range(prefix)
+        if lo >= hi or k <= 0:
+            return []
+        if self._tree is None:
+            return self.terms[lo:min(hi, lo + k)]
+        weights, terms = self.weights, self.terms
+        top = self._heaviest(lo, hi)
+        heap = [(-weights[top], top, lo, hi)]
+        result = []
+        while heap and len(result) < k:
+            _, pos, lo, hi = heapq.heappop(heap)
+            result.append(terms[pos])
+            for a, b in ((lo, pos), (pos + 1, hi)):
+                if a < b:
+                    best = self._heaviest(a, b)
+                    heapq.heappush(heap, (-weights[best], best, a, b))
+        return result
+
+    def save(self, path):
+        """Write the sorted terms and weights to ``path`` as JSON."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"terms": self.terms,
+                       "weights": list(self.weights) if self.weights is not None else None}, file)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by ``save``, skipping the sort."""
+        with open(path, encoding="utf-8") as file:
+            saved = json.load(file)
+        index = cls.__new__(cls)
+        index._set(saved["terms"], saved["weights"])
+        return index
+
+
+class Autocomplete:
+    """
+    Suggest completions for a CustomEntry in a reusable popup list.
+
+    Up/Down move through the suggestions, Return or a click accepts one and
+    Escape closes the popup.
+
+    :param entry: The CustomEntry to complete.
+    :param index: A PrefixIndex, or an iterable of terms to build one from.
+    :param limit: Maximum number of suggestions shown.
+    :param min_chars: Characters typed before suggestions appear.
+    """
+
+    def __init__(self, entry, index, limit=8, min_chars=1):
+        self.entry = entry
+        self.index = index if isinstance(index, PrefixIndex) else PrefixIndex(index)
+        self.limit = limit
+        self.min_chars = min_chars
+        self.popup = None
+        self.list = None
+        self.suggestions = []
+        self._accepting = False
+
+        entry._var.trace_add("write", self._on_text)
+        widget = entry.entry
+        widget.bind("<Down>", lambda e: self._move(1), add="+")
+        widget.bind("<Up>", lambda e: self._move(-1), add="+")
+        widget.bind("<Return>", self._on_return, add="+")
+        widget.bind("<Escape>", lambda e: self.hide(), add="+")
+        widget.bind("<FocusOut>", lambda e: entry.after(150, self._hide_unfocused), add="+")
+
+    def _build_popup(self):
+        """Create the popup window and its list once; later suggestions only refill it."""
+        self.popup = Toplevel(self.entry, theme=self.entry.theme)
+        self.popup.overrideredirect(True)
+        self.popup.withdraw()
+        self.list = CustomListBox(self.popup, width=self.entry.width, height=1, theme=self.entry.theme)
+        self.list.pack(fill="both", expand=True)
+        self.list.listbox.configure(exportselection=False, takefocus=0)
+        self.list.listbox.bind("<ButtonRelease-1>", self._on_click)
+
+    def _on_text(self, *args):
+        if self._accepting:
+            return
+        text = self.entry.get()
+        self.suggestions = self.index.complete(text, self.limit) if len(text) >= self.min_chars else []
+        if self.suggestions and self.suggestions != [text]:
+            self.show()
+        else:
+            self.hide()
+
+    def show(self):
+        """Fill the popup with the current suggestions and place it below the entry."""
+        if self.popup is None:
+            self._build_popup()
+        self.list.set_items(self.suggestions)
+        self.list.clear_selection()
+        self.list.listbox.configure(height=len(self.suggestions))
+        self.popup.update_idletasks()
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.popup.geometry(f"{self.entry.width}x{self.list.winfo_reqheight()}+{x}+{y}")
+        self.popup.deiconify()
+        self.popup.lift()
+
+    def hide(self):
+        if self.popup is not None:
+            self.popup.withdraw()
+
+    def _visible(self):
+        return self.popup is not None and self.popup.winfo_ismapped()
+
+    def _hide_unfocused(self):
+        """Close the popup once focus has left both the entry and the popup."""
+        if self.popup is None or not self.entry.winfo_exists():
+            return
+        focus = self.entry.focus_get()
+        if focus is not self.entry.entry and (focus is None or focus.winfo_toplevel() is not self.popup):
+            self.hide()
+
+    def _move(self, step):
+        if not self._visible():
+            return None
+        listbox = self.list.listbox
+        current = listbox.curselection()
+        pos = (current[0] + step if current else (0 if step > 0 else len(self.suggestions) - 1))
+        pos = max(0, min(len(self.suggestions) - 1, pos))
+        listbox.selection_clear(0, "end")
+        listbox.selection_set(pos)
+        listbox.see(pos)
+        return "break"
+
+    def _on_return(self, event):
+        if self._visible() and self.list.listbox.curselection():
+            self.accept(self.suggestions[self.list.listbox.curselection()[0]])
+            return "break"
+        return None
+
+    def _on_click(self, event):
+        current = self.list.listbox.curselection()
+        if current:
+            self.accept(self.suggestions[current[0]])
+
+    def accept(self, term):
+        """Put ``term`` into the entry and close the popup."""
+        self._accepting = True
+        try:
+            self.entry.set(term)
+        finally:
+            self._accepting = False
+        self.entry.entry.icursor("end")
+        self.entry.entry.focus_set()
+        self.hide()
@@ -1,13 +1,44 @@
 import tkinter as tk
-from PIL import Image, ImageTk
 from .altk import Tk
 from .theme import Theme
+from . import sprites
+from concurrent.futures import ThreadPoolExecutor
 import cairo
-from io import BytesIO
+
+# Border and fill roles of the background image for each entry state
+ENTRY_STATES = {
+    "normal": ("border", "widget_bg"),
+    "focus": ("focus", "widget_bg"),
+    "disabled": ("border", "background"),
+    "error": ("error", "widget_bg"),
+}
+
+# Worker threads shared by every entry's validator
+_validator_pool = None
+
+def _validator_executor():
+    global _validator_pool
+    if _validator_pool is None:
+        _validator_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="altkinter-validate")
+    return _validator_pool
 
 class CustomEntry(tk.Canvas):
     def __init__(self, master, width=200, height=30, border_radius=10,
-                 placeholder_text="", theme=None, **kwargs):
+                 placeholder_text="", theme=None, on_change=None, debounce_ms=0,
+                 debounce="trailing", validator=None, on_validate=None, **kwargs):
+        """
+        :param on_change: Called with the text whenever the user's text changes.
+        :param debounce_ms: Quiet period that groups a burst of changes into one call; 0 calls on every change.
+        :param debounce: "trailing" calls once the burst ends with the final text; "leading" calls
+            at its first change and ignores the rest of the burst.
+        :param validator: Called with the text on a worker thread after each ``on_change``; returns
+            whether the text is valid. Invalid text shows the error border. A validator that raises
+            counts as invalid and its exception is kept in ``validation_error``. Results for text
+            that has changed since are discarded and the current text is checked instead.
+        :param on_validate: Called on the main thread with ``(text, valid)`` for each current result.
+        """
+        if debounce not in ("trailing", "leading"):
+            raise ValueError("debounce must be 'trailing' or 'leading'")
 
         self.root = master.winfo_toplevel() if hasattr(master, 'winfo_toplevel') else master
         self.theme = theme or self.root.theme if hasattr(self.root, 'theme') else Theme("light")
@@ -21,19 +52,32 @@ class CustomEntry(tk.Canvas):
         self.border_radius = border_radius
         self.placeholder_text = placeholder_text
         self.has_focus = False
+        self.disabled = False
+        self.error = False
+        self.on_change = on_change
+        self.debounce_ms = debounce_ms
+        self.debounce = debounce
+        self.validator = validator
+        self.on_validate = on_validate
+        self.validation_error = None
+        self._debounce_after = None
+        self._validation = None
+        self._validation_after = None
+        self._checked_text = None
 
-        # Draw the rounded rectangle background using Cairo
-        self.bg_image = self._create_rounded_entry_image(
-            width, height, border_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.widget_bg
-        )
+        # Backgrounds for every state, rendered up front so state changes only swap images
+        self._backgrounds = {}
+        self._render_backgrounds()
+        self.bg_image = self._backgrounds["normal"]
         self.bg_image_id = self.create_image(0, 0, anchor="nw", image=self.bg_image)
 
         # Entry
-        self.entry = tk.Entry(self, bd=0, highlightthickness=0,
+        self._var = tk.StringVar(self)
+        self.entry = tk.Entry(self, bd=0, highlightthickness=0, textvariable=self._var,
                               bg=self.theme.widget_bg, fg=self.theme.text,
-                              font=self.theme.font, insertbackground=self.theme.text)
+                              font=self.theme.font, insertbackground=self.theme.text,
+                              disabledbackground=self.theme.background,
+                              disabledforeground=self.theme.placeholder)
         self.entry_window = self.create_window(width // 2, height // 2,
                                                window=self.entry,
                                                width=width - 16,
@@ -47,18 +91,26 @@ class CustomEntry(tk.Canvas):
         else:
             self.placeholder_active = False
 
+        # Change events; the placeholder is not user text, so compare against the last text seen
+        self._last_text = self.get()
+        self._var.trace_add("write", self._on_write)
+
         self.entry.bind("<FocusIn>", self.on_focus_in)
         self.entry.bind("<FocusOut>", self.on_focus_out)
         self.root.bind('<Button-1>', lambda e: self.root.focus() if e.widget != self.entry else None)   
+        self.theme.register(self)
 
-    def _create_rounded_entry_image(self, width, height, radius, border_color, bg_color):
-        # Convert hex to RGB
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) / 255.0 for i in (0, 2, 4))
+    def _create_rounded_entry_image(self, state="normal"):
+        return sprites.photo(*self._sprite(state))
 
-        border_rgb = hex_to_rgb(border_color)
-        bg_rgb = hex_to_rgb(bg_color)
+    def _sprite(self, state):
+        return (self._render_rounded_entry, self.width, self.height, self.border_radius,
+                self.theme.palette) + ENTRY_STATES[state]
+
+    @staticmethod
+    def _render_rounded_entry(width, height, radius, palette, border, bg):
+        border_rgb = palette.rgb[border]
+        bg_rgb = palette.rgb[bg]
 
         # Create Cairo surface
         surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
@@ -66,21 +118,18 @@ class CustomEntry(tk.Canvas):
 
         # Draw border
         ctx.set_source_rgb(*border_rgb)
-        self._rounded_rect(ctx, 0, 0, width, height, radius)
+        CustomEntry._rounded_rect(ctx, 0, 0, width, height, radius)
         ctx.fill()
 
         # Draw background (inset for border)
         ctx.set_source_rgb(*bg_rgb)
-        self._rounded_rect(ctx, 2, 2, width - 4, height - 4, radius - 2 if radius > 2 else radius)
+        CustomEntry._rounded_rect(ctx, 2, 2, width - 4, height - 4, radius - 2 if radius > 2 else radius)
         ctx.fill()
 
-        # Convert to Tkinter image
-        buffer = BytesIO()
-        surface.write_to_png(buffer)
-        buffer.seek(0)
-        return ImageTk.PhotoImage(data=buffer.getvalue())
+        return sprites.surface_image(surface)
 
-    def _rounded_rect(self, ctx, x, y, w, h, r):
+    @staticmethod
+    def _rounded_rect(ctx, x, y, w, h, r):
         # Draw a rounded rectangle path on the Cairo context
         ctx.new_sub_path()
         ctx.arc(x + w - r, y + r, r, -1.57, 0)
@@ -89,47 +138,191 @@ class CustomEntry(tk.Canvas):
         ctx.arc(x + r, y + r, r, 3.14, 4.71)
         ctx.close_path()
 
+    def _render_backgrounds(self):
+        """Fetch the background of every state for the current size and palette."""
+        sprites.prerender(self._theme_sprites())
+        self._backgrounds = {state: self._create_rounded_entry_image(state) for state in ENTRY_STATES}
+
+    def _state(self):
+        if self.disabled:
+            return "disabled"
+        if self.error:
+            return "error"
+        return "focus" if self.has_focus else "normal"
+
+    def _show_state(self):
+        """Swap in the pre-rendered background of the current state."""
+        image = self._backgrounds[self._state()]
+        if image is not self.bg_image:
+            self.bg_image = image
+            self.itemconfig(self.bg_image_id, image=image)
+
     def on_focus_in(self, event):
-        # Redraw with focus color
-        self.bg_image = self._create_rounded_entry_image(
-            self.width, self.height, self.border_radius,
-            border_color=self.theme.focus,
-            bg_color=self.theme.widget_bg
-        )
-        self.itemconfig(self.bg_image_id, image=self.bg_image)
+        self.has_focus = True
+        # Show the focus border
+        self._show_state()
         if self.placeholder_active:
             self.entry.delete(0, tk.END)
             self.entry.config(fg=self.theme.text)
             self.placeholder_active = False
 
     def on_focus_out(self, event):
-        # Redraw with normal border
-        self.bg_image = self._create_rounded_entry_image(
-            self.width, self.height, self.border_radius,
-            border_color=self.theme.border,
-            bg_color=self.theme.widget_bg
-        )
-        self.itemconfig(self.bg_image_id, image=self.bg_image)
+        self.has_focus = False
+        # Back to the normal border
+        self._show_state()
         if not self.entry.get() and self.placeholder_text:
+            self.placeholder_active = True
             self.entry.insert(0, self.placeholder_text)
             self.entry.config(fg=self.theme.placeholder)
-            self.placeholder_active = True
+
+    def resize(self, width, height):
+        """Resize the entry, re-rendering its rounded background."""
+        self.width = width
+        self.height = height
+        self.configure(width=width, height=height)
+        self._render_backgrounds()
+        self._show_state()
+        self.coords(self.entry_window, width // 2, height // 2)
+        self.itemconfig(self.entry_window, width=width - 16, height=height - 10)
+
+    def set_error(self, error=True):
+        """Show (or clear) the validation error border."""
+        self.error = bool(error)
+        self._show_state()
+
+    def disable(self):
+        """Make the entry read-only and show its disabled background."""
+        self.disabled = True
+        self.entry.config(state="disabled")
+        self._show_state()
+
+    def enable(self):
+        self.disabled = False
+        self.entry.config(state="normal")
+        self._show_state()
+
+    def _theme_sprites(self):
+        return [self._sprite(state) for state in ENTRY_STATES]
+
+    def _apply_theme(self):
+        self.configure(bg=self.master.cget("bg"))
+        self._render_backgrounds()
+        self._show_state()
+        self.entry.config(bg=self.theme.widget_bg, font=self.theme.font, insertbackground=self.theme.text,
+                          fg=self.theme.placeholder if self.placeholder_active else self.theme.text,
+                          disabledbackground=self.theme.background, disabledforeground=self.theme.placeholder)
+
+    def set_completions(self, terms, limit=8, min_chars=1):
+        """
+        Suggest completions from ``terms`` (an iterable or a PrefixIndex) while typing.
+
+        :return: The Autocomplete, also kept as ``self.autocomplete``.
+        """
+        from .completion import Autocomplete
+        self.autocomplete = Autocomplete(self, terms, limit=limit, min_chars=min_chars)
+        return self.autocomplete
+
+    def destroy(self):
+        if self._debounce_after is not None:
+            self.after_cancel(self._debounce_after)
+            self._debounce_after = None
+        if self._validation_after is not None:
+            self.after_cancel(self._validation_after)
+            self._validation_after = None
+        if self._validation is not None:
+            self._validation[1].cancel()
+            self._validation = None
+        super().destroy()
 
     def get(self):
         return "" if self.placeholder_active else self.entry.get()
 
     def set(self, text):
+        self.placeholder_active = False
         self.entry.delete(0, tk.END)
         self.entry.insert(0, text)
         self.entry.config(fg=self.theme.text)
-        self.placeholder_active = False
+
+    def _on_write(self, *args):
+        text = self.get()
+        if text == self._last_text:
+            return
+        self._last_text = text
+        if self.debounce_ms <= 0:
+            self._changed()
+        elif self.debounce == "leading":
+            # Fire at the start of a burst; later changes only extend the quiet period
+            if self._debounce_after is None:
+                self._changed()
+            else:
+                self.after_cancel(self._debounce_after)
+            self._debounce_after = self.after(self.debounce_ms, self._end_burst)
+        else:
+            if self._debounce_after is not None:
+                self.after_cancel(self._debounce_after)
+            self._debounce_after = self.after(self.debounce_ms, self._end_burst)
+
+    def _end_burst(self):
+        self._debounce_after = None
+        if self.debounce == "trailing":
+            self._changed()
+        elif self.validator and self.get() != self._checked_text:
+            # on_change only saw the start of the burst, but the final text must still be validated
+            self.validate()
+
+    def _changed(self):
+        text = self.get()
+        if self.on_change:
+            self.on_change(text)
+        if self.validator:
+            self.validate(text)
+
+    def validate(self, text=None):
+        """Run the validator on ``text`` (default: the current text) on a worker thread."""
+        text = self.get() if text is None else text
+        self._checked_text = text
+        if self._validation is not None:
+            # A newer text supersedes the pending check; drop it if it has not started yet
+            self._validation[1].cancel()
+        self._validation = (text, _validator_executor().submit(self.validator, text))
+        if self._validation_after is None:
+            self._validation_after = self.after(10, self._poll_validation)
+
+    def _poll_validation(self):
+        self._validation_after = None
+        if self._validation is None or not self.winfo_exists():
+            return
+        text, future = self._validation
+        if not future.done():
+            self._validation_after = self.after(10, self._poll_validation)
+            return
+        self._validation = None
+        if text != self.get():
+            # The user kept typing; the result is stale. A pending debounce checks again when
+            # the burst ends, otherwise check the current text now
+            if self._debounce_after is None:
+                self.validate()
+            return
+        try:
+            valid = bool(future.result())
+            self.validation_error = None
+        except Exception as error:
+            # A failing validator (e.g. a lookup that could not connect) must not escape into Tk
+            valid = False
+            self.validation_error = error
+        self.set_error(not valid)
+        if self.on_validate:
+            self.on_validate(text, valid)
 
 if __name__ == "__main__":
     root = Tk(theme_mode="light")
     root.title("Custom Entry Demo")
 
     entry = CustomEntry(root,
-                        placeholder_text="Enter text here...")
+                        placeholder_text="Enter text here...",
+                        on_change=lambda text: print("Changed:", text),
+                        debounce_ms=300,
+                        validator=lambda text: len(text) <= 10)
     entry.pack(padx=20, pady=20)
 
     def show_text():
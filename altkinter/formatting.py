@@ -0,0 +1,152 @@
+"""Conditional formatting rules and value formatters for CustomTableView.
+
+A rule classifies a whole column in one pass: ``classify(values)`` returns,
+for every value, 0 (no style) or a 1-based index into the rule's ``styles``,
+a list of ``(background, foreground)`` colour pairs (either may be None to
+keep the theme colour). The table interns those pairs into one palette and
+keeps a compact array of palette codes per column, so painting a cell is a
+single lookup.
+
+Rules whose result for a value does not depend on the rest of the column
+have ``local = True``; the table restyles just the changed cells for them.
+
+Formatters turn cell values into display strings; ``format_many(values)``
+formats a batch, e.g. the cells of a column in the visible window.
+"""
+import math
+import re
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_finite(value):
+    return _is_number(value) and math.isfinite(value)
+
+
+def _mix(start, end, t):
+    """Blend two '#rrggbb' colours."""
+    a, b = int(start.lstrip("#"), 16), int(end.lstrip("#"), 16)
+    return "#%02x%02x%02x" % tuple(round(((a >> s) & 255) * (1 - t) + ((b >> s) & 255) * t)
+                                   for s in (16, 8, 0))
+
+
+def _gradient(stops, t):
+    """Return the colour at ``t`` (0..1) along evenly spaced colour stops."""
+    t *= len(stops) - 1
+    i = min(int(t), len(stops) - 2)
+    return _mix(stops[i], stops[i + 1], t - i)
+
+
+class ValueRange:
+    """Style numeric values between ``low`` and ``high`` (inclusive; either bound may be None)."""
+
+    local = True
+
+    def __init__(self, low=None, high=None, background=None, foreground=None):
+        self.low = low
+        self.high = high
+        self.styles = [(background, foreground)]
+
+    def classify(self, values):
+        low = -math.inf if self.low is None else self.low
+        high = math.inf if self.high is None else self.high
+        return [1 if _is_number(v) and low <= v <= high else 0 for v in values]
+
+
+class ColorScale:
+    """
+    Shade numeric values along a gradient of '#rrggbb' colours (a heatmap).
+
+    The range defaults to the column's minimum and maximum. Give both ``low``
+    and ``high`` to fix it, which also lets single-cell updates and streamed
+    rows be restyled without a pass over the whole column.
+    """
+
+    def __init__(self, start, end, mid=None, low=None, high=None, steps=32, foreground=None):
+        stops = [start, mid, end] if mid else [start, end]
+        steps = max(2, steps)
+        self.styles = [(_gradient(stops, i / (steps - 1)), foreground) for i in range(steps)]
+        self.low = low
+        self.high = high
+
+    @property
+    def local(self):
+        return self.low is not None and self.high is not None
+
+    def classify(self, values):
+        low, high = self.low, self.high
+        if low is None or high is None:
+            numbers = [v for v in values if _is_finite(v)]
+            low = min(numbers, default=0) if low is None else low
+            high = max(numbers, default=0) if high is None else high
+        top = len(self.styles) - 1
+        scale = top / (high - low) if high > low else 0
+        return [int(min(max((v - low) * scale, 0), top) + 0.5) + 1 if _is_finite(v) else 0 for v in values]
+
+
+class RegexMatch:
+    """Style values whose text matches the regular expression ``pattern``."""
+
+    local = True
+
+    def __init__(self, pattern, background=None, foreground=None, flags=0):
+        self.pattern = re.compile(pattern, flags)
+        self.styles = [(background, foreground)]
+
+    def classify(self, values):
+        search = self.pattern.search
+        return [1 if search(str(v)) else 0 for v in values]
+
+
+class NumberFormat:
+    """
+    Format numbers with a fixed precision and optional thousands separators.
+
+    Values that are not numbers are shown with ``str``; None and NaN as ``na``.
+    """
+
+    def __init__(self, precision=2, thousands=False, prefix="", suffix="", na=""):
+        self.spec = f"{',' if thousands else ''}.{precision}f"
+        self.prefix = prefix
+        self.suffix = suffix
+        self.na = na
+
+    def __call__(self, value):
+        return self.format_many([value])[0]
+
+    def format_many(self, values):
+        spec, prefix, suffix, na = self.spec, self.prefix, self.suffix, self.na
+        return [(na if v != v else f"{prefix}{format(v, spec)}{suffix}") if _is_number(v)
+                else na if v is None else str(v) for v in values]
+
+
+class DateFormat:
+    """
+    Format dates, datetimes and pandas Timestamps with ``strftime``.
+
+    Other values are shown with ``str``; None, NaN and NaT as ``na``. Repeated
+    values in a batch are formatted once.
+    """
+
+    def __init__(self, fmt="%Y-%m-%d %H:%M", na=""):
+        self.fmt = fmt
+        self.na = na
+
+    def __call__(self, value):
+        return self.format_many([value])[0]
+
+    def format_many(self, values):
+        fmt, memo = self.fmt, {}
+        texts = []
+        for v in values:
+            text = memo.get(v)
+            if text is None:
+                if v is None or v != v:
+                    text = self.na
+                else:
+                    text = v.strftime(fmt) if hasattr(v, "strftime") else str(v)
+                memo[v] = text
+            texts.append(text)
+        return texts
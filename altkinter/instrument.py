@@ -0,0 +1,162 @@
+"""Opt-in counters and timers for the widget hot paths.
+
+Nothing is measured until ``enable()`` is called: it wraps the probed
+methods on their classes and ``disable()`` puts the originals back, so the
+disabled library runs exactly the code it always did. While enabled, every
+probed call is timed and every widget construction is counted by class.
+
+Results are read with ``snapshot()`` (a dict), written with ``save(path)``
+(JSON) or passed to a callback with ``export(callback)``. Application code
+can add its own measurements with ``count`` and ``timer``.
+
+Bindings and ``after`` callbacks hold the method they were given, so the ones
+created before ``enable()`` keep calling the unwrapped version.
+"""
+import importlib
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+# (module, class, method, probe name)
+PROBES = [
+    ("button", "CustomButton", "_create_rounded_button_image", "button.render"),
+    ("tableview", "CustomTableView", "_draw_row", "table.draw_row"),
+    ("tableview", "CustomTableView", "_draw_header", "table.draw_header"),
+    ("tableview", "CustomTableView", "_process_render_queue", "table.render_batch"),
+    ("scrollbar", "CustomScrollbar", "_draw_thumb", "scrollbar.draw_thumb"),
+    ("tooltip", "CanvasToolTip", "show_tip", "tooltip.show"),
+    ("tooltip", "ToolTip", "show_tip", "tooltip.show"),
+]
+
+# Widget classes whose construction is counted
+WIDGETS = [
+    ("button", "CustomButton"),
+    ("check_button", "CustomCheckButton"),
+    ("combobox", "CustomComboBox"),
+    ("entry", "CustomEntry"),
+    ("label", "CustomLabel"),
+    ("listbox", "CustomListBox"),
+    ("progressbar", "CustomProgressBar"),
+    ("scrollbar", "CustomScrollbar"),
+    ("tableview", "CustomTableView"),
+]
+
+enabled = False
+counters = Counter()
+# name -> [calls, total ns, max ns]
+timers = {}
+_originals = []
+
+
+def _record(name, elapsed):
+    stats = timers.get(name)
+    if stats is None:
+        timers[name] = [1, elapsed, elapsed]
+    else:
+        stats[0] += 1
+        stats[1] += elapsed
+        if elapsed > stats[2]:
+            stats[2] = elapsed
+
+
+def _timed(method, name):
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter_ns() - start)
+    return wrapper
+
+
+def _counted(init):
+    @wraps(init)
+    def wrapper(self, *args, **kwargs):
+        counters[f"created.{type(self).__name__}"] += 1
+        return init(self, *args, **kwargs)
+    return wrapper
+
+
+def _class(module, name):
+    return getattr(importlib.import_module(f"{__package__}.{module}"), name)
+
+
+def enable():
+    """Start measuring; calling it again while enabled does nothing."""
+    global enabled
+    if enabled:
+        return
+    for module, cls_name, method, name in PROBES:
+        cls = _class(module, cls_name)
+        _originals.append((cls, method, cls.__dict__[method]))
+        setattr(cls, method, _timed(cls.__dict__[method], name))
+    for module, cls_name in WIDGETS:
+        cls = _class(module, cls_name)
+        _originals.append((cls, "__init__", cls.__dict__["__init__"]))
+        cls.__init__ = _counted(cls.__dict__["__init__"])
+    enabled = True
+
+
+def disable():
+    """Stop measuring and restore the original methods; collected numbers are kept."""
+    global enabled
+    while _originals:
+        cls, method, original = _originals.pop()
+        setattr(cls, method, original)
+    enabled = False
+
+
+def reset():
+    counters.clear()
+    timers.clear()
+
+
+def count(name, n=1):
+    """Add ``n`` to the counter ``name`` while enabled."""
+    if enabled:
+        counters[name] += n
+
+
+@contextmanager
+def timer(name):
+    """Time the enclosed block under ``name`` while enabled."""
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter_ns() - start)
+
+
+def snapshot():
+    """
+    Return the measurements as a dict.
+
+    ``timers`` maps each probe to its call count and total, mean and maximum
+    time in milliseconds.
+    """
+    return {
+        "enabled": enabled,
+        "counters": dict(counters),
+        "timers": {name: {"calls": calls, "total_ms": total / 1e6,
+                          "mean_ms": total / calls / 1e6, "max_ms": worst / 1e6}
+                   for name, (calls, total, worst) in timers.items()},
+    }
+
+
+def save(path):
+    """Write ``snapshot()`` to ``path`` as JSON."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(snapshot(), file, indent=2)
+
+
+def export(callback, reset_after=False):
+    """Pass ``snapshot()`` to ``callback``, e.g. a telemetry client, optionally starting a new period."""
+    callback(snapshot())
+    if reset_after:
+        reset()
@@ -10,6 +10,8 @@ class CustomLabel(tk.Label):
         self.theme = theme or self.root.theme if hasattr(self.root, 'theme') else Theme("light")
 
         font = (self.theme.font[0], font_size, font_weight)
+        self.font_size = font_size
+        self.font_weight = font_weight
         
         super().__init__(master,
                          text=text,
@@ -19,6 +21,11 @@ class CustomLabel(tk.Label):
                          anchor=anchor,
                          wraplength=wraplength,
                          **kwargs)
+        self.theme.register(self)
+
+    def _apply_theme(self):
+        self.configure(bg=self.theme.background, fg=self.theme.text,
+                       font=(self.theme.font[0], self.font_size, self.font_weight))
         
 if __name__ == "__main__":
     root = Tk(theme_mode="dark")
@@ -37,6 +37,13 @@ class CustomListBox(tk.Frame):
 
         # Track the last hovered index
         self.last_hovered_index = None
+        self.theme.register(self)
+
+    def _apply_theme(self):
+        self.configure(bg=self.theme.widget_bg)
+        self.listbox.configure(bg=self.theme.widget_bg, fg=self.theme.text, font=self.theme.font)
+        if self.last_hovered_index is not None:
+            self.listbox.itemconfig(self.last_hovered_index, bg=self.theme.hover)
 
     def on_hover(self, event):
         """Change the background of the item under the cursor."""
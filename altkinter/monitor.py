@@ -0,0 +1,165 @@
+"""Event-loop latency monitor.
+
+``LagMonitor`` schedules a periodic ``after`` tick on a root window and
+measures how late each tick runs. The lateness (lag) is how long the event
+loop was busy with something else: rendering, callbacks, tooltips. Each lag
+is counted in a histogram of stall sizes, and the recent tick-to-tick frame
+times give the current and p99 frame time.
+
+With ``watchdog_ms`` set, a background thread notices when the main thread
+has not ticked for that long and captures its Python stack while it is still
+stuck, which shows what caused a freeze. ``show_overlay()`` puts a small live
+readout of the frame times in a corner of the window.
+"""
+import sys
+import threading
+import time
+import traceback
+import tkinter as tk
+from bisect import bisect_right
+from collections import deque
+
+# Upper bounds, in milliseconds, of the lag histogram buckets; the last bucket is open-ended
+BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LagMonitor:
+    """
+    Measure event-loop lag on ``root``.
+
+    :param root: The Tk root (or any widget) whose event loop is measured.
+    :param interval_ms: Tick period.
+    :param stall_ms: Lag from which a tick counts as a stall and ``on_stall`` is called.
+    :param watchdog_ms: If given, capture the main thread's stack once it has not
+        ticked for this long.
+    :param on_stall: Called on the main thread with ``(lag_ms, stack)`` after each stall;
+        ``stack`` is the watchdog's capture for it, or None.
+    :param history: Number of recent frame times kept for percentiles.
+    """
+
+    def __init__(self, root, interval_ms=50, stall_ms=100, watchdog_ms=None, on_stall=None, history=1000):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.watchdog_ms = watchdog_ms
+        self.on_stall = on_stall
+        self.histogram = [0] * (len(BUCKETS) + 1)
+        self.frames = deque(maxlen=history)
+        self.stalls = deque(maxlen=50)
+        self.ticks = 0
+        self.lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.overlay = None
+        self._after = None
+        self._overlay_after = None
+        self._last = None
+        self._captured = None
+        self._main = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._watchdog = None
+
+    def start(self):
+        if self._after is None:
+            self._last = time.perf_counter()
+            self._after = self.root.after(self.interval_ms, self._tick)
+        if self.watchdog_ms and self._watchdog is None:
+            # Each watchdog gets its own stop event, so one left over from a quick stop() and
+            # start() still exits instead of running alongside the new one
+            self._stop = threading.Event()
+            self._watchdog = threading.Thread(target=self._watch, args=(self._stop,),
+                                              name="altkinter-watchdog", daemon=True)
+            self._watchdog.start()
+        return self
+
+    def stop(self):
+        if self._after is not None:
+            self.root.after_cancel(self._after)
+            self._after = None
+        self._stop.set()
+        self._watchdog = None
+        self.hide_overlay()
+
+    def _tick(self):
+        now = time.perf_counter()
+        frame_ms = (now - self._last) * 1000
+        self._last = now
+        lag = max(0.0, frame_ms - self.interval_ms)
+        self.ticks += 1
+        self.lag_ms = lag
+        self.max_lag_ms = max(self.max_lag_ms, lag)
+        self.frames.append(frame_ms)
+        self.histogram[bisect_right(BUCKETS, lag)] += 1
+        stack, self._captured = self._captured, None
+        if lag >= self.stall_ms:
+            self.stalls.append({"time": time.time(), "lag_ms": lag, "stack": stack})
+            if self.on_stall:
+                self.on_stall(lag, stack)
+        self._after = self.root.after(self.interval_ms, self._tick)
+
+    def _watch(self, stop):
+        """Watchdog thread: capture the main thread's stack once per stall past ``watchdog_ms``."""
+        limit = self.watchdog_ms / 1000
+        captured_for = None
+        while not stop.wait(min(limit / 4, 0.05)):
+            last = self._last
+            if last is None or time.perf_counter() - last < limit or captured_for == last:
+                continue
+            frame = sys._current_frames().get(self._main)
+            if frame is not None:
+                self._captured = "".join(traceback.format_stack(frame))
+                captured_for = last
+
+    def percentile(self, q):
+        """Return the ``q`` percentile (0-100) of the recent frame times in milliseconds."""
+        if not self.frames:
+            return 0.0
+        frames = sorted(self.frames)
+        return frames[min(len(frames) - 1, int(len(frames) * q / 100))]
+
+    def stats(self):
+        """Return the measurements as a dict."""
+        labels = [f"<{bound}ms" for bound in BUCKETS] + [f">={BUCKETS[-1]}ms"]
+        return {
+            "ticks": self.ticks,
+            "lag_ms": self.lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+            "frame_ms": self.frames[-1] if self.frames else 0.0,
+            "p50_frame_ms": self.percentile(50),
+            "p99_frame_ms": self.percentile(99),
+            "histogram": dict(zip(labels, self.histogram)),
+            "stalls": len(self.stalls),
+        }
+
+    def reset(self):
+        self.histogram = [0] * (len(BUCKETS) + 1)
+        self.frames.clear()
+        self.stalls.clear()
+        self.ticks = 0
+        self.max_lag_ms = 0.0
+
+    def show_overlay(self, refresh_ms=500):
+        """Show the current and p99 frame times in the top-right corner of the window."""
+        if self.overlay is None:
+            top = self.root.winfo_toplevel()
+            theme = getattr(top, "theme", None)
+            self.overlay = tk.Label(top, font=("Consolas", 9), padx=4, pady=1,
+                                    bg=theme.widget_bg if theme else "#000000",
+                                    fg=theme.text if theme else "#ffffff")
+            self.overlay.place(relx=1.0, rely=0.0, anchor="ne")
+            self._refresh_overlay(refresh_ms)
+
+    def hide_overlay(self):
+        if self._overlay_after is not None:
+            self.root.after_cancel(self._overlay_after)
+            self._overlay_after = None
+        if self.overlay is not None:
+            self.overlay.destroy()
+            self.overlay = None
+
+    def _refresh_overlay(self, refresh_ms):
+        if self.overlay is None:
+            return
+        frame = self.frames[-1] if self.frames else 0.0
+        self.overlay.configure(text=f"frame {frame:.1f} ms  p99 {self.percentile(99):.1f} ms")
+        self.overlay.lift()
+        self._overlay_after = self.root.after(refresh_ms, self._refresh_overlay, refresh_ms)
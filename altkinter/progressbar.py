@@ -1,6 +1,7 @@
 import tkinter as tk
 from .altk import Tk
 from .theme import Theme
+from . import animation
 
 class CustomProgressBar(tk.Canvas):
     def __init__(self, master, width=200, height=10, progress=0.0,
@@ -21,6 +22,7 @@ class CustomProgressBar(tk.Canvas):
         self.height = height
         self.indet_pos = 0
         self.speed = min(10,max(1,speed))/1.5
+        self._animation = None
 
 
         # Background and border
@@ -39,6 +41,12 @@ class CustomProgressBar(tk.Canvas):
 
         if indeterminate:
             self._animate_indeterminate()
+        self.theme.register(self)
+
+    def _apply_theme(self):
+        self.configure(bg=self.master.cget("bg"))
+        self.itemconfig(self.border_rect, fill=self.theme.border)
+        self.itemconfig(self.progress_rect, fill=self.theme.accent)
 
     def _create_rounded_rect(self, x1, y1, x2, y2, radius, **kwargs):
         points = [
@@ -57,39 +65,65 @@ class CustomProgressBar(tk.Canvas):
         ]
         return self.create_polygon(points, smooth=True, splinesteps=36, **kwargs)
 
-    def set_progress(self, progress):
-        """Set the progress value (0 to 1)."""
+    def set_progress(self, progress, duration=0.0):
+        """Set the progress value (0 to 1), easing towards it over ``duration`` seconds if given."""
         self.indeterminate = False
+        self._stop_animation()
+        start = self._progress
         self._progress = max(0.0, min(1.0, progress))
+        if duration > 0:
+            self._animation = animation.tween(self, duration, self._draw_progress, start, self._progress,
+                                              easing=animation.ease_out, on_done=self._animation_done)
+        else:
+            self._draw_progress(self._progress)
+
+    def _draw_progress(self, progress):
         # Update the progress fill area
         self.coords(
             self.progress_rect,
-            2, 2, (self.width - 2) * self._progress, self.height - 2
+            2, 2, (self.width - 2) * progress, self.height - 2
         )
 
+    def _stop_animation(self):
+        if self._animation is not None:
+            animation.clock_for(self).remove(self._animation)
+            self._animation = None
+
+    def _animation_done(self):
+        self._animation = None
+
     def _animate_indeterminate(self):
-        """Animate the indeterminate progress bar."""
-        if self.indeterminate:
-            self.indet_pos = (self.indet_pos + self.bar_size // (self.bar_size/self.speed)) % (self.width + self.bar_size)
-            pos_start = self.indet_pos - self.bar_size
-            pos_end = self.indet_pos
-
-            self.coords(
-                self.progress_rect,
-                max(2, pos_start), 2,
-                min(pos_end, self.width - 2), self.height - 2
-            )
-            self.after(20, self._animate_indeterminate)
+        """Animate the indeterminate progress bar on the shared animation clock."""
+        if self.indeterminate and self._animation is None:
+            self._animation = animation.clock_for(self).add(self, self._step_indeterminate)
+
+    def _step_indeterminate(self, dt):
+        """Advance the indeterminate bar by ``dt`` seconds, at the speed of one step per 20 ms."""
+        if not self.indeterminate:
+            self._animation = None
+            return False
+        step = self.bar_size // (self.bar_size/self.speed) * dt / 0.02
+        self.indet_pos = (self.indet_pos + step) % (self.width + self.bar_size)
+        pos_start = self.indet_pos - self.bar_size
+        pos_end = self.indet_pos
+
+        self.coords(
+            self.progress_rect,
+            max(2, pos_start), 2,
+            min(pos_end, self.width - 2), self.height - 2
+        )
 
     def start_indeterminate(self):
         """Start the indeterminate animation."""
         if not self.indeterminate:
+            self._stop_animation()
             self.indeterminate = True
             self._animate_indeterminate()
 
     def stop_indeterminate(self):
         """Stop the indeterminate animation."""
         self.indeterminate = False
+        self._stop_animation()
         self.coords(
             self.progress_rect,
             2, 2, 2, self.height - 2  # Reset progress
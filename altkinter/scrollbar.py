@@ -21,6 +21,11 @@ class CustomScrollbar(tk.Canvas):
         self.bind("<Configure>", self._draw_thumb)
         self.bind("<Button-1>", self._click_thumb)
         self.bind("<B1-Motion>", self._drag_thumb)
+        self.theme.register(self)
+
+    def _apply_theme(self):
+        self.configure(bg=self.theme.widget_bg)
+        self.itemconfig("thumb", fill=self.theme.focus)
 
     def set(self, lo, hi):
         """External call from widget to update thumb size/pos"""
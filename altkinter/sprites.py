@@ -0,0 +1,77 @@
+"""Shared cache of the Cairo-rendered images used by the widgets.
+
+A sprite is described by a spec ``(render, *args)``: ``render(*args)`` draws
+it with Cairo and returns a decoded PIL image, touching no Tk state, so it
+can run on a worker thread. The PhotoImage built from it (on the main thread,
+as Tk requires) is cached by spec and shared by every widget drawing the same
+sprite, so repeated states and identical widgets render once.
+
+Widgets pass their theme's Palette in the spec rather than loose colours:
+it is hashable, so each palette and state renders once, and its colours come
+already converted to the RGB floats Cairo draws with.
+"""
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from PIL import Image, ImageTk
+
+cache_size = 4096
+_images = OrderedDict()
+_executor = None
+
+
+def surface_image(surface):
+    """Return a Cairo surface as a decoded PIL image."""
+    buffer = BytesIO()
+    surface.write_to_png(buffer)
+    buffer.seek(0)
+    image = Image.open(buffer)
+    image.load()
+    return image
+
+
+def photo(render, *args):
+    """Return the cached PhotoImage for ``render(*args)``, rendering it now on a miss."""
+    spec = (render,) + args
+    image = _images.get(spec)
+    if image is None:
+        return _store(spec, render(*args))
+    _images.move_to_end(spec)
+    return image
+
+
+def _store(spec, image):
+    photo_image = _images[spec] = ImageTk.PhotoImage(image)
+    while len(_images) > cache_size:
+        _images.popitem(last=False)
+    return photo_image
+
+
+def _render(spec):
+    return spec[0](*spec[1:])
+
+
+def prerender(specs):
+    """
+    Make sure every spec in ``specs`` is cached.
+
+    Missing sprites are drawn on worker threads; only the PhotoImages are
+    created here, on the calling (main) thread.
+    """
+    global _executor
+    missing = [spec for spec in dict.fromkeys(specs) if spec not in _images]
+    if len(missing) > 1:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                           thread_name_prefix="altkinter-sprites")
+        images = _executor.map(_render, missing)
+    else:
+        images = map(_render, missing)
+    for spec, image in zip(missing, images):
+        _store(spec, image)
+
+
+def clear():
+    """Drop every cached sprite."""
+    _images.clear()
@@ -0,0 +1,263 @@
+"""Column-wise storage for CustomTableView data.
+
+``ColumnStore`` holds table rows of the form ``[row number] + values`` but
+keeps each column in compact typed storage: ``array('q')`` for integers,
+``array('d')`` for floats, and for strings that repeat, an array of codes
+into a table of distinct strings. Row numbers are computed from the row
+position instead of being stored. Rows are read and written through
+lightweight views, so code indexing ``data[row][col]`` keeps working.
+"""
+import sys
+from array import array
+
+
+def _object_size(values):
+    """Return the size of the distinct objects in ``values``, counting shared objects once."""
+    return sum(map(sys.getsizeof, {id(value): value for value in values}.values()))
+
+
+class _Column:
+    """One column: a typed array, dictionary-encoded strings, or a plain list."""
+
+    __slots__ = ("values", "strings", "codes")
+
+    def __init__(self):
+        self.values = None
+        self.strings = None
+        self.codes = None
+
+    def _choose(self, values):
+        """Pick the most compact storage able to hold ``values``."""
+        if values and all(type(v) is int for v in values):
+            try:
+                self.values = array("q", values)
+                return
+            except OverflowError:
+                pass
+        elif values and all(type(v) is float for v in values):
+            self.values = array("d", values)
+            return
+        elif values and all(type(v) is str for v in values) and len(set(values)) <= max(1, len(values) // 2):
+            self.strings = []
+            self.codes = {}
+            self.values = array("H")
+            self._extend_codes(values)
+            return
+        self.values = list(values)
+
+    def _code(self, text):
+        code = self.codes.get(text)
+        if code is None:
+            code = self.codes[text] = len(self.strings)
+            self.strings.append(text)
+        return code
+
+    def _widen(self):
+        """Switch the codes to 32 bits once the string table outgrows 16-bit codes."""
+        if len(self.strings) > 0x10000 and self.values.typecode == "H":
+            self.values = array("I", self.values)
+
+    def _extend_codes(self, values):
+        # Encode first: new strings may need wider codes than the array being extended holds
+        codes = list(map(self._code, values))
+        self._widen()
+        self.values.extend(codes)
+
+    def _to_list(self):
+        self.values = self.decode()
+        self.strings = self.codes = None
+
+    def get(self, row):
+        if self.strings is not None:
+            return self.strings[self.values[row]]
+        return self.values[row]
+
+    def set(self, row, value):
+        if self.strings is not None:
+            if type(value) is str:
+                code = self._code(value)
+                self._widen()
+                self.values[row] = code
+                return
+            self._to_list()
+        elif isinstance(self.values, array):
+            try:
+                if type(value) is (int if self.values.typecode == "q" else float):
+                    self.values[row] = value
+                    return
+            except OverflowError:
+                pass
+            self._to_list()
+        self.values[row] = value
+
+    def extend(self, values):
+        if self.values is None or not len(self.values):
+            self._choose(values)
+        elif self.strings is not None and all(type(v) is str for v in values):
+            self._extend_codes(values)
+        elif isinstance(self.values, array) and self.strings is None:
+            kind = int if self.values.typecode == "q" else float
+            try:
+                if all(type(v) is kind for v in values):
+                    self.values += array(self.values.typecode, values)
+                    return
+            except OverflowError:
+                pass
+            self._to_list()
+            self.values.extend(values)
+        else:
+            if self.strings is not None:
+                self._to_list()
+            self.values.extend(values)
+
+    def delete_front(self, count):
+        del self.values[:count]
+        if self.strings is not None and len(self.strings) > 2 * len(self.values) + 1024:
+            # Evicted rows leave their strings behind; rebuild the table from the live rows so a
+            # ring buffer stays bounded, falling back to a plain list if they are mostly distinct
+            live = self.decode()
+            self.values = self.strings = self.codes = None
+            self._choose(live)
+
+    def decode(self, transform=None):
+        """Return the column as a list, applying ``transform`` once per distinct string when encoded."""
+        if self.values is None:
+            return []
+        if self.strings is not None:
+            table = self.strings if transform is None else [transform(s) for s in self.strings]
+            return list(map(table.__getitem__, self.values))
+        return list(self.values) if transform is None else list(map(transform, self.values))
+
+    def take(self, rows):
+        column = _Column()
+        if self.values is not None:
+            values = list(map(self.values.__getitem__, rows))
+            column.values = array(self.values.typecode, values) if isinstance(self.values, array) else values
+            column.strings = self.strings
+            column.codes = self.codes
+        return column
+
+    def nbytes(self):
+        if self.values is None:
+            return 0
+        if isinstance(self.values, array):
+            size = sys.getsizeof(self.values)
+            if self.strings is not None:
+                size += sys.getsizeof(self.strings) + sys.getsizeof(self.codes) + _object_size(self.strings)
+            return size
+        return sys.getsizeof(self.values) + _object_size(self.values)
+
+
+class _Row:
+    """A view of one stored row, indexable like ``[row number] + values``."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return [self._store.get(self._row, c) for c in range(*col.indices(self._store.width))]
+        return self._store.get(self._row, col)
+
+    def __setitem__(self, col, value):
+        self._store.set(self._row, col, value)
+
+    def __len__(self):
+        return self._store.width
+
+    def __iter__(self):
+        return (self._store.get(self._row, col) for col in range(self._store.width))
+
+
+class ColumnStore:
+    """
+    Compact column-wise table data.
+
+    :param width: Number of columns including the row-number column.
+    :param rows: Initial data rows, without row numbers.
+    :param maxlen: If given, appending beyond ``maxlen`` rows evicts the oldest ones, like a deque.
+    """
+
+    def __init__(self, width, rows=(), maxlen=None):
+        self.width = width
+        self.maxlen = maxlen
+        self.first = 1
+        self.columns = [_Column() for _ in range(width - 1)]
+        self._length = 0
+        self._extend(list(rows), 0)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self._length
+        if not 0 <= row < self._length:
+            raise IndexError("row index out of range")
+        return _Row(self, row)
+
+    def __iter__(self):
+        return (_Row(self, row) for row in range(self._length))
+
+    def get(self, row, col):
+        if col == 0:
+            return self.first + row
+        return self.columns[col - 1].get(row)
+
+    def set(self, row, col, value):
+        if col > 0:
+            self.columns[col - 1].set(row, value)
+
+    def append(self, record):
+        self.extend([record])
+
+    def extend(self, records):
+        """
+        Append rows of the form ``[row number] + values``, evicting the oldest beyond ``maxlen``.
+
+        Row numbers are not stored: the rows are numbered consecutively up to the
+        number of the last record, which also covers rows dropped before storage.
+        """
+        records = list(records)
+        self._extend(records, 1)
+        if records:
+            self.first = records[-1][0] - self._length + 1
+
+    def _extend(self, rows, offset):
+        if not rows:
+            return
+        for k, column in enumerate(self.columns, offset):
+            column.extend([row[k] for row in rows])
+        self._length += len(rows)
+        self.trim()
+
+    def trim(self):
+        """Evict the oldest rows beyond ``maxlen``; return the number evicted."""
+        evicted = self._length - self.maxlen if self.maxlen is not None else 0
+        if evicted > 0:
+            for column in self.columns:
+                column.delete_front(evicted)
+            self.first += evicted
+            self._length -= evicted
+        return max(evicted, 0)
+
+    def column(self, col, transform=None):
+        """Return the values of ``col`` as a list, optionally transformed (once per distinct string)."""
+        if col == 0:
+            values = range(self.first, self.first + self._length)
+            return list(values) if transform is None else list(map(transform, values))
+        return self.columns[col - 1].decode(transform)
+
+    def take(self, rows):
+        """Return a new store holding ``rows`` in order, numbered from 1."""
+        store = ColumnStore(self.width, maxlen=self.maxlen)
+        store.columns = [column.take(rows) for column in self.columns]
+        store._length = len(rows)
+        return store
+
+    def memory_usage(self):
+        """Return the bytes held by each column; the computed row-number column holds none."""
+        return [0] + [column.nbytes() for column in self.columns]
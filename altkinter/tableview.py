@@ -1,32 +1,69 @@
 import tkinter as tk
+import tkinter.font as tkfont
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import heapify, heappop, heappush
+from itertools import accumulate, compress, count, islice
 from .scrollbar import CustomScrollbar
 from .theme import Theme
-import threading
 import queue
-from .progressbar import CustomProgressBar
+import threading
+import csv
+import io
+import math
+import sys
+from collections import Counter, OrderedDict, deque
 from .progress_window import *
 from .tooltip import ToolTip
+from .entry import CustomEntry
+from .formatting import _is_finite
+from .storage import ColumnStore, _object_size
+
+ELLIPSIS = "\u2026"
+AGGREGATES = ("sum", "mean", "min", "max", "count", "var", "std")
 
 class CustomTableView(tk.Frame):
-    """A custom table view widget for displaying tabular data with support for themes and dataframes."""
+    """A custom table view widget for displaying tabular data with support for themes and dataframes.
+
+    Cells are drawn as canvas items and only the rows inside the visible window
+    are rendered. The rows shown are taken from ``self.view``, a list of data
+    row indices produced by the active filters and quick-search. When rows are
+    grouped, a negative entry ``~g`` in the view stands for the summary row of
+    group ``g``.
+
+    The header row and the row-number column live on their own canvases
+    (``header_canvas`` and ``index_canvas``) which follow the body canvas
+    horizontally and vertically, so they stay in place while scrolling.
+    """
 
     def __init__(self, master, columns=None, data=None, row_height=10,
                  column_width=100, truncate = None, tooltip = 'on',
                  autofit_columns=False, autofit_rows = False,
                  theme=None, dataframe=None, text_alignment='left',
-                 *args, **kwargs):
+                 flash_ms=400, max_rows=None, frame_ms=16, editable=False, compact=False, *args, **kwargs):
         """
         Initialize the table view with columns, data, styling, and optional dataframe.
 
         :param master: The parent widget.
         :param columns: A list of column names.
         :param data: A list of data rows.
-        :param row_height: The height of each row in pixels.
+        :param row_height: The height of each row (10 per line of text).
         :param column_width: The width of each column in pixels.
-        :param autofit: Boolean to enable column width auto-fitting based on content.
+        :param truncate: Maximum number of characters shown per cell; text wider than its column
+                         is also cut to the column width and ends with an ellipsis.
+        :param tooltip: 'on' to show the full cell value on hover.
+        :param autofit_columns: Boolean to enable column width auto-fitting based on content.
+        :param autofit_rows: Boolean to size rows to the tallest multi-line cell.
         :param theme: The theme style to apply.
         :param dataframe: Optional pandas DataFrame to populate the table with.
-        :param text_alignment: Text alignment for table cells ('w', 'e', 'center').
+        :param text_alignment: Text alignment for table cells ('left'/'w', 'right'/'e', 'center').
+        :param flash_ms: How long changed cells stay highlighted when updated with ``flash=True``.
+        :param max_rows: If given, start in streaming mode with a ring buffer of this many rows.
+        :param frame_ms: Interval at which streamed rows are appended and repainted.
+        :param editable: Allow editing cells in place (double-click, Return or F2). Text that does
+            not parse as the number it replaces is rejected and keeps the editor open in its error state.
+        :param compact: Keep list-of-lists data in a column-wise :class:`ColumnStore` (typed arrays and
+                        dictionary-encoded strings) instead of a list of row lists.
 
         Accepts all tk.Frame arguments: background, bd, bg, borderwidth, class,
         colormap, container, cursor, height, highlightbackground,
@@ -52,6 +89,111 @@ class CustomTableView(tk.Frame):
         self.master = master
         self.tooltip = tooltip
         self.progress_window = None
+        self.export_error = None
+        self.compact = compact
+
+        # Filtering and quick-search state
+        self.filters = {}
+        self.search_text = ""
+        self.search_columns = None
+        self.search_rows = None
+        self.match_pos = None
+        self._match_row = None
+        self._base_view = None
+        self._column_cache = {}
+        self._lower_cache = {}
+        self._search_after = None
+
+        # Display strings: per-column formatters and an LRU cache of formatted cells keyed by (row, col)
+        self.formatters = {}
+        self.text_cache_size = 50000
+        self._text_cache = OrderedDict()
+
+        # Conditional formatting: rules per column, a shared palette and one array of palette codes per column
+        self.format_rules = {}
+        self._palette = [(None, None)]
+        self._palette_codes = {}
+        self._style_codes = {}
+
+        # Grouping: a hash index of row arrays per key; collapsed groups are single summary rows
+        self.group_column = None
+        self.group_aggregate = "sum"
+        self._group_index = None
+        self._group_keys = []
+        self._group_view = None
+        self._group_cache = {}
+        self._expanded = set()
+
+        # Aggregate footer: running statistics per column over all rows, built on first use
+        self.footer_aggregates = ()
+        self._stats = {}
+        self._footer_after = None
+
+        # Keyed updates
+        self.flash_ms = flash_ms
+        self._key_col = None
+        self._key_rows = None
+        self._flashing = set()
+        self._flash_after = None
+        self._row_numbers = dataframe is None
+
+        # In-place editing: one overlay editor, a sparse map of original values and undo/redo stacks
+        self.editable = editable
+        self.editor = None
+        self._editor_window = None
+        self._editing = None
+        self._dirty = {}
+        self._undo = []
+        self._redo = []
+
+        # ScrollGroup this table belongs to, if any
+        self._scroll_group = None
+
+        # Streaming mode
+        self.streaming = False
+        self.follow_tail = True
+        self.frame_ms = frame_ms
+        self._pending_rows = deque()
+        self._stream_after = None
+
+        # Rendering state
+        self.font = tkfont.Font(root=self, font=self.theme.font)
+        self._font_spec = self.theme.font
+        self.cell_padx = 5
+        self.cell_pady = 5
+        self.cell_gap = 1
+        self.col_widths = []
+        self.col_offsets = [0]
+        self._col_px = []
+        self._glyph_widths = {}
+        self._fit_cache = {}
+        self.fit_cache_size = 20000
+        self._metrics = self.font.metrics()
+        self._ellipsis_px = self.font.measure(ELLIPSIS)
+        self._header_items = {}
+        self.min_column_width = 20
+        self.resize_margin = 4
+        self._user_widths = {}
+        self._resize_col = None
+        self._lines = 1
+        self.header_px = 0
+        self.row_stride = 1
+        self._cell_items = {}
+        self._drawn_rows = {}
+        self._window = (0, 0)
+        self._hover_cell = None
+        self._tip_cell = None
+
+        # Keyboard cursor, as (view position, column); the anchor starts Shift-extension
+        self.cursor = None
+        self._cursor_cell = None
+        self._cursor_target = None
+        self._cursor_extend = False
+        self._cursor_pending = False
+        self._anchor = None
+        self._extent = None
+        self._render_after = None
+        self._render_pending = False
 
         if dataframe is not None:
             pass
@@ -59,31 +201,61 @@ class CustomTableView(tk.Frame):
             self.data = dataframe.reset_index().values.tolist()
         else:
             self.columns = [""] + self.columns
-            self.data = [[i + 1] + row for i, row in enumerate(self.data)]
+            self.data = self._load_rows(self.data)
+        self.view = range(len(self.data))
+
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        # Frozen panes: corner, header row and row-number column around the body
+        self.corner = tk.Canvas(self, bg=self.theme.background, highlightthickness=0, width=1, height=1)
+        self.corner.grid(row=0, column=0, sticky="nsew")
+        self.header_canvas = tk.Canvas(self, bg=self.theme.background, highlightthickness=0, height=1)
+        self.header_canvas.grid(row=0, column=1, sticky="ew")
+        self.header_canvas.bind("<B1-Motion>", self._drag_resize)
+        self.header_canvas.bind("<ButtonRelease-1>", self._end_resize)
+        self.index_canvas = tk.Canvas(self, bg=self.theme.background, highlightthickness=0, width=1)
+        self.index_canvas.grid(row=1, column=0, sticky="ns")
 
-        self.grid_rowconfigure(0, weight=1)
-        self.grid_columnconfigure(0, weight=1)
-        
         self.canvas = tk.Canvas(self, bg=self.theme.background, highlightthickness=0)
-        self.canvas.grid(row=0, column=0, sticky="nsew")
-        
+        self.canvas.grid(row=1, column=1, sticky="nsew")
+
         self.scrollbar_v = CustomScrollbar(self, command=self.canvas.yview, theme=self.theme)
-        self.scrollbar_v.grid(row=0, column=1, sticky="ns")
-        self.canvas.configure(yscrollcommand=self.scrollbar_v.set)
-        
+        self.scrollbar_v.grid(row=1, column=2, sticky="ns")
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+
         self.scrollvar_h = CustomScrollbar(self, orient="horizontal", command=self.canvas.xview, theme=self.theme)
-        self.scrollvar_h.grid(row=1, column=0, sticky="ew")
-        self.canvas.configure(xscrollcommand=self.scrollvar_h.set)
+        self.scrollvar_h.grid(row=3, column=1, sticky="ew")
+
+        # Aggregate footer, shown by show_footer(); it follows the body horizontally like the header
+        self.footer_corner = tk.Canvas(self, bg=self.theme.background, highlightthickness=0, width=1, height=1)
+        self.footer_canvas = tk.Canvas(self, bg=self.theme.background, highlightthickness=0, height=1)
+        self.canvas.configure(xscrollcommand=self._on_xscroll)
 
-        self.table_frame = tk.Frame(self.canvas, bg=self.theme.background)
-        self.table_window = self.canvas.create_window((0, 0), window=self.table_frame, anchor="nw")
+        # One tooltip for the whole table; its text follows the hovered cell
+        self.tip = ToolTip(self.canvas, text="", wraplength=300) if self.tooltip == 'on' else None
 
-        # Bind mouse wheel only when mouse is over the canvas
-        self.canvas.bind("<Enter>", self._bind_mousewheel)
-        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+        # Bind mouse wheel only when mouse is over the table
+        for pane in (self.canvas, self.header_canvas, self.index_canvas, self.corner):
+            pane.bind("<Enter>", self._bind_mousewheel)
+            pane.bind("<Leave>", self._on_canvas_leave)
+            pane.bind("<Motion>", self._on_motion)
+            pane.bind("<Button-1>", self._on_click)
+            pane.bind("<Control-c>", self.copy_selection)
+            for key in ("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End", "space"):
+                pane.bind(f"<{key}>", self._on_key)
+            pane.bind("<Control-z>", lambda e: self.undo() or "break")
+            pane.bind("<Control-y>", lambda e: self.redo() or "break")
+        self.canvas.bind("<Double-Button-1>", self._on_double_click)
+        for key in ("<Return>", "<F2>"):
+            self.canvas.bind(key, lambda e: self._edit_cursor_cell())
+        self.canvas.bind("<Configure>", lambda e: self._schedule_render())
 
-        self.after_idle(self.after(50, self.build_table))
+        self.after_idle(self.build_table)
         self.master.bind("<Configure>", self.on_master_move)
+        if max_rows is not None:
+            self.start_streaming(max_rows, frame_ms)
+        self.theme.register(self)
 
     def _bind_mousewheel(self, event=None):
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
@@ -91,110 +263,528 @@ class CustomTableView(tk.Frame):
     def _unbind_mousewheel(self, event=None):
         self.canvas.unbind_all("<MouseWheel>")
 
+    def _on_canvas_leave(self, event=None):
+        self._unbind_mousewheel()
+        self._set_hover(None)
+        self._hide_tip()
+
     def build_table(self):
-        """Start rendering the table in a separate thread."""
-        thread =  threading.Thread(target=self._build_table_data, daemon=True)
-        thread.start()
-        threading.Thread(target=self._process_render_queue, daemon=True).start()
-        
-    def _build_table_data(self):
-        """Build the table headers and rows in a separate thread."""
+        """Lay out the table and render the visible rows."""
+        self._draw_table()
+
+    def _cell_value(self, row, col):
+        """Return the raw value stored at data row ``row`` and column ``col``; negative rows are group rows."""
+        if row < 0:
+            return self._group_value(~row, col)
+        return self.data[row][col]
+
+    def _cell_text(self, row, col):
+        """Return the display string of a cell, honouring ``truncate``."""
+        text = self._format_cell(row, col)
+        return text[:self.truncate] if self.truncate is not None else text
+
+    def _format_cell(self, row, col):
+        """Return the formatted value of a cell from the text cache, formatting it on a miss."""
+        if row < 0:
+            return str(self._cell_value(row, col))
+        key = (row, col)
+        cache = self._text_cache
+        text = cache.get(key)
+        if text is None:
+            value = self._cell_value(row, col)
+            formatter = self.formatters.get(col)
+            text = cache[key] = formatter(value) if formatter is not None else str(value)
+            if len(cache) > self.text_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return text
+
+    def _format_window(self, first, last):
+        """Format the uncached cells of view positions [first, last) with one batch call per column."""
+        rows = [row for row in self.view[first:last] if row >= 0]
+        cache = self._text_cache
+        for col in range(len(self.columns)):
+            missing = [row for row in rows if (row, col) not in cache]
+            if not missing:
+                continue
+            values = [self._cell_value(row, col) for row in missing]
+            formatter = self.formatters.get(col)
+            texts = formatter.format_many(values) if formatter is not None else list(map(str, values))
+            cache.update(zip([(row, col) for row in missing], texts))
+        while len(cache) > self.text_cache_size:
+            cache.popitem(last=False)
+
+    def set_formatter(self, column, formatter):
+        """
+        Format the values of ``column`` for display.
+
+        :param column: A column name or 0-based column number.
+        :param formatter: An object with ``__call__(value)`` and ``format_many(values)`` returning strings,
+                          such as :class:`NumberFormat` or :class:`DateFormat`; None restores ``str``.
+        """
+        col = self._column_index(column)
+        if formatter is None:
+            self.formatters.pop(col, None)
+        else:
+            self.formatters[col] = formatter
+        for key in [key for key in self._text_cache if key[1] == col]:
+            del self._text_cache[key]
+        for texts in self._group_cache.values():
+            texts.pop(col, None)
+        if not self.col_widths:
+            return
+        if self.autofit_columns:
+            # The new texts may need a different column width
+            self._draw_table()
+            return
+        for row, c in list(self._cell_items):
+            if c == col:
+                self._paint_text(row, col)
+        self._schedule_footer()
+
+    def _column_values(self, col):
+        """Return (and cache) the values of a column as a list."""
+        values = self._column_cache.get(col)
+        if values is None:
+            values = self.data.column(col) if isinstance(self.data, ColumnStore) else [row[col] for row in self.data]
+            self._column_cache[col] = values
+        return values
+
+    def _lower_column(self, col):
+        """Return (and cache) the lowercase string view of a column for substring search."""
+        values = self._lower_cache.get(col)
+        if values is None and isinstance(self.data, ColumnStore):
+            values = self._lower_cache[col] = self.data.column(col, lambda x: str(x).lower())
+        elif values is None:
+            values = [str(x).lower() for x in self._column_values(col)]
+            self._lower_cache[col] = values
+        return values
+
+    def _row_values(self, row):
+        """Return the values of a data row without the row-number column."""
+        return self.data[row][1:]
+
+    def _column_texts(self, col):
+        """Return the display strings of a column, honouring ``truncate``."""
+        formatter = self.formatters.get(col)
+        values = self._column_values(col)
+        texts = formatter.format_many(values) if formatter is not None else map(str, values)
+        return [text[:self.truncate] for text in texts] if self.truncate is not None else list(texts)
+
+    def _column_styles(self, col):
+        """Return (and cache) the palette codes of a column, or None if it has no format rules."""
+        rules = self.format_rules.get(col)
+        if not rules:
+            return None
+        codes = self._style_codes.get(col)
+        if codes is None:
+            codes = self._style_codes[col] = array("H", self._evaluate_rules(rules, self._column_values(col)))
+        return codes
+
+    def _evaluate_rules(self, rules, values):
+        """Classify ``values`` with each rule in turn; a later matching rule overrides an earlier one."""
+        codes = [0] * len(values)
+        for rule in rules:
+            lookup = [0] + [self._palette_code(style) for style in rule.styles]
+            codes = [lookup[new] if new else old for old, new in zip(codes, rule.classify(values))]
+        return codes
+
+    def _palette_code(self, style):
+        code = self._palette_codes.get(style)
+        if code is None:
+            code = self._palette_codes[style] = len(self._palette)
+            self._palette.append(style)
+        return code
+
+    def _restyle(self, col, values, row=None):
+        """
+        Update the cached codes of ``col`` for changed or appended values.
+
+        With local rules only the given values are classified: ``row`` is the
+        changed row, or None to append. Otherwise the column's codes are
+        dropped and rebuilt on the next paint.
+        """
+        codes = self._style_codes.get(col)
+        if codes is None:
+            return
+        rules = self.format_rules[col]
+        if not all(rule.local for rule in rules):
+            del self._style_codes[col]
+        elif row is None:
+            codes.extend(self._evaluate_rules(rules, values))
+        else:
+            codes[row] = self._evaluate_rules(rules, values)[0]
+
+    def _cell_style(self, row, col):
+        """Return the ``(background, foreground)`` pair set by conditional formatting."""
+        codes = self._column_styles(col)
+        return self._palette[codes[row]] if codes is not None and row >= 0 else self._palette[0]
+
+    def _cell_fg(self, row, col):
+        return self._cell_style(row, col)[1] or self.theme.text
+
+    def _invalidate_caches(self):
+        self._column_cache.clear()
+        self._lower_cache.clear()
+        self._style_codes.clear()
+        self._text_cache.clear()
+        self._key_rows = None
+        self._invalidate_groups()
+
+    def _layout(self):
+        """Compute column widths and offsets, and the header and row heights in pixels."""
+        linespace = self._metrics["linespace"]
+        gap = self.cell_gap
+
+        self.col_widths = []
+        for col_index, col_name in enumerate(self.columns):
+            if col_index == 0 or self.autofit_columns:
+                texts = [str(col_name)[:self.truncate] if self.truncate is not None else str(col_name)]
+                texts += self._column_texts(col_index)
+                width = max(map(self._text_width, {line for text in set(texts) for line in text.split('\n')}))
+            else:
+                width = self.column_width
+            width = self._user_widths.get(col_index, width + 2 * self.cell_padx)
+            self.col_widths.append(width)
+
+        self.col_offsets = [0]
+        for width in self.col_widths:
+            self.col_offsets.append(self.col_offsets[-1] + width + gap)
+        self._col_px = [max(1, w - 2 * self.cell_padx) for w in self.col_widths]
+
+        if self.autofit_rows and self.data:
+            self._lines = max((text.count('\n') + 1
+                               for c in range(1, len(self.columns)) for text in self._column_texts(c)), default=1)
+        else:
+            self._lines = max(1, self.row_height // 10)
+
+        self.header_px = linespace + 2 * self.cell_pady
+        self.row_stride = self._lines * linespace + 2 * self.cell_pady + gap
+        self.canvas.configure(yscrollincrement=self.row_stride)
+        self.index_canvas.configure(yscrollincrement=self.row_stride, width=self.col_widths[0] + gap)
+        self.header_canvas.configure(height=self.header_px + gap)
+        self.corner.configure(width=self.col_widths[0] + gap, height=self.header_px + gap)
+
+    def _fit(self, text, col):
+        """Clip a display string to the lines that fit in a cell and each line to the column width."""
+        avail = self._col_px[col] if col < len(self._col_px) else None
+        if '\n' not in text:
+            return text if avail is None else self._fit_line(text, avail)
+        lines = text.split('\n')[:self._lines]
+        return '\n'.join(lines if avail is None else [self._fit_line(line, avail) for line in lines])
+
+    def _text_width(self, line):
+        """Return the pixel width of a line, summing cached glyph widths."""
+        widths = self._glyph_widths
+        try:
+            return sum(map(widths.__getitem__, line))
+        except KeyError:
+            for glyph in set(line).difference(widths):
+                widths[glyph] = self.font.measure(glyph)
+            return sum(map(widths.__getitem__, line))
+
+    def _fit_line(self, line, avail):
+        """
+        Truncate a line to ``avail`` pixels, ending it with an ellipsis.
+
+        The cut is found by binary search over the prefix sums of the glyph
+        widths; results are cached per (line, width).
+        """
+        key = (line, avail)
+        fitted = self._fit_cache.get(key)
+        if fitted is None:
+            if self._text_width(line) <= avail:
+                fitted = line
+            else:
+                prefix = list(accumulate(map(self._glyph_widths.__getitem__, line)))
+                fitted = line[:bisect_right(prefix, avail - self._ellipsis_px)] + ELLIPSIS
+            if len(self._fit_cache) >= self.fit_cache_size:
+                self._fit_cache.clear()
+            self._fit_cache[key] = fitted
+        return fitted
+
+    def _draw_table(self):
+        """Lay the table out again and repaint the header and the visible window of the view."""
+        self._layout()
+        for pane in (self.canvas, self.header_canvas, self.index_canvas, self.corner):
+            pane.delete("all")
+        self._cell_items.clear()
+        self._header_items.clear()
+        self._drawn_rows.clear()
+        self._clear_render_queue()
         for col_index, col_name in enumerate(self.columns):
-            self.render_queue.put(("header", col_index, col_name))
+            self._draw_header(col_index, col_name)
+        self._update_scrollregion()
+        self._render_visible()
+        self._schedule_footer()
+
+    def _redraw_rows(self, scroll_top=True):
+        """Drop every drawn row and repaint the visible window, e.g. after the view changes."""
+        self.canvas.delete("row")
+        self.index_canvas.delete("row")
+        self._cell_items.clear()
+        self._drawn_rows.clear()
+        self._clear_render_queue()
+        self._update_scrollregion()
+        if scroll_top:
+            self.canvas.yview_moveto(0)
+        self._render_visible()
+
+    def _update_scrollregion(self):
+        """Give the body and the frozen panes matching scroll regions so their views stay aligned."""
+        left, right = self.col_offsets[1], self.col_offsets[-1]
+        height = len(self.view) * self.row_stride
+        self.canvas.configure(scrollregion=(left, 0, right, height))
+        self.header_canvas.configure(scrollregion=(left, 0, right, self.header_px))
+        self.index_canvas.configure(scrollregion=(0, 0, left, height))
+
+    def _clear_render_queue(self):
+        while not self.render_queue.empty():
+            try:
+                self.render_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _visible_range(self):
+        """Return the [first, last) view positions that intersect the viewport."""
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), 1)
+        first = max(0, int(top // self.row_stride))
+        last = min(len(self.view), int(bottom // self.row_stride) + 1)
+        return first, max(first, last)
+
+    def _on_yscroll(self, lo, hi):
+        """Follow a vertical body scroll with the index column only."""
+        self.scrollbar_v.set(lo, hi)
+        self.index_canvas.yview_moveto(lo)
+        self._schedule_render()
+        if self._scroll_group is not None:
+            self._scroll_group._moved(self, top=float(lo) * len(self.view))
+
+    def _on_xscroll(self, lo, hi):
+        """Follow a horizontal body scroll with the header row only."""
+        self.scrollvar_h.set(lo, hi)
+        self.header_canvas.xview_moveto(lo)
+        self.footer_canvas.xview_moveto(lo)
+        if self._scroll_group is not None and len(self.col_offsets) > 1:
+            self._scroll_group._moved(self, left=float(lo) * (self.col_offsets[-1] - self.col_offsets[1]))
+
+    def _scroll_to(self, top, left=None):
+        """
+        Scroll so that view row ``top`` is at the top and, if given, pixel ``left`` at the left.
+
+        :return: The ``(top, left)`` position actually reached.
+        """
+        width = self.col_offsets[-1] - self.col_offsets[1] if len(self.col_offsets) > 1 else 0
+        if self.view:
+            self.canvas.yview_moveto(top / len(self.view))
+        if left is not None and width > 0:
+            self.canvas.xview_moveto(left / width)
+        return float(self.canvas.yview()[0]) * len(self.view), float(self.canvas.xview()[0]) * width
+
+    def _schedule_render(self):
+        """Coalesce scroll and resize events into one render per idle cycle."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render_visible)
 
-        for row_index, row_data in enumerate(self.data):
-            self.render_queue.put(("row", row_index, row_data))
+    def _render_visible(self):
+        """Delete rows that left the viewport and queue the rows that entered it."""
+        self._render_pending = False
+        if not self.col_widths:
+            return
+        first, last = self._visible_range()
+        self._window = (first, last)
+        for pos in [p for p in self._drawn_rows if not first <= p < last]:
+            self._erase_row(pos)
+        self._format_window(first, last)
+        for pos in range(first, last):
+            if pos not in self._drawn_rows:
+                self.render_queue.put(("row", pos, self.view[pos]))
+        if self._render_after is None:
+            self._process_render_queue()
 
     def _process_render_queue(self, batch_size=50):
         """Process the render queue and update the UI in batches."""
-        self.progress_window = ProgressWindow(self.master)
-        total_items = self.render_queue.qsize()
-        rendered = 0
+        self._render_after = None
+        for _ in range(batch_size):
+            try:
+                item_type, index, data = self.render_queue.get_nowait()
+            except queue.Empty:
+                return
+            if item_type == "header":
+                self._draw_header(index, data)
+            elif item_type == "row":
+                self._draw_row(index, data)
+        # Schedule the next batch if there are more items
+        self._render_after = self.after(1, self._process_render_queue)
 
-        def process_batch():
-            nonlocal rendered
-            while not self.render_queue.empty():
-                try:
-                    for _ in range(batch_size):
-                        if self.render_queue.empty():
-                            self.progress_window.close_progress()
-                            self.progress_window = None
-                            break
-                        item_type, index, data = self.render_queue.get_nowait()
-                        if item_type == "header":
-                            self._draw_header(index, data)
-                        elif item_type == "row":
-                            self._draw_row(index, data)
-                        rendered += 1
-                        self.progress_window.set_progress(rendered / total_items)
-
-                    # Update scrollregion after each batch
-                    self.after(10, lambda: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-
-                    # Schedule the next batch if there are more items
-                    if not self.render_queue.empty():
-                        self.after(10, process_batch)
-                        return
-                except queue.Empty:
-                    self.after(10, lambda: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-                    break
-                
+    def _cell_box(self, pos, col):
+        """Return the canvas rectangle (x0, y0, x1, y1) of a cell at view position ``pos``."""
+        x0 = self.col_offsets[col]
+        y0 = pos * self.row_stride if pos >= 0 else 0
+        height = self.header_px if pos < 0 else self.row_stride - self.cell_gap
+        return x0, y0, x0 + self.col_widths[col], y0 + height
 
-        # Start processing the first batch
-        process_batch()
+    def _text_anchor(self, x0, x1):
+        if self.text_alignment in ('right', 'e'):
+            return x1 - self.cell_padx, "e"
+        if self.text_alignment == 'center':
+            return (x0 + x1) / 2, "center"
+        return x0 + self.cell_padx, "w"
+
+    def _pane(self, col):
+        """Return the canvas holding body cells of column ``col``."""
+        return self.index_canvas if col == 0 else self.canvas
+
+    def _header_text(self, col_name):
+        return str(col_name)[:self.truncate] if self.truncate is not None else str(col_name)
 
     def _draw_header(self, col_index, col_name):
         """Draw a single column header."""
-        header_bg = self.theme.border
-        header_value = col_name[:self.truncate] if self.truncate is not None else col_name
-      
-        if self.truncate is not None:
-            header_width = max([len(str(x[0])[:self.truncate]) for x in self.data]) if col_index == 0 else \
-                max([len(str(x[col_index])[:self.truncate]) for x in self.data]) if self.autofit_columns else self.column_width // 10
-        else:
-            header_width = max([len(str(x[0])) for x in self.data]) if col_index == 0 else \
-            max([len(str(x[col_index])) for x in self.data]) if self.autofit_columns else self.column_width // 10
-
-        header = tk.Label(self.table_frame, text=header_value, bg=header_bg,
-                          fg=self.theme.text, font=self.theme.font, justify=self.text_alignment,
-                          width=header_width, height=1, padx=5, pady=5)
-        header.grid(row=0, column=col_index, sticky='ew', padx=1, pady=1)
-        header.bind("<Button-1>", lambda _, c=col_index: self._select_column(c))
-
-        if self.tooltip == 'on':
-            ToolTip(header, text=str(col_name), wraplength=300)
-        
-
-    def _draw_row(self, row_index, row_data):
-        """Draw a single row."""
-        row_header_bg = self.theme.border
-        row_height = max([x.count('\n') + 1 for x in row_data]) if self.autofit_rows else self.row_height // 10
-        row_values = [str(x)[:self.truncate] for x in row_data] if self.truncate is not None else row_data
-        row_header = tk.Label(self.table_frame, text=row_values[0], bg=row_header_bg,
-                              fg=self.theme.text, font=self.theme.font, justify=self.text_alignment,
-                              height=row_height, padx=5, pady=5)
-        row_header.grid(row=row_index + 1, column=0, sticky="ew", padx=1, pady=1)
-        row_header.bind("<Button-1>", lambda _, r=row_index: self._select_row(r))
-        if self.tooltip:
-            ToolTip(row_header,text=row_data[0], wraplength=300)
-
-        for col_index, cell_data in enumerate(row_values):
-            if col_index == 0:
-                continue
-            cell_bg = self.theme.widget_bg
-            cell = tk.Label(self.table_frame, text=cell_data, bg=cell_bg,
-                            fg=self.theme.text, font=self.theme.font, justify=self.text_alignment,
-                            height=1, padx=5, pady=5)
-            cell.grid(row=row_index + 1, column=col_index, sticky="nsew", padx=1, pady=1)
+        header_value = self._header_text(col_name)
+        pane = self.corner if col_index == 0 else self.header_canvas
+        x0, y0, x1, y1 = self._cell_box(-1, col_index)
+        x, anchor = self._text_anchor(x0, x1)
+        tags = ("header", f"c{col_index}")
+        rect = pane.create_rectangle(x0, y0, x1, y1, fill=self.theme.border, width=0, tags=tags)
+        text = pane.create_text(x, (y0 + y1) / 2, text=self._fit(header_value, col_index), anchor=anchor,
+                                fill=self.theme.text, font=self.theme.font, tags=tags)
+        self._header_items[col_index] = (rect, text)
+
+    def _draw_row(self, pos, row_index):
+        """Draw a single row at view position ``pos``."""
+        first, last = self._window
+        if not first <= pos < last or pos in self._drawn_rows:
+            return
+        for col_index in range(len(self.columns)):
+            tags = ("row", f"r{pos}", f"c{col_index}")
+            pane = self._pane(col_index)
+            x0, y0, x1, y1 = self._cell_box(pos, col_index)
+            x, anchor = self._text_anchor(x0, x1)
+            rect = pane.create_rectangle(x0, y0, x1, y1, tags=tags, fill=self._cell_bg(row_index, col_index),
+                                         **self._cell_outline(row_index, col_index))
+            text = pane.create_text(x, (y0 + y1) / 2, anchor=anchor, tags=tags,
+                                    text=self._fit(self._cell_text(row_index, col_index), col_index),
+                                    fill=self._cell_fg(row_index, col_index), font=self.theme.font)
+            self._cell_items[(row_index, col_index)] = (rect, text)
+        self._drawn_rows[pos] = row_index
+
+    def _erase_row(self, pos):
+        row_index = self._drawn_rows.pop(pos)
+        self.canvas.delete(f"r{pos}")
+        self.index_canvas.delete(f"r{pos}")
+        for col_index in range(len(self.columns)):
+            self._cell_items.pop((row_index, col_index), None)
 
-            cell.bind("<Enter>", lambda e, r=row_index, c=col_index: self._on_cell_hover(e, r, c))
-            cell.bind("<Leave>", lambda e, r=row_index, c=col_index: self._on_cell_leave(e, r, c))
-            cell.bind("<Button-1>", lambda e, r=row_index, c=col_index: self._on_cell_click(e, r, c))
+    def _cell_bg(self, row, col):
+        """Return the background colour of a cell for its hover/selection/match state."""
+        if col == 0 or row < 0:
+            return self.theme.border
+        if (row, col) in self._flashing:
+            return self.theme.accent
+        if self._hover_cell == (row, col):
+            return self.theme.hover
+        if (row, col) in self.selected_indices:
+            return self.theme.focus
+        if row == self._match_row:
+            return self.theme.active
+        return self._cell_style(row, col)[0] or self.theme.widget_bg
 
-            if self.tooltip == 'on':
-                ToolTip(cell, text=str(row_data[col_index]), wraplength=300,
-                        enter_binding=lambda e, r=row_index, c=col_index: self._on_cell_hover(e, r, c),
-                        leave_binding=lambda e, r=row_index, c=col_index: self._on_cell_leave(e, r, c))
+    def _cell_outline(self, row, col):
+        """Return the outline options of a cell; the keyboard cursor is outlined in the accent colour."""
+        if (row, col) == self._cursor_cell:
+            return {"outline": self.theme.accent, "width": 2}
+        return {"outline": "", "width": 0}
+
+    def _paint_cell(self, row, col):
+        items = self._cell_items.get((row, col))
+        if items:
+            self._pane(col).itemconfig(items[0], fill=self._cell_bg(row, col), **self._cell_outline(row, col))
+
+    def _paint_text(self, row, col):
+        items = self._cell_items.get((row, col))
+        if items:
+            self._pane(col).itemconfig(items[1], text=self._fit(self._cell_text(row, col), col),
+                                       fill=self._cell_fg(row, col))
+
+    def _paint_visible(self, text=False):
+        """Repaint the background (and with ``text`` the text colour) of every drawn cell."""
+        for (row, col), (rect, item) in self._cell_items.items():
+            if col > 0:
+                self.canvas.itemconfig(rect, fill=self._cell_bg(row, col))
+                if text:
+                    self.canvas.itemconfig(item, fill=self._cell_fg(row, col))
+
+    def _apply_theme(self):
+        """
+        Recolour the table in place after a theme switch.
+
+        Drawn items are reconfigured rather than recreated, so only the visible
+        window is touched; a font change needs a new layout and redraws instead.
+        """
+        theme = self.theme
+        self.configure(bg=theme.background)
+        for pane in (self.corner, self.header_canvas, self.index_canvas, self.canvas,
+                     self.footer_corner, self.footer_canvas):
+            pane.configure(bg=theme.background)
+        if theme.font != self._font_spec:
+            self._font_spec = theme.font
+            self.font.configure(family=theme.font[0], size=theme.font[1])
+            self._metrics = self.font.metrics()
+            self._ellipsis_px = self.font.measure(ELLIPSIS)
+            self._glyph_widths.clear()
+            self._fit_cache.clear()
+            if self.col_widths:
+                self._draw_table()
+            return
+        for pane, (rect, text) in ((self.corner if col == 0 else self.header_canvas, items)
+                                   for col, items in self._header_items.items()):
+            pane.itemconfig(rect, fill=theme.border)
+            pane.itemconfig(text, fill=theme.text)
+        for (row, col), (rect, text) in self._cell_items.items():
+            pane = self._pane(col)
+            pane.itemconfig(rect, fill=self._cell_bg(row, col), **self._cell_outline(row, col))
+            pane.itemconfig(text, fill=self._cell_fg(row, col))
+        self._schedule_footer()
+
+    def _column_at(self, x):
+        """Return the column under canvas x coordinate ``x``, or None over a gap."""
+        col = bisect_right(self.col_offsets, x) - 1
+        if col < 0 or col >= len(self.col_widths) or x > self.col_offsets[col] + self.col_widths[col]:
+            return None
+        return col
+
+    def _row_at(self, y):
+        """Return the view position under canvas y coordinate ``y``, or None."""
+        pos = int(y // self.row_stride)
+        return pos if 0 <= y and pos < len(self.view) else None
+
+    def _border_at(self, x):
+        """Return the data column whose right border is within ``resize_margin`` of ``x``, or None."""
+        k = bisect_right(self.col_offsets, x + self.resize_margin + self.cell_gap) - 1
+        if k < 2:
+            return None
+        edge = self.col_offsets[k] - self.cell_gap
+        return k - 1 if abs(x - edge) <= self.resize_margin else None
+
+    def _event_cell(self, event):
+        """Map a pointer event on any pane to (view position, column); position -1 is the header row."""
+        pane = event.widget
+        if pane is self.corner:
+            return -1, 0
+        x, y = pane.canvasx(event.x), pane.canvasy(event.y)
+        if pane is self.header_canvas:
+            col = self._column_at(x)
+            return None if col is None else (-1, col)
+        pos = self._row_at(y)
+        if pos is None:
+            return None
+        if pane is self.index_canvas:
+            return pos, 0
+        col = self._column_at(x)
+        return None if col is None or col == 0 else (pos, col)
 
     def _on_mousewheel(self, event):
         """Scroll the canvas on mouse wheel."""
@@ -203,100 +793,1552 @@ class CustomTableView(tk.Frame):
         else:
             self.canvas.yview_scroll(-1 * (event.delta // 120), "units")
 
-    def _on_cell_hover(self, event, *_):
-        """Change cell background color on hover."""
-        event.widget.config(bg=self.theme.hover)
+    def _on_motion(self, event):
+        """Track the hovered cell for highlighting and the tooltip."""
+        if event.widget is self.header_canvas:
+            border = self._border_at(self.header_canvas.canvasx(event.x))
+            self.header_canvas.configure(cursor="sb_h_double_arrow" if border is not None else "")
+        hit = self._event_cell(event)
+        cell = None
+        if hit is not None and hit[0] >= 0:
+            cell = (self.view[hit[0]], hit[1])
+        self._set_hover(cell if cell and cell[0] >= 0 and cell[1] > 0 else None)
 
-    def _on_cell_leave(self, event, row, col):
-        """Revert cell background color when hover ends."""
-        if (row, col) not in self.selected_indices:
-            event.widget.config(bg=self.theme.widget_bg)
+        if self.tip is None:
+            return
+        if hit != self._tip_cell:
+            self._hide_tip()
+            self._tip_cell = hit
+            if hit is not None:
+                pos, col = hit
+                self.tip.text = str(self.columns[col]) if pos < 0 else self._format_cell(self.view[pos], col)
+                if self.tip.text:
+                    self.tip.schedule()
         else:
-            event.widget.config(bg=self.theme.focus)
+            self.tip.move_tip()
+
+    def _hide_tip(self):
+        self._tip_cell = None
+        if self.tip is not None:
+            self.tip.unschedule()
+            self.tip.hide_tip()
 
-    def _on_cell_click(self, event, row, col):
+    def _set_hover(self, cell):
+        """Move the hover highlight, repainting only the two affected cells."""
+        previous, self._hover_cell = self._hover_cell, cell
+        if previous == cell:
+            return
+        if previous is not None:
+            self._paint_cell(*previous)
+        if cell is not None:
+            self._paint_cell(*cell)
+
+    def _on_click(self, event):
+        """Dispatch a click to header, row header or cell selection."""
+        event.widget.focus_set()
+        if event.widget is self.header_canvas and self._start_resize(event):
+            return
+        hit = self._event_cell(event)
+        if hit is None:
+            return
+        pos, col = hit
+        if pos < 0:
+            self._select_column(col)
+        elif col == 0:
+            self._select_row(self.view[pos])
+        else:
+            self._anchor = self._extent = None
+            self._set_cursor(pos, col)
+            if self.view[pos] >= 0:
+                self._on_cell_click(self.view[pos], col)
+
+    def _on_key(self, event):
+        """
+        Move the keyboard cursor with the arrow, Page Up/Down and Home/End keys.
+
+        Only the target position is updated here; the repaint and scroll run
+        once per idle cycle, so auto-repeated keys never pile up.
+        """
+        if not self.view or len(self.columns) < 2:
+            return "break"
+        if event.keysym == "space":
+            if self.cursor is not None:
+                self._on_cell_click(*self._cursor_cell)
+            return "break"
+
+        shift = bool(event.state & 0x0001)
+        control = bool(event.state & 0x0004)
+        pos, col = self._cursor_target or self.cursor or (0, 1)
+        page = max(1, self.canvas.winfo_height() // self.row_stride - 1)
+        keysym = event.keysym
+        if keysym == "Up":
+            pos -= 1
+        elif keysym == "Down":
+            pos += 1
+        elif keysym == "Left":
+            col -= 1
+        elif keysym == "Right":
+            col += 1
+        elif keysym == "Prior":
+            pos -= page
+        elif keysym == "Next":
+            pos += page
+        elif keysym == "Home":
+            pos, col = (0, 1) if control else (pos, 1)
+        elif keysym == "End":
+            last_col = len(self.columns) - 1
+            pos, col = (len(self.view) - 1, last_col) if control else (pos, last_col)
+        pos = min(max(pos, 0), len(self.view) - 1)
+        col = min(max(col, 1), len(self.columns) - 1)
+
+        if not shift:
+            self._anchor = self._extent = None
+        elif self._anchor is None:
+            self._anchor = self.cursor or (pos, col)
+        self._cursor_target = (pos, col)
+        self._cursor_extend = shift
+        if not self._cursor_pending:
+            self._cursor_pending = True
+            self.after_idle(self._apply_cursor)
+        return "break"
+
+    def _apply_cursor(self):
+        self._cursor_pending = False
+        target, self._cursor_target = self._cursor_target, None
+        if target is not None and target[0] < len(self.view):
+            self._set_cursor(*target, extend=self._cursor_extend)
+
+    def _set_cursor(self, pos, col, extend=False):
+        """Place the cursor on a cell, repainting only the old and the new cursor cells."""
+        previous = self._cursor_cell
+        self.cursor = (pos, col)
+        self._cursor_cell = (self.view[pos], col)
+        if previous is not None:
+            self._paint_cell(*previous)
+        self._paint_cell(*self._cursor_cell)
+        if extend and self._anchor is not None:
+            (a_pos, a_col), extent = self._anchor, self._extent
+            self._extent = (min(a_pos, pos), max(a_pos, pos), min(a_col, col), max(a_col, col))
+            self._swap_extent(extent, self._extent)
+        self._scroll_to_cell(pos, col)
+
+    def _reset_cursor(self):
+        self.cursor = None
+        self._cursor_cell = None
+        self._cursor_target = None
+        self._anchor = self._extent = None
+
+    def _swap_extent(self, old, new):
+        """
+        Replace the Shift-extended selection rectangle ``old`` by ``new``.
+
+        Rectangles are (first pos, last pos, first col, last col), inclusive.
+        Only the cells in their difference are touched.
+        """
+        for rect, other, select in ((old, new, False), (new, old, True)):
+            if rect is None:
+                continue
+            p0, p1, c0, c1 = rect
+            if other is None:
+                stripes = [(p0, p1, range(c0, c1 + 1))]
+            else:
+                q0, q1, d0, d1 = other
+                cols = range(c0, c1 + 1)
+                stripes = [(p0, min(p1, q0 - 1), cols), (max(p0, q1 + 1), p1, cols)]
+                if (c0, c1) != (d0, d1):
+                    stripes.append((max(p0, q0), min(p1, q1), [c for c in cols if not d0 <= c <= d1]))
+            for first, last, cols in stripes:
+                for pos in range(first, last + 1):
+                    row = self.view[pos]
+                    if row < 0:
+                        continue
+                    for col in cols:
+                        if select:
+                            self.selected_indices.add((row, col))
+                        else:
+                            self.selected_indices.discard((row, col))
+                        self._paint_cell(row, col)
+        self._selection_changed()
+
+    def _scroll_to_cell(self, pos, col):
+        """Scroll the body just enough to show a cell, using row and column arithmetic."""
+        total_height = len(self.view) * self.row_stride
+        top, height = self.canvas.canvasy(0), self.canvas.winfo_height()
+        y0 = pos * self.row_stride
+        y1 = y0 + self.row_stride
+        if y0 < top:
+            self.canvas.yview_moveto(y0 / total_height)
+        elif y1 > top + height:
+            self.canvas.yview_moveto((y1 - height) / total_height)
+
+        left = self.col_offsets[1]
+        total_width = max(1, self.col_offsets[-1] - left)
+        x_left, width = self.canvas.canvasx(0), self.canvas.winfo_width()
+        x0 = self.col_offsets[col]
+        x1 = x0 + self.col_widths[col]
+        if x0 < x_left:
+            self.canvas.xview_moveto((x0 - left) / total_width)
+        elif x1 > x_left + width:
+            self.canvas.xview_moveto((x1 - width - left) / total_width)
+
+    def _on_double_click(self, event):
+        hit = self._event_cell(event)
+        if hit is not None and hit[0] >= 0 and hit[1] > 0:
+            row = self.view[hit[0]]
+            if row < 0:
+                self._toggle_group(~row)
+            else:
+                self._begin_edit(*hit)
+
+    def _edit_cursor_cell(self):
+        if self.cursor is not None:
+            row = self.view[self.cursor[0]]
+            if row < 0:
+                self._toggle_group(~row)
+            else:
+                self._begin_edit(*self.cursor)
+        return "break"
+
+    def edit_cell(self, row, column):
+        """
+        Open the editor on a cell.
+
+        :param row: The data row index.
+        :param column: A column name or 0-based column number.
+        """
+        self._begin_edit(self._view_position(row), self._column_index(column))
+
+    def _view_position(self, row):
+        """Return the position of data row ``row`` in the view."""
+        if self.group_column is None:
+            # Without grouping the view is an ascending list or range of data rows
+            pos = bisect_left(self.view, row)
+            if pos < len(self.view) and self.view[pos] == row:
+                return pos
+            raise ValueError(f"Row {row} is not in the view")
+        return self.view.index(row)
+
+    def _begin_edit(self, pos, col):
+        """Move the single overlay editor onto a cell and load its value."""
+        if not self.editable:
+            return
+        self._commit_edit()
+        if self._editing is not None:
+            # The open edit was rejected; keep it until it is fixed or cancelled
+            return
+        self._set_cursor(pos, col)
+        x0, y0, x1, y1 = self._cell_box(pos, col)
+        width, height = int(x1 - x0), int(y1 - y0)
+        if self.editor is None:
+            self.editor = CustomEntry(self.canvas, width=width, height=height, border_radius=4, theme=self.theme)
+            self._editor_window = self.canvas.create_window(x0, y0, anchor="nw", window=self.editor)
+            self.editor.entry.bind("<Return>", lambda e: self._commit_edit(move=(1, 0)))
+            self.editor.entry.bind("<Tab>", lambda e: self._commit_edit(move=(0, 1)))
+            self.editor.entry.bind("<Escape>", lambda e: self._cancel_edit())
+            self.editor.entry.bind("<FocusOut>", lambda e: self._commit_edit(), add="+")
+        elif (width, height) != (self.editor.width, self.editor.height):
+            self.editor.resize(width, height)
+        self.canvas.coords(self._editor_window, x0, y0)
+        self.canvas.itemconfig(self._editor_window, state="normal")
+        self._editing = (self.view[pos], col)
+        self.editor.set(str(self._cell_value(*self._editing)))
+        self.editor.set_error(False)
+        self.editor.entry.select_range(0, tk.END)
+        self.editor.entry.focus_set()
+
+    def _hide_editor(self):
+        self._editing = None
+        if self._editor_window is not None:
+            self.canvas.itemconfig(self._editor_window, state="hidden")
+            self.canvas.focus_set()
+
+    def _cancel_edit(self):
+        self._hide_editor()
+        return "break"
+
+    def _commit_edit(self, move=None):
+        """Write the editor text back to its cell, optionally moving the cursor by ``move``."""
+        if self._editing is None:
+            return "break"
+        row, col = self._editing
+        try:
+            value = self._parse_value(self.editor.get(), self._cell_value(row, col))
+        except ValueError:
+            # Storing the text would make a numeric column mixed-type, so the editor stays open instead
+            self.editor.set_error(True)
+            return "break"
+        self._hide_editor()
+        self._edit_cell(row, col, value)
+        if move is not None and self.cursor is not None:
+            pos = min(self.cursor[0] + move[0], len(self.view) - 1)
+            col = min(self.cursor[1] + move[1], len(self.columns) - 1)
+            self._set_cursor(pos, col)
+        return "break"
+
+    @staticmethod
+    def _parse_value(text, old):
+        """Convert edited text back to the type of the value it replaces; raise ValueError if it cannot be."""
+        if isinstance(old, (int, float)) and not isinstance(old, bool):
+            return type(old)(text)
+        return text
+
+    def set_cell(self, row, column, value):
+        """
+        Change one cell as an undoable edit, recording it in the pending changes.
+
+        :param row: The data row index.
+        :param column: A column name or 0-based column number.
+        :param value: The new value.
+        """
+        self._edit_cell(row, self._column_index(column), value)
+
+    def _edit_cell(self, row, col, value):
+        """Record and apply an edit of the cell at internal column index ``col``."""
+        old = self._cell_value(row, col)
+        if old == value:
+            return
+        self._undo.append((row, col, old, value))
+        self._redo.clear()
+        self._apply_edit(row, col, old, value)
+
+    def _apply_edit(self, row, col, old, new):
+        original = self._dirty.setdefault((row, col), old)
+        if original == new:
+            del self._dirty[(row, col)]
+        self.apply_diff(changed=[(row, col - 1, new)])
+
+    def undo(self):
+        """Revert the last edit; return True if there was one."""
+        if not self._undo:
+            return False
+        row, col, old, new = self._undo.pop()
+        self._redo.append((row, col, old, new))
+        self._apply_edit(row, col, new, old)
+        return True
+
+    def redo(self):
+        """Re-apply the last undone edit; return True if there was one."""
+        if not self._redo:
+            return False
+        row, col, old, new = self._redo.pop()
+        self._undo.append((row, col, old, new))
+        self._apply_edit(row, col, old, new)
+        return True
+
+    def get_changes(self):
+        """
+        Return the pending edits as ``(row, col, old, new)`` tuples.
+
+        Rows are data row indices and columns are 0-based; a cell edited
+        several times appears once with its original and current value.
+        """
+        return [(row, col - 1, old, self._cell_value(row, col)) for (row, col), old in sorted(self._dirty.items())]
+
+    def commit_changes(self, commit=None):
+        """
+        Hand the pending edits to ``commit`` in one call and clear them.
+
+        :param commit: Optional callable receiving the list from :meth:`get_changes`,
+                       e.g. a function running one ``executemany`` against a database.
+        :return: The committed changes.
+        """
+        self._commit_edit()
+        changes = self.get_changes()
+        if commit is not None and changes:
+            commit(changes)
+        self._clear_edits()
+        return changes
+
+    def discard_changes(self):
+        """Restore the original value of every edited cell and clear the pending edits."""
+        self._hide_editor()
+        originals = [(row, col - 1, old) for (row, col), old in self._dirty.items()]
+        self._clear_edits()
+        self.apply_diff(changed=originals)
+
+    def _clear_edits(self):
+        self._dirty.clear()
+        self._undo.clear()
+        self._redo.clear()
+
+    def _start_resize(self, event):
+        """Begin dragging a header border; return True if the click was on one."""
+        x = self.header_canvas.canvasx(event.x)
+        col = self._border_at(x)
+        if col is None:
+            return False
+        self._resize_col = col
+        self._hide_tip()
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        self.canvas.create_line(x, top, x, bottom, fill=self.theme.accent, dash=(4, 2), tags="guide")
+        self.header_canvas.create_line(x, 0, x, self.header_px, fill=self.theme.accent, tags="guide")
+        return True
+
+    def _drag_resize(self, event):
+        """Move the guide line while a header border is dragged."""
+        if self._resize_col is None:
+            return
+        x = max(self.header_canvas.canvasx(event.x), self.col_offsets[self._resize_col] + self.min_column_width)
+        for pane in (self.canvas, self.header_canvas):
+            _, y0, _, y1 = pane.coords("guide")
+            pane.coords("guide", x, y0, x, y1)
+
+    def _end_resize(self, event):
+        """Apply the dragged width to the column and remove the guide line."""
+        if self._resize_col is None:
+            return
+        col, self._resize_col = self._resize_col, None
+        self.canvas.delete("guide")
+        self.header_canvas.delete("guide")
+        self._resize_column(col, self.header_canvas.canvasx(event.x) - self.col_offsets[col])
+
+    def set_column_width(self, column, width):
+        """
+        Set the width of a column in pixels without relaying out the table.
+
+        :param column: A column name or 0-based column number.
+        :param width: The new width in pixels.
+        """
+        self._resize_column(self._column_index(column), width)
+
+    def _resize_column(self, col, width):
+        """Resize one column, shifting the offsets and drawn items of the columns to its right."""
+        width = max(self.min_column_width, int(width))
+        self._user_widths[col] = width
+        if not self.col_widths:
+            # Not laid out yet; the first layout picks up the stored width
+            return
+        delta = width - self.col_widths[col]
+        if not delta:
+            return
+        self.col_widths[col] = width
+        self._col_px[col] = max(1, width - 2 * self.cell_padx)
+        for k in range(col + 1, len(self.col_offsets)):
+            self.col_offsets[k] += delta
+
+        for k in range(col + 1, len(self.columns)):
+            self.canvas.move(f"c{k}", delta, 0)
+            self.header_canvas.move(f"c{k}", delta, 0)
+
+        cells = [(-1, self._header_items.get(col), self.columns[col])]
+        cells += [(pos, self._cell_items.get((row, col)), None) for pos, row in self._drawn_rows.items()]
+        for pos, items, name in cells:
+            if items is None:
+                continue
+            rect, text = items
+            pane = self.header_canvas if pos < 0 else self._pane(col)
+            x0, y0, x1, y1 = self._cell_box(pos, col)
+            x, _ = self._text_anchor(x0, x1)
+            value = self._header_text(name) if pos < 0 else self._cell_text(self._drawn_rows[pos], col)
+            pane.coords(rect, x0, y0, x1, y1)
+            pane.coords(text, x, (y0 + y1) / 2)
+            pane.itemconfig(text, text=self._fit(value, col))
+        self._update_scrollregion()
+        self._schedule_footer()
+
+    def show_footer(self, aggregates=("sum", "mean", "min", "max", "count")):
+        """
+        Show a footer with aggregates of every column under the table.
+
+        Without filters or a search the aggregates are running statistics
+        updated per changed, appended or removed row; otherwise they are
+        recomputed over the rows in view.
+
+        :param aggregates: Names from ``AGGREGATES``, one footer line each.
+        """
+        unknown = [name for name in aggregates if name not in AGGREGATES]
+        if unknown:
+            raise ValueError(f"Unknown aggregates: {unknown}")
+        self.footer_aggregates = tuple(aggregates)
+        self.footer_corner.grid(row=2, column=0, sticky="nsew")
+        self.footer_canvas.grid(row=2, column=1, sticky="ew")
+        self._schedule_footer()
+
+    def hide_footer(self):
+        """Remove the footer and stop maintaining running aggregates."""
+        self.footer_aggregates = ()
+        self._stats.clear()
+        self.footer_corner.grid_remove()
+        self.footer_canvas.grid_remove()
+
+    def get_aggregates(self, column):
+        """
+        Return the aggregates of the numeric values of ``column`` over the rows in view.
+
+        :param column: A column name or 0-based column number.
+        :return: A dict keyed by the names in ``AGGREGATES``; non-numeric values are ignored.
+        """
+        return self._aggregates(self._column_index(column))
+
+    def _aggregates(self, col):
+        if self.filters or self.search_rows is not None:
+            values = self._column_values(col)
+            return _summarize([values[row] for row in self._data_rows()])
+        stats = self._stats.get(col)
+        if stats is None:
+            stats = self._stats[col] = _RunningStats(self._column_values(col))
+        return stats.summary()
+
+    def _update_stats(self, added=(), removed=()):
+        """Fold added and removed records into the running aggregates."""
+        for col, stats in self._stats.items():
+            for record in removed:
+                stats.remove(record[col])
+            for record in added:
+                stats.add(record[col])
+
+    def _schedule_footer(self):
+        if self.footer_aggregates and self._footer_after is None:
+            self._footer_after = self.after_idle(self._draw_footer)
+
+    def _draw_footer(self):
+        """Draw the footer, one line per aggregate under every column."""
+        self._footer_after = None
+        if not self.footer_aggregates or not self.col_widths:
+            return
+        gap = self.cell_gap
+        height = len(self.footer_aggregates) * self._metrics["linespace"] + 2 * self.cell_pady
+        self.footer_corner.configure(width=self.col_widths[0] + gap, height=height + gap)
+        self.footer_canvas.configure(height=height + gap,
+                                     scrollregion=(self.col_offsets[1], 0, self.col_offsets[-1], height + gap))
+        self.footer_corner.delete("all")
+        self.footer_canvas.delete("all")
+        for col in range(len(self.columns)):
+            if col == 0:
+                pane, lines = self.footer_corner, self.footer_aggregates
+            else:
+                summary = self._aggregates(col)
+                pane, lines = self.footer_canvas, [self._format_summary(col, name, summary[name])
+                                                   for name in self.footer_aggregates]
+            x0, x1 = self.col_offsets[col], self.col_offsets[col] + self.col_widths[col]
+            x, anchor = self._text_anchor(x0, x1)
+            pane.create_rectangle(x0, gap, x1, gap + height, fill=self.theme.border, width=0)
+            pane.create_text(x, gap + height / 2, anchor=anchor, fill=self.theme.text, font=self.theme.font,
+                             justify={"e": "right", "center": "center"}.get(anchor, "left"),
+                             text='\n'.join(self._fit_line(line, self._col_px[col]) for line in lines))
+        self.footer_canvas.xview_moveto(self.canvas.xview()[0])
+
+    def _format_summary(self, col, name, value):
+        """Format an aggregate with the column's formatter, except counts."""
+        formatter = self.formatters.get(col)
+        if value is not None and formatter is not None and name != "count":
+            return formatter(value)
+        return self._format_aggregate(value)
+
+    @staticmethod
+    def _format_aggregate(value):
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return f"{value:.6g}" if isinstance(value, float) else str(value)
+
+    def _on_cell_click(self, row, col):
         """Indicate the selected cell."""
+        if row < 0:
+            self._toggle_group(~row)
+            return
         if (row, col) in self.selected_indices and col > 0:
             self.selected_indices.remove((row, col))
-            event.widget.config(bg=self.theme.widget_bg)
         elif col > 0:
             self.selected_indices.add((row, col))
-            event.widget.config(bg=self.theme.focus)
+        self._paint_cell(row, col)
+        self._selection_changed()
+
+    def _selection_changed(self):
+        """Tell the scroll group, if selections are linked, that the user changed the selection."""
+        if self._scroll_group is not None:
+            self._scroll_group._selected(self)
+
+    def _set_selection(self, cells):
+        """Replace the selection with ``cells`` and repaint the visible cells."""
+        self.selected_indices = set(cells)
+        if self.col_widths:
+            self._paint_visible()
 
     def _select_row(self, row):
         """Toggle selection of an entire row."""
+        if row < 0:
+            self._toggle_group(~row)
+            return
         row_indices = {(row, col) for col in range(len(self.columns)) if col != 0}
         if row_indices.issubset(self.selected_indices):
             # Deselect the row
             self.selected_indices -= row_indices
-            for col in range(1, len(self.columns)):
-                widget = self.table_frame.grid_slaves(row=row + 1, column=col)[0]
-                widget.config(bg=self.theme.widget_bg)
         else:
             # Select the row
             self.selected_indices |= row_indices
-            for col in range(1, len(self.columns)):
-                widget = self.table_frame.grid_slaves(row=row + 1, column=col)[0]
-                widget.config(bg=self.theme.focus)
+        for col in range(1, len(self.columns)):
+            self._paint_cell(row, col)
+        self._selection_changed()
 
     def _select_column(self, col):
         """Toggle selection of an entire column."""
-        col_indices = {(row, col) for row in range(len(self.data))}
+        if col == 0:
+            self._select_all()
+            return
+        col_indices = {(row, col) for row in self._data_rows()}
         if col_indices.issubset(self.selected_indices):
             # Deselect the column
             self.selected_indices -= col_indices
-            for row in range(len(self.data)):
-                widget = self.table_frame.grid_slaves(row=row + 1, column=col)[0]
-                widget.config(bg=self.theme.widget_bg)
         else:
             # Select the column
-            if col == 0:
-                self._select_all()
-                return
             self.selected_indices |= col_indices
-            for row in range(len(self.data)):
-                widget = self.table_frame.grid_slaves(row=row + 1, column=col)[0]
-                widget.config(bg=self.theme.focus)
+        self._paint_visible()
+        self._selection_changed()
 
     def _select_all(self):
         """Toggle selection of all cells."""
-        all_indices = {(row, col) for row in range(len(self.data)) for col in range(1, len(self.columns))}
+        all_indices = {(row, col) for row in self._data_rows() for col in range(1, len(self.columns))}
         if all_indices.issubset(self.selected_indices):
             # Deselect all cells
-            self.selected_indices.clear()
-            for row in range(len(self.data)):
-                for col in range(1, len(self.columns)):
-                    widget = self.table_frame.grid_slaves(row=row + 1, column=col)[0]
-                    widget.config(bg=self.theme.widget_bg)
+            self.selected_indices -= all_indices
         else:
             # Select all cells
-            self.selected_indices = all_indices
-            for row in range(len(self.data)):
-                for col in range(1, len(self.columns)):
-                    widget = self.table_frame.grid_slaves(row=row + 1, column=col)[0]
-                    widget.config(bg=self.theme.focus)
+            self.selected_indices |= all_indices
+        self._paint_visible()
+        self._selection_changed()
 
     def get_selected_indices(self):
         """Return the indices of selected cells."""
         selected_indices = {(row, col-1) for row, col in self.selected_indices if col > 0}
         return selected_indices
 
-    def set_data(self, data):
-        """Update the table data and redraw."""
-        self.data = [[i + 1] + row for i, row in enumerate(data)]
+    def _export_layout(self, selection_only):
+        """
+        Return ``(rows, cols, cells)`` to export: sorted data rows, sorted columns and the
+        selected cells, or the whole view with ``cells`` set to None.
+        """
+        if selection_only and self.selected_indices:
+            cells = self.selected_indices
+            rows = sorted({row for row, _ in cells})
+            cols = sorted({col for _, col in cells})
+            return rows, cols, cells
+        return list(self._data_rows()), list(range(1, len(self.columns))), None
+
+    def _iter_cells(self, rows, cols, cells=None, missing=""):
+        """Yield the values of ``cols`` for each of ``rows``; unselected cells become ``missing``."""
+        value = self._cell_value
+        for row in rows:
+            if cells is None:
+                yield [value(row, col) for col in cols]
+            else:
+                yield [value(row, col) if (row, col) in cells else missing for col in cols]
+
+    def _export_snapshot(self, rows, cols, cells, missing):
+        """
+        Copy the rows to export and return a function yielding their cells like ``_iter_cells``.
+
+        The copy is taken on the main thread, so appends, evictions and edits made
+        while a worker thread writes the export cannot shift or change its rows.
+        """
+        if isinstance(self.data, ColumnStore):
+            copy = self.data.take(rows)
+            # take() renumbers its rows from 1, so keep the original row numbers aside
+            numbers = [self.data.get(row, 0) for row in rows] if 0 in cols else None
+
+            def value(pos, col):
+                return copy.get(pos, col) if col else numbers[pos]
+        else:
+            data = self.data if isinstance(self.data, list) else list(self.data)
+            copy = [data[row] for row in rows]
+
+            def value(pos, col):
+                return copy[pos][col]
+        if cells is not None:
+            positions = {row: pos for pos, row in enumerate(rows)}
+            cells = {(positions[row], col) for row, col in cells}
+
+        def iterate():
+            for pos in range(len(rows)):
+                if cells is None:
+                    yield [value(pos, col) for col in cols]
+                else:
+                    yield [value(pos, col) if (pos, col) in cells else missing for col in cols]
+        return iterate
+
+    def iter_selection(self):
+        """
+        Yield the selected cells row by row, in data order.
+
+        Each item is a list with one value per selected column; cells of that
+        column not selected in the row are empty strings.
+        """
+        rows, cols, cells = self._export_layout(True)
+        if cells is not None:
+            yield from self._iter_cells(rows, cols, cells)
+
+    def copy_selection(self, event=None, chunk_rows=10000):
+        """Copy the selected cells to the clipboard as tab-separated text, one chunk at a time."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, dialect="excel-tab", lineterminator="\n")
+        self.clipboard_clear()
+        for chunk in _chunks(self.iter_selection(), chunk_rows):
+            writer.writerows(chunk)
+            self.clipboard_append(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+        return "break"
+
+    def export_csv(self, path, selection_only=True, header=True, chunk_rows=10000, on_done=None):
+        """
+        Write the selection (or the whole view if nothing is selected) to a CSV file.
+
+        Rows are streamed to the file in chunks on a worker thread while a
+        ProgressWindow shows the progress.
+
+        :param path: The output file path.
+        :param selection_only: Export only the selected cells when there is a selection.
+        :param header: Write the column names as the first line.
+        :param chunk_rows: Number of rows written per chunk.
+        :param on_done: Optional callback receiving None or the exception raised by the export;
+            the outcome is also kept in ``export_error``.
+        :return: The worker thread.
+        """
+        rows, cols, cells = self._export_layout(selection_only)
+        names = [self.columns[col] for col in cols]
+        iterate = self._export_snapshot(rows, cols, cells, "")
+
+        def write(progress):
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                if header:
+                    writer.writerow(names)
+                done = 0
+                for chunk in _chunks(iterate(), chunk_rows):
+                    writer.writerows(chunk)
+                    done += len(chunk)
+                    progress(done / max(1, len(rows)))
+
+        return self._run_export(write, on_done)
+
+    def export_parquet(self, path, selection_only=True, chunk_rows=10000, on_done=None, schema=None,
+                       sample=100):
+        """
+        Write the selection (or the whole view if nothing is selected) to a Parquet file.
+
+        Requires pyarrow. Each chunk of rows is written as one row group on a
+        worker thread; unselected cells are stored as nulls. Unless ``schema``
+        is given, each column's type is inferred from its first ``sample``
+        non-null values, reading only as far as needed to find them. An empty
+        export still writes a file with the columns and no rows.
+
+        :param path: The output file path.
+        :param selection_only: Export only the selected cells when there is a selection.
+        :param chunk_rows: Number of rows per row group.
+        :param on_done: Optional callback receiving None or the exception raised by the export;
+            the outcome is also kept in ``export_error``.
+        :param schema: A pyarrow schema to write instead of inferring one.
+        :param sample: Number of non-null values per column the inferred types are based on.
+        :return: The worker thread.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        rows, cols, cells = self._export_layout(selection_only)
+        names = [str(self.columns[col]) for col in cols]
+        iterate = self._export_snapshot(rows, cols, cells, None)
+
+        def infer_schema():
+            # Inferring from the first chunk alone would type a column with no values there as null
+            samples = [[] for _ in cols]
+            pending = set(range(len(cols)))
+            for values in iterate():
+                for k in list(pending):
+                    if values[k] is not None:
+                        samples[k].append(values[k])
+                        if len(samples[k]) >= sample:
+                            pending.discard(k)
+                if not pending:
+                    break
+            return pa.schema([pa.field(name, pa.infer_type(values)) for name, values in zip(names, samples)])
+
+        def write(progress):
+            writer = pq.ParquetWriter(path, schema if schema is not None else infer_schema())
+            try:
+                done = 0
+                for chunk in _chunks(iterate(), chunk_rows):
+                    columns = dict(zip(names, map(list, zip(*chunk))))
+                    writer.write_table(pa.table(columns, schema=writer.schema))
+                    done += len(chunk)
+                    progress(done / max(1, len(rows)))
+            finally:
+                writer.close()
+
+        return self._run_export(write, on_done)
+
+    def _run_export(self, write, on_done):
+        """Run ``write(progress)`` on a worker thread and mirror its progress in a ProgressWindow."""
+        state = {"progress": 0.0, "error": None}
+
+        def target():
+            try:
+                write(lambda value: state.__setitem__("progress", value))
+            except Exception as error:
+                state["error"] = error
+
+        thread = threading.Thread(target=target, daemon=True)
+        self.progress_window = ProgressWindow(self.master)
+        thread.start()
+        self.after(50, self._poll_export, thread, state, on_done)
+        return thread
+
+    def _poll_export(self, thread, state, on_done):
+        if self.progress_window:
+            self.progress_window.set_progress(state["progress"])
+        if thread.is_alive():
+            self.after(50, self._poll_export, thread, state, on_done)
+            return
+        if self.progress_window:
+            self.progress_window.close_progress()
+            self.progress_window = None
+        # Raising here would only reach Tk's error handler, so the outcome is reported instead
+        self.export_error = state["error"]
+        if on_done:
+            on_done(state["error"])
+
+    def _column_index(self, column):
+        """Resolve a column name or 0-based data column number to an internal column index."""
+        if column in self.columns[1:]:
+            return self.columns.index(column, 1)
+        if isinstance(column, int) and 0 <= column < len(self.columns) - 1:
+            return column + 1
+        raise ValueError(f"Unknown column: {column!r}")
+
+    def set_filter(self, column, predicate):
+        """
+        Show only the rows whose value in ``column`` satisfies ``predicate``.
+
+        Filters on different columns are combined with AND. The predicate is
+        evaluated once over the whole column to build a boolean mask.
+
+        :param column: A column name or 0-based column number.
+        :param predicate: A callable taking a cell value and returning a bool.
+        """
+        self.filters[self._column_index(column)] = predicate
+        self._refresh_view()
+
+    def clear_filter(self, column=None):
+        """Remove the filter on ``column``, or every filter if no column is given."""
+        if column is None:
+            self.filters.clear()
+        else:
+            self.filters.pop(self._column_index(column), None)
+        self._refresh_view()
+
+    def add_format_rule(self, column, rule):
+        """
+        Add a conditional formatting rule to ``column``.
+
+        Rules are evaluated over the whole column when it is first painted and
+        again only when its data changes; rules added later take precedence
+        where several match.
+
+        :param column: A column name or 0-based column number.
+        :param rule: A rule from :mod:`altkinter.formatting`, e.g. ``ColorScale("#ffffff", "#f8696b")``.
+        """
+        col = self._column_index(column)
+        self.format_rules.setdefault(col, []).append(rule)
+        self._style_codes.pop(col, None)
+        if self.col_widths:
+            self._paint_visible(text=True)
+
+    def clear_format_rules(self, column=None):
+        """Remove the format rules of ``column``, or of every column if none is given."""
+        if column is None:
+            self.format_rules.clear()
+            self._style_codes.clear()
+        else:
+            col = self._column_index(column)
+            self.format_rules.pop(col, None)
+            self._style_codes.pop(col, None)
+        if self.col_widths:
+            self._paint_visible(text=True)
+
+    def _filtered_rows(self):
+        """Return the data rows passing every filter, combining the per-column masks."""
+        if self._base_view is None:
+            mask = None
+            for col, predicate in self.filters.items():
+                col_mask = list(map(bool, map(predicate, self._column_values(col))))
+                mask = col_mask if mask is None else [a and b for a, b in zip(mask, col_mask)]
+            rows = range(len(self.data))
+            self._base_view = rows if mask is None else list(compress(rows, mask))
+        return self._base_view
+
+    def search(self, text, columns=None):
+        """
+        Narrow the view to rows containing ``text`` (case-insensitive) in any of ``columns``.
+
+        When the new text contains the previous one, only the rows that already
+        matched are scanned again, so typing narrows the result incrementally.
+
+        :param text: The substring to look for; an empty string clears the search.
+        :param columns: Column names or 0-based numbers to search; all columns by default.
+        :return: The number of matching rows.
+        """
+        text = str(text).lower()
+        cols = [self._column_index(c) for c in columns] if columns else list(range(1, len(self.columns)))
+        if text == self.search_text and cols == self.search_columns:
+            return len(self.view)
+        self._run_search(text, cols)
+        self._set_view()
+        return len(self.view)
+
+    def _run_search(self, text, cols):
+        """Compute ``search_rows`` by OR-ing one substring mask per column."""
+        if not text:
+            self.search_rows = None
+        else:
+            narrowing = (self.search_rows is not None and self.search_text in text
+                         and cols == self.search_columns)
+            candidates = self.search_rows if narrowing else self._filtered_rows()
+            mask = [False] * len(candidates)
+            for col in cols:
+                lower = self._lower_column(col)
+                mask = [m or text in lower[r] for m, r in zip(mask, candidates)]
+            self.search_rows = list(compress(candidates, mask))
+        self.search_text = text
+        self.search_columns = cols
+
+    def clear_search(self):
+        """Clear the quick-search and show every row passing the filters."""
+        self.search("")
+
+    def _refresh_view(self, redraw=True):
+        """Recompute the view after the data or the filters changed."""
+        self._base_view = None
+        self.search_rows = None
+        if self.search_text:
+            self._run_search(self.search_text, self.search_columns)
+        self._set_view(redraw)
+
+    def _data_rows(self):
+        """Return the data rows passing the filters and the quick-search, ignoring grouping."""
+        return self.search_rows if self.search_rows is not None else self._filtered_rows()
+
+    def _display_rows(self):
+        """Return the view: the data rows, or group summary rows followed by the members of expanded groups."""
+        rows = self._data_rows()
+        if self.group_column is None:
+            return rows
+        if self._group_index is None:
+            self._build_groups(rows)
+        if self._group_view is None:
+            view = []
+            for g, key in enumerate(self._group_keys):
+                view.append(~g)
+                if key in self._expanded:
+                    view.extend(self._group_index[key])
+            self._group_view = view
+        return self._group_view
+
+    def _set_view(self, redraw=True):
+        self._invalidate_groups()
+        self.view = self._display_rows()
+        self.match_pos = None
+        self._match_row = None
+        self._hover_cell = None
+        self._reset_cursor()
+        self._schedule_footer()
+        if redraw and self.col_widths:
+            self._redraw_rows()
+
+    def next_match(self):
+        """Move to the next row matching the quick-search and return its data row index."""
+        return self._step_match(1)
+
+    def previous_match(self):
+        """Move to the previous row matching the quick-search and return its data row index."""
+        return self._step_match(-1)
+
+    def _step_match(self, step):
+        if self.search_rows is None or not self.view:
+            return None
+        if self.match_pos is None:
+            self.match_pos = 0 if step > 0 else len(self.view) - 1
+        else:
+            self.match_pos = (self.match_pos + step) % len(self.view)
+        previous, self._match_row = self._match_row, self.view[self.match_pos]
+        self.see(self.match_pos)
+        for row in (previous, self._match_row):
+            for col in range(1, len(self.columns)):
+                self._paint_cell(row, col)
+        return self._match_row
+
+    def see(self, pos):
+        """Scroll vertically so that view position ``pos`` is visible."""
+        first, last = self._visible_range()
+        if first < pos < last - 1:
+            return
+        height = len(self.view) * self.row_stride
+        self.canvas.yview_moveto(pos * self.row_stride / height)
+
+    def attach_search_entry(self, entry, columns=None, delay=150):
+        """
+        Drive the quick-search from a CustomEntry.
+
+        The search runs ``delay`` milliseconds after the last keystroke;
+        Return jumps to the next match and Shift+Return to the previous one.
+
+        :param entry: A CustomEntry used as the search box.
+        :param columns: Column names or 0-based numbers to search; all columns by default.
+        :param delay: Debounce delay in milliseconds.
+        """
+        def on_key(event):
+            if event.keysym in ("Return", "KP_Enter", "Shift_L", "Shift_R"):
+                return
+            if self._search_after:
+                self.after_cancel(self._search_after)
+            self._search_after = self.after(delay, run_search)
+
+        def run_search():
+            self._search_after = None
+            self.search(entry.get(), columns)
+
+        entry.entry.bind("<KeyRelease>", on_key, add="+")
+        entry.entry.bind("<Return>", lambda e: self.next_match(), add="+")
+        entry.entry.bind("<Shift-Return>", lambda e: self.previous_match(), add="+")
+
+    def group_by(self, column, aggregate="sum", expanded=False):
+        """
+        Group the rows by the values of ``column``.
+
+        The group index is built in one pass over the rows in view. Each group
+        is shown as a summary row with its key and size, and ``aggregate`` of
+        the other numeric columns; its rows are only added to the view when
+        the group is expanded.
+
+        :param column: A column name or 0-based column number.
+        :param aggregate: One of ``AGGREGATES``, shown in the summary rows.
+        :param expanded: Start with every group expanded.
+        """
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {aggregate!r}")
+        self.group_column = self._column_index(column)
+        self.group_aggregate = aggregate
+        self._expanded = set()
+        self._set_view()
+        if expanded:
+            self.expand_all()
+
+    def ungroup(self):
+        """Leave grouping mode and show the rows ungrouped."""
+        self.group_column = None
+        self._expanded = set()
+        self._set_view()
+
+    def expand_group(self, key):
+        """Show the rows of the group with ``key``."""
+        self._expanded.add(key)
+        self._regroup()
+
+    def collapse_group(self, key):
+        """Hide the rows of the group with ``key`` behind its summary row."""
+        self._expanded.discard(key)
+        self._regroup()
+
+    def expand_all(self):
+        self._expanded = set(self._group_keys)
+        self._regroup()
+
+    def collapse_all(self):
+        self._expanded = set()
+        self._regroup()
+
+    def _toggle_group(self, g):
+        key = self._group_keys[g]
+        if key in self._expanded:
+            self.collapse_group(key)
+        else:
+            self.expand_group(key)
+
+    def _regroup(self):
+        """Rebuild the view from the group index after groups were expanded or collapsed."""
+        if self.group_column is None:
+            return
+        self._group_view = None
+        self.view = self._display_rows()
+        self._anchor = self._extent = None
+        if self.cursor is not None and self.cursor[0] >= len(self.view):
+            self._reset_cursor()
+        if self.col_widths:
+            self._redraw_rows(scroll_top=False)
+
+    def _build_groups(self, rows):
+        """Hash ``rows`` into one array of data row indices per key of the group column."""
+        values = self._column_values(self.group_column)
+        index = {}
+        for row in rows:
+            key = values[row]
+            members = index.get(key)
+            if members is None:
+                members = index[key] = array("q")
+            members.append(row)
+        try:
+            self._group_keys = sorted(index)
+        except TypeError:
+            self._group_keys = list(index)
+        self._group_index = index
+        self._group_view = None
+
+    def _extend_groups(self, rows):
+        """Add appended data rows to an existing group index instead of rebuilding it."""
+        values = self._column_values(self.group_column)
+        for row in rows:
+            key = values[row]
+            members = self._group_index.get(key)
+            if members is None:
+                members = self._group_index[key] = array("q")
+                try:
+                    self._group_keys.insert(bisect_left(self._group_keys, key), key)
+                except TypeError:
+                    self._group_keys.append(key)
+            members.append(row)
+            self._group_cache.pop(key, None)
+        self._group_view = None
+
+    def _invalidate_groups(self):
+        self._group_index = None
+        self._group_view = None
+        self._group_cache.clear()
+
+    def _group_value(self, g, col):
+        """Return the summary text of group ``g`` in column ``col``, aggregating the group lazily."""
+        key = self._group_keys[g]
+        if col == 0:
+            return "-" if key in self._expanded else "+"
+        members = self._group_index[key]
+        if col == self.group_column:
+            return f"{key} ({len(members)})"
+        texts = self._group_cache.setdefault(key, {})
+        text = texts.get(col)
+        if text is None:
+            values = self._column_values(col)
+            summary = _summarize([values[row] for row in members])
+            name = self.group_aggregate
+            text = texts[col] = self._format_summary(col, name, summary[name]) if summary["count"] else ""
+        return text
+
+    def _store(self, records):
+        """Wrap data records in the ring buffer while streaming, else return them as a list."""
+        return deque(records, maxlen=self.data.maxlen) if self.streaming else records
+
+    def _load_rows(self, rows):
+        """Number data rows and store them as row lists, or column-wise when ``compact`` is set."""
+        if self.compact:
+            return ColumnStore(len(self.columns), rows, maxlen=self.data.maxlen if self.streaming else None)
+        return self._store([[i + 1] + list(row) for i, row in enumerate(rows)])
+
+    def _next_row_number(self):
+        if self._row_numbers and self.data:
+            return self.data[-1][0] + 1
+        return len(self.data) + 1
+
+    def start_streaming(self, max_rows=100000, frame_ms=None, follow_tail=True):
+        """
+        Switch the table to append-only streaming mode.
+
+        Rows pushed with :meth:`push_rows` are appended once per frame to a
+        ring buffer holding at most ``max_rows`` rows; the oldest rows are
+        evicted. While the view is scrolled to the bottom it follows the tail.
+
+        :param max_rows: Maximum number of rows kept.
+        :param frame_ms: Interval in milliseconds between appends and repaints.
+        :param follow_tail: Keep the newest rows in view unless the user scrolled away.
+        """
+        if frame_ms is not None:
+            self.frame_ms = frame_ms
+        self.follow_tail = follow_tail
+        self.streaming = True
+        trimmed = len(self.data) > max_rows
+        if isinstance(self.data, ColumnStore):
+            self.data.maxlen = max_rows
+            self.data.trim()
+        else:
+            self.data = deque(self.data, maxlen=max_rows)
+        if trimmed:
+            self._data_changed()
+        if self._stream_after is None:
+            self._stream_after = self.after(self.frame_ms, self._flush_stream)
+
+    def stop_streaming(self):
+        """Append any rows still queued and leave streaming mode."""
+        if self._stream_after is not None:
+            self.after_cancel(self._stream_after)
+            self._stream_after = None
+        self._flush_stream()
+        self.streaming = False
+        if isinstance(self.data, ColumnStore):
+            self.data.maxlen = None
+        else:
+            self.data = list(self.data)
+
+    def push_rows(self, rows):
+        """
+        Queue a batch of rows to be appended on the next frame.
+
+        Safe to call from any thread; no Tk calls are made here.
+
+        :param rows: An iterable of data rows (without the row-number column).
+        """
+        self._pending_rows.append(list(rows))
+
+    def _flush_stream(self):
+        """Append every batch queued since the last frame in a single update."""
+        self._stream_after = None
+        rows = []
+        while self._pending_rows:
+            rows.extend(self._pending_rows.popleft())
+        if rows:
+            self._append_batch(rows)
+        if self.streaming:
+            self._stream_after = self.after(self.frame_ms, self._flush_stream)
+
+    def _append_batch(self, rows):
+        """Append rows to the ring buffer, shifting cached views by the evicted count."""
+        maxlen = self.data.maxlen
+        number = self._next_row_number()
+        if len(rows) > maxlen:
+            number += len(rows) - maxlen
+            rows = rows[-maxlen:]
+        records = [[n] + list(values) for n, values in zip(count(number), rows)]
+        evicted = max(0, len(self.data) + len(records) - maxlen)
+
+        base = self._filtered_rows() if self.filters else None
+        if self._stats:
+            self._update_stats(records, list(islice(self.data, evicted)))
+        self._schedule_footer()
+        if self.col_widths:
+            at_tail = self.canvas.yview()[1] >= 0.999
+            top = self.canvas.canvasy(0)
+
+        self.data.extend(records)
+        first_new = len(self.data) - len(records)
+        for col, cached in self._column_cache.items():
+            del cached[:evicted]
+            cached.extend(record[col] for record in records)
+        for col, cached in self._lower_cache.items():
+            del cached[:evicted]
+            cached.extend(str(record[col]).lower() for record in records)
+        for col, codes in list(self._style_codes.items()):
+            del codes[:evicted]
+            self._restyle(col, [record[col] for record in records])
+        self._key_rows = None
+
+        dropped = evicted
+        new_rows = range(first_new, len(self.data))
+        if base is not None:
+            before = len(base)
+            base = self._shift_rows(base, evicted)
+            dropped = before - len(base)
+            base.extend(row for row in new_rows if self._passes_filters(row))
+            self._base_view = base
+        else:
+            # Without filters the base view is every row; it is rebuilt on demand, also under a search
+            self._base_view = None
+        if self.search_rows is not None:
+            before = len(self.search_rows)
+            self.search_rows = self._shift_rows(self.search_rows, evicted)
+            dropped = before - len(self.search_rows)
+            self.search_rows.extend(row for row in new_rows
+                                    if self._passes_filters(row) and self._matches_search(row))
+        if self.group_column is not None:
+            if evicted or base is not None or self.search_rows is not None or self._group_index is None:
+                self._invalidate_groups()
+            else:
+                self._extend_groups(range(first_new, len(self.data)))
+        self.view = self._display_rows()
+
+        if evicted:
+            self._text_cache.clear()
+            self.selected_indices = {(row - evicted, col) for row, col in self.selected_indices if row >= evicted}
+            self._flashing = {(row - evicted, col) for row, col in self._flashing if row >= evicted}
+            self._dirty = {(row - evicted, col): old for (row, col), old in self._dirty.items() if row >= evicted}
+            self._undo.clear()
+            self._redo.clear()
+            self.match_pos = None
+            self._match_row = None
+            self._hover_cell = None
+            self._reset_cursor()
+
+        if not self.col_widths:
+            return
+        self._update_scrollregion()
+        if at_tail and self.follow_tail:
+            self.canvas.yview_moveto(1.0)
+        elif dropped and self.view:
+            height = len(self.view) * self.row_stride
+            self.canvas.yview_moveto(max(0, top - dropped * self.row_stride) / height)
+        if evicted or self.group_column is not None:
+            self._redraw_rows(scroll_top=False)
+        else:
+            self._render_visible()
+
+    @staticmethod
+    def _shift_rows(rows, evicted):
+        """Drop evicted rows from a sorted list of row indices and renumber the rest."""
+        if not evicted:
+            return rows
+        return [row - evicted for row in rows[bisect_left(rows, evicted):]]
+
+    def _data_changed(self):
+        """Drop cached column views and selection state, then rebuild the view and redraw."""
+        self._invalidate_caches()
+        self._stats.clear()
+        self.selected_indices.clear()
+        self._flashing.clear()
+        self._hide_editor()
+        self._clear_edits()
+        self._refresh_view(redraw=False)
         self._draw_table()
-        
+
+    def set_data(self, data, key=None, flash=False):
+        """
+        Update the table data.
+
+        Without ``key`` the table is rebuilt. With ``key`` the new data is
+        diffed against the current rows by that column and only the delta is
+        applied: changed cells are repainted in place, new keys are appended
+        and missing keys are removed.
+
+        :param data: A list of data rows.
+        :param key: Optional key column name or 0-based number.
+        :param flash: Briefly highlight the changed cells.
+        """
+        if key is None or not self.data:
+            self.data = self._load_rows(data)
+            self._row_numbers = True
+            self._data_changed()
+        else:
+            self.apply_diff(*self.diff_rows(data, key, complete=True), flash=flash)
+
+    def _key_index(self, key_col):
+        """Return (building it once) a dict mapping key column values to data row indices."""
+        if self._key_rows is None or self._key_col != key_col:
+            self._key_rows = {value: row for row, value in enumerate(self._column_values(key_col))}
+            self._key_col = key_col
+        return self._key_rows
+
+    def diff_rows(self, rows, key, complete=False):
+        """
+        Compare ``rows`` with the current data by ``key`` and return the delta.
+
+        :param rows: Data rows (without the row-number column).
+        :param key: The key column name or 0-based number.
+        :param complete: If True, ``rows`` is the whole new dataset and keys missing from it are removed.
+        :return: A tuple ``(added, changed, removed)`` of new rows, ``(row, col, value)``
+                 cell changes with 0-based columns, and data row indices to remove.
+        """
+        key_col = self._column_index(key)
+        index = self._key_index(key_col)
+        added, changed, seen = [], [], set()
+        for values in rows:
+            values = list(values)
+            row = index.get(values[key_col - 1])
+            if row is None:
+                added.append(values)
+                continue
+            seen.add(row)
+            current = self._row_values(row)
+            if current != values:
+                changed.extend((row, col, new) for col, (old, new) in enumerate(zip(current, values))
+                               if old != new)
+        removed = [row for row in index.values() if row not in seen] if complete else []
+        return added, changed, removed
+
+    def update_rows(self, rows, key, flash=False):
+        """
+        Insert or update rows by ``key``, repainting only the cells whose value changed.
+
+        :param rows: Data rows (without the row-number column).
+        :param key: The key column name or 0-based number.
+        :param flash: Briefly highlight the changed cells.
+        :return: The ``(added, changed, removed)`` delta that was applied.
+        """
+        delta = self.diff_rows(rows, key)
+        self.apply_diff(*delta, flash=flash)
+        return delta
+
+    def apply_diff(self, added=(), changed=(), removed=(), flash=False):
+        """
+        Apply a delta as returned by :meth:`diff_rows`.
+
+        Cell changes and appended rows cost time proportional to their number;
+        removals renumber the remaining rows and repaint the visible window.
+
+        :param added: New data rows to append.
+        :param changed: ``(row, col, value)`` cell changes with 0-based columns.
+        :param removed: Data row indices to remove.
+        :param flash: Briefly highlight the changed cells.
+        """
+        if self.streaming and added:
+            # Appends go through the ring buffer so evictions keep the caches aligned
+            self.apply_diff(changed=changed, removed=removed, flash=flash)
+            self._append_batch(list(added))
+            return
+        self._schedule_footer()
+        cells = []
+        for row, col, value in changed:
+            self._set_cell(row, col + 1, value)
+            cells.append((row, col + 1))
+        touched = {row for row, _ in cells}
+        for values in added:
+            touched.add(self._append_row(values))
+
+        if removed:
+            self._remove_rows(removed)
+            return
+
+        view_changed = False
+        if self.filters or self.search_rows is not None:
+            for row in sorted(touched):
+                view_changed |= self._place_row(row)
+        if self.group_column is not None and touched:
+            if cells or self.filters or self.search_rows is not None or self._group_index is None:
+                self._invalidate_groups()
+            else:
+                self._extend_groups(sorted(touched))
+            view_changed = True
+        self.view = self._display_rows()
+
+        if not self.col_widths:
+            return
+        if view_changed:
+            self.match_pos = None
+            self._reset_cursor()
+            self._redraw_rows(scroll_top=False)
+        else:
+            for row, col in cells:
+                self._paint_text(row, col)
+                if col in self.format_rules:
+                    self._paint_cell(row, col)
+            if any(col in self.format_rules and col not in self._style_codes for col in {col for _, col in cells}):
+                self._paint_visible(text=True)
+            if added:
+                self._update_scrollregion()
+                self._render_visible()
+        if flash and cells:
+            self._flash_cells(cells)
+
+    def _set_cell(self, row, col, value):
+        """Store a new cell value and keep the cached column views in step."""
+        stats = self._stats.get(col)
+        if stats is not None:
+            stats.remove(self.data[row][col])
+            stats.add(value)
+        self.data[row][col] = value
+        if col in self._column_cache:
+            self._column_cache[col][row] = value
+        if col in self._lower_cache:
+            self._lower_cache[col][row] = str(value).lower()
+        self._text_cache.pop((row, col), None)
+        self._restyle(col, [value], row)
+        if col == self._key_col:
+            self._key_rows = None
+
+    def _append_row(self, values):
+        """Append a data row, extending the cached column views; return its index."""
+        row = len(self.data)
+        record = [self._next_row_number()] + list(values)
+        self.data.append(record)
+        self._update_stats(added=[record])
+        for col, cached in self._column_cache.items():
+            cached.append(record[col])
+        for col, cached in self._lower_cache.items():
+            cached.append(str(record[col]).lower())
+        for col in list(self._style_codes):
+            self._restyle(col, [record[col]])
+        if self._key_rows is not None:
+            self._key_rows[record[self._key_col]] = row
+        if not self.filters:
+            self._base_view = None
+        return row
+
+    def _passes_filters(self, row):
+        return all(predicate(self._cell_value(row, col)) for col, predicate in self.filters.items())
+
+    def _matches_search(self, row):
+        return any(self.search_text in str(self._cell_value(row, col)).lower() for col in self.search_columns)
+
+    def _place_row(self, row):
+        """Add or drop ``row`` in the filtered and searched views; return True if the view changed."""
+        changed = False
+        passes = self._passes_filters(row)
+        if self.filters:
+            changed |= self._set_member(self._filtered_rows(), row, passes)
+        if self.search_rows is not None:
+            changed |= self._set_member(self.search_rows, row, passes and self._matches_search(row))
+        return changed
+
+    @staticmethod
+    def _set_member(rows, row, member):
+        """Insert or remove ``row`` in a sorted list of row indices; return True if it changed."""
+        pos = bisect_left(rows, row)
+        present = pos < len(rows) and rows[pos] == row
+        if member and not present:
+            rows.insert(pos, row)
+        elif present and not member:
+            del rows[pos]
+        else:
+            return False
+        return True
+
+    def _remove_rows(self, removed):
+        """Remove data rows, remapping the selection, and repaint the visible window."""
+        removed = set(removed)
+        keep = [row for row in range(len(self.data)) if row not in removed]
+        remap = {old: new for new, old in enumerate(keep)}
+        self._update_stats(removed=[self.data[row] for row in removed])
+        if isinstance(self.data, ColumnStore):
+            self.data = self.data.take(keep)
+        else:
+            self.data = self._store([record for row, record in enumerate(self.data) if row not in removed])
+        if self._row_numbers and not isinstance(self.data, ColumnStore):
+            for number, record in enumerate(self.data, 1):
+                record[0] = number
+        self.selected_indices = {(remap[row], col) for row, col in self.selected_indices if row in remap}
+        self._flashing = {(remap[row], col) for row, col in self._flashing if row in remap}
+        self._dirty = {(remap[row], col): old for (row, col), old in self._dirty.items() if row in remap}
+        self._undo.clear()
+        self._redo.clear()
+        self._invalidate_caches()
+        self._refresh_view(redraw=False)
+        if self.col_widths:
+            self._redraw_rows(scroll_top=False)
+
+    def _flash_cells(self, cells):
+        """Highlight cells with the accent colour for ``flash_ms`` milliseconds."""
+        self._flashing.update(cells)
+        for row, col in cells:
+            self._paint_cell(row, col)
+        if self._flash_after:
+            self.after_cancel(self._flash_after)
+        self._flash_after = self.after(self.flash_ms, self._end_flash)
+
+    def _end_flash(self):
+        self._flash_after = None
+        cells, self._flashing = self._flashing, set()
+        for row, col in cells:
+            self._paint_cell(row, col)
+
     def set_columns(self, columns):
         """Set new column names and redraw the table."""
         self.columns = [""] + columns
-        self._draw_table()
-        
+        self._user_widths.clear()
+        self.filters.clear()
+        self.format_rules.clear()
+        self.formatters.clear()
+        self.group_column = None
+        self.search_text = ""
+        self._data_changed()
+
     def set_dataframe_from_csv(self, csv_file):
         """Set a pandas DataFrame from a CSV file as the table data."""
         import pandas as pd
         dataframe = pd.read_csv(csv_file)
         self.set_dataframe(dataframe)
-        
+
     def get_column_headers(self):
         """Return the current column names."""
         return self.columns[1:]
@@ -304,26 +2346,55 @@ class CustomTableView(tk.Frame):
     def get_data(self):
         """Return the current table data."""
         return [row[1:] for row in self.data]
-    
+
     def get_row_headers(self):
         """Return the current row names."""
         return [row[0] for row in self.data]
-    
+
+    def get_view(self):
+        """Return the data row indices currently shown, in display order, skipping group rows."""
+        return [row for row in self.view if row >= 0]
+
     def set_dataframe(self, dataframe):
         """Set a pandas DataFrame as the table data."""
         self.columns = [""] + list(dataframe.columns)
-        self.data = dataframe.reset_index().values.tolist()
-        self._draw_table()
+        self.data = self._store(dataframe.reset_index().values.tolist())
+        self._row_numbers = False
+        self._user_widths.clear()
+        self.filters.clear()
+        self.format_rules.clear()
+        self.formatters.clear()
+        self.group_column = None
+        self.search_text = ""
+        self._data_changed()
 
     def add_row(self, row_data):
         """Add a new row to the table."""
-        self.data.append([len(self.data) + 1] + row_data)
-        self._draw_table()
+        self.apply_diff(added=[row_data])
 
     def clear_data(self):
         """Clear all table data."""
-        self.data = []
-        self._draw_table()
+        self.data = self._load_rows([]) if self._row_numbers else self._store([])
+        self._data_changed()
+
+    def memory_usage(self):
+        """
+        Return the approximate memory held by the table data, in bytes.
+
+        Objects shared between cells, such as repeated strings, are counted
+        once per column.
+
+        :return: A dict with ``columns`` (bytes per column name, the row-number column
+                 under ``""``), ``rows`` (bytes of the per-row containers) and ``total``.
+        """
+        if isinstance(self.data, ColumnStore):
+            sizes = self.data.memory_usage()
+            rows = 0
+        else:
+            sizes = [_object_size(self._column_values(col)) for col in range(len(self.columns))]
+            rows = sys.getsizeof(self.data) + sum(map(sys.getsizeof, self.data))
+        columns = dict(zip(map(str, self.columns), sizes))
+        return {"columns": columns, "rows": rows, "total": rows + sum(sizes)}
 
     def on_master_move(self, event):
         """Update the position of the progress windoe when the master window moves."""
@@ -338,22 +2409,233 @@ class CustomTableView(tk.Frame):
         popup_x = master_x + (master_width - popup_width) // 2
         popup_y = master_y + (master_height - popup_height) // 2
         self.progress_window.window.geometry(f"{popup_width}x{popup_height}+{popup_x}+{popup_y}")
-        
+
+def _chunks(iterable, size):
+    """Yield lists of up to ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+class ScrollGroup:
+    """
+    Scroll several CustomTableViews together and optionally link their selections.
+
+    A member that scrolls reports its top row and left pixel offset; the
+    group moves every other member there in one update per frame, however
+    many scroll events arrived. Each member's position after such a move is
+    remembered, so the scroll callbacks it triggers are recognised as echoes
+    and never fed back into the group.
+    """
+
+    def __init__(self, *tables, horizontal=True, key=None, frame_ms=16):
+        """
+        :param tables: The tables to link.
+        :param horizontal: Also keep the horizontal positions in step.
+        :param key: Column name shared by the tables; if given, selections are linked by this row key.
+        :param frame_ms: Interval in milliseconds at which moves are propagated.
+        """
+        self.members = []
+        self.horizontal = horizontal
+        self.key = key
+        self.frame_ms = frame_ms
+        self._position = (0.0, 0.0)
+        self._known = {}
+        self._source = None
+        self._scroll_after = None
+        self._selection_source = None
+        self._selection_after = None
+        for table in tables:
+            self.add(table)
+
+    def add(self, table):
+        """Add a table to the group, taking it out of any other group."""
+        if table._scroll_group is not None:
+            table._scroll_group.remove(table)
+        table._scroll_group = self
+        self.members.append(table)
+        if len(self.members) > 1:
+            # Bring the newcomer to the group's position once it has been laid out
+            table.after_idle(self._join, table)
+
+    def _join(self, table):
+        if table in self.members and table.winfo_exists():
+            top, left = self._position
+            self._known[table] = table._scroll_to(top, left if self.horizontal else None)
+
+    def remove(self, table):
+        """Remove a table from the group."""
+        self.members.remove(table)
+        self._known.pop(table, None)
+        table._scroll_group = None
+
+    def link_selection(self, key):
+        """Mirror selections between members on rows with equal values in column ``key``."""
+        self.key = key
+
+    def _moved(self, table, top=None, left=None):
+        """Record a scroll of ``table`` and schedule one propagation for the frame."""
+        known_top, known_left = self._known.get(table, (None, None))
+        group_top, group_left = self._position
+        moved = False
+        if top is not None and (known_top is None or abs(top - known_top) >= 0.5):
+            known_top = group_top = top
+            moved = True
+        if left is not None and self.horizontal and (known_left is None or abs(left - known_left) >= 1):
+            known_left = group_left = left
+            moved = True
+        if not moved:
+            return
+        self._known[table] = (known_top, known_left)
+        self._position = (group_top, group_left)
+        self._source = table
+        if self._scroll_after is None:
+            self._scroll_after = table.after(self.frame_ms, self._sync_scroll)
+
+    def _sync_scroll(self):
+        self._scroll_after = None
+        top, left = self._position
+        for table in self.members:
+            if table is not self._source and table.winfo_exists():
+                self._known[table] = table._scroll_to(top, left if self.horizontal else None)
+
+    def _selected(self, table):
+        if self.key is None:
+            return
+        self._selection_source = table
+        if self._selection_after is None:
+            self._selection_after = table.after(self.frame_ms, self._sync_selection)
+
+    def _sync_selection(self):
+        """Copy the source's selection to the other members by row key and column name."""
+        self._selection_after = None
+        source = self._selection_source
+        if self.key not in source.columns[1:]:
+            return
+        keys = source._column_values(source._column_index(self.key))
+        selected = {(keys[row], source.columns[col]) for row, col in source.selected_indices}
+        for table in self.members:
+            # Members without the key column have no rows to match and keep their own selection
+            if table is source or not table.winfo_exists() or self.key not in table.columns[1:]:
+                continue
+            rows = table._key_index(table._column_index(self.key))
+            columns = {name: col for col, name in enumerate(table.columns) if col > 0}
+            table._set_selection((rows[key], columns[name]) for key, name in selected
+                                 if key in rows and name in columns)
+
+def _summary(count, total, mean, var, low, high):
+    return {"sum": total, "mean": mean, "min": low, "max": high, "count": count,
+            "var": var, "std": None if var is None else math.sqrt(var)}
+
+def _summarize(values):
+    """Aggregate the numeric values of a column slice with built-in reductions."""
+    numbers = [value for value in values if _is_finite(value)]
+    n = len(numbers)
+    if not n:
+        return _summary(0, 0, None, None, None, None)
+    total = math.fsum(numbers)
+    mean = total / n
+    var = math.fsum([(x - mean) ** 2 for x in numbers]) / (n - 1) if n > 1 else 0.0
+    return _summary(n, total, mean, var, min(numbers), max(numbers))
+
+class _RunningStats:
+    """
+    Running aggregates of the numeric values of a column.
+
+    Count, sum, mean and variance (Welford's method) update in O(1) per
+    added or removed value; minimum and maximum are kept in heaps with lazy
+    deletion, O(log n) per value.
+    """
+
+    def __init__(self, values=()):
+        numbers = [value for value in values if _is_finite(value)]
+        summary = _summarize(numbers)
+        self.count = summary["count"]
+        self.total = summary["sum"]
+        self.mean = summary["mean"] or 0.0
+        self._m2 = (summary["var"] or 0.0) * max(self.count - 1, 0)
+        self._low = list(numbers)
+        self._high = [-x for x in numbers]
+        heapify(self._low)
+        heapify(self._high)
+        self._low_removed = Counter()
+        self._high_removed = Counter()
+
+    def add(self, value):
+        if not _is_finite(value):
+            return
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        heappush(self._low, value)
+        heappush(self._high, -value)
+
+    def remove(self, value):
+        if not _is_finite(value):
+            return
+        if self.count <= 1:
+            self.__init__()
+            return
+        self.count -= 1
+        self.total -= value
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 -= delta * (value - self.mean)
+        self._low_removed[value] += 1
+        self._high_removed[-value] += 1
+        if len(self._low) > 2 * self.count + 64:
+            self._low = self._compact(self._low, self._low_removed)
+            self._high = self._compact(self._high, self._high_removed)
+
+    @staticmethod
+    def _compact(heap, removed):
+        """Drop the values pending deletion from a heap in one pass."""
+        live = []
+        for value in heap:
+            if removed[value]:
+                removed[value] -= 1
+            else:
+                live.append(value)
+        removed.clear()
+        heapify(live)
+        return live
+
+    @staticmethod
+    def _top(heap, removed):
+        while heap and removed[heap[0]]:
+            removed[heappop(heap)] -= 1
+        return heap[0] if heap else None
+
+    def summary(self):
+        if not self.count:
+            return _summary(0, 0, None, None, None, None)
+        var = max(self._m2, 0.0) / (self.count - 1) if self.count > 1 else 0.0
+        return _summary(self.count, self.total, self.mean, var,
+                        self._top(self._low, self._low_removed), -self._top(self._high, self._high_removed))
+
 if __name__ == "__main__":
     from .altk import Tk
+    from .formatting import RegexMatch
     import pandas as pd
 
     root = Tk(theme_mode="solarized-dark")
     root.title("Custom TableView Demo")
     root.geometry("600x400")
 
+    search_box = CustomEntry(root, placeholder_text="Search...")
+    search_box.pack(padx=10, pady=(10, 0), anchor="w")
+
     columns = [f'col {i}' for i in range(10)]
     index  = [f'row {i}' for i in range(100)]
     data = [[f'cell_{(r)*len(columns) + c+1}' for c in range(len(columns))] for r in range(len(index))]
     dataframe = pd.DataFrame(data, columns=columns, index=index)
 
     table = CustomTableView(root,
-                            columns=columns,    
+                            columns=columns,
                             dataframe=dataframe,
                             column_width=150,
                             row_height=10,
@@ -362,6 +2644,9 @@ if __name__ == "__main__":
                             autofit_rows=True,
                             text_alignment='left')
     table.pack(fill="both", expand=True, padx=10, pady=10)
+    table.attach_search_entry(search_box)
+    table.add_format_rule('col 0', RegexMatch(r'7$', background=root.theme.active))
+    table.show_footer(("count",))
 
     def show_selected():
         print("Selected Indices:", table.get_selected_indices())
@@ -370,4 +2655,4 @@ if __name__ == "__main__":
     show_button = CustomButton(root, text="Show Selected", command=show_selected)
     show_button.pack(pady=10)
 
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
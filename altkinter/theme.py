@@ -1,69 +1,222 @@
+import hashlib
+import json
+import tkinter as tk
+import weakref
+from types import MappingProxyType
+from . import sprites
+
+# Colour roles every theme defines; hover, active, border, focus, placeholder and error are derived when omitted
+ROLES = ("background", "widget_bg", "hover", "active", "accent", "border", "focus", "text", "placeholder", "error")
+DEFAULT_FONT = ("Microsoft PhagsPa", 10)
+
+BUILTIN_THEMES = {
+    "dark": {
+        "background": "#222222", "widget_bg": "#2b2b2b", "hover": "#3c3c3c", "active": "#1a1a1a",
+        "accent": "#4da6ff", "border": "#3c3c3c", "focus": "#5e5e5e", "text": "#ffffff", "placeholder": "#777777",
+    },
+    "light": {
+        "background": "#f0f0f0", "widget_bg": "#ffffff", "hover": "#e0e0e0", "active": "#cccccc",
+        "accent": "#007aff", "border": "#cccccc", "focus": "#888888", "text": "#000000", "placeholder": "#aaaaaa",
+    },
+    "solarized-dark": {
+        "background": "#002b36", "widget_bg": "#003847", "hover": "#405c63", "active": "#00303a",
+        "accent": "#b58900", "border": "#4a6a71", "focus": "#56747b", "text": "#ffffff", "placeholder": "#3c5055",
+    },
+    "solarized-light": {
+        "background": "#fdf6e3", "widget_bg": "#f5e8d2", "hover": "#d6cfc4", "active": "#e9ddc7",
+        "accent": "#b58900", "border": "#a8b0ad", "focus": "#8a9997", "text": "#657b83", "placeholder": "#7a8a88",
+    },
+    "cyborg": {
+        "background": "#060606", "widget_bg": "#2a2a2a", "hover": "#3e3e3e", "active": "#1c1c1c",
+        "accent": "#2a9fd6", "border": "#3e3e3e", "focus": "#4e4e4e", "text": "#ffffff", "placeholder": "#6c757d",
+    },
+    "flatly": {
+        "background": "#ecf0f1", "widget_bg": "#ffffff", "hover": "#d5d8dc", "active": "#bdc3c7",
+        "accent": "#18bc9c", "border": "#bdc3c7", "focus": "#95a5a6", "text": "#2c3e50", "placeholder": "#7f8c8d",
+    },
+}
+
+_palettes = {}
+
+
+def _rgb(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
+
+
+def _hex(rgb):
+    return "#%02x%02x%02x" % tuple(round(min(max(c, 0.0), 1.0) * 255) for c in rgb)
+
+
+def _mix(start, end, t):
+    return _hex(a + (b - a) * t for a, b in zip(_rgb(start), _rgb(end)))
+
+
+def _is_dark(color):
+    r, g, b = _rgb(color)
+    return 0.299 * r + 0.587 * g + 0.114 * b < 0.5
+
+
+class Palette:
+    """
+    An immutable set of theme colours.
+
+    Every role is kept both as a '#rrggbb' string and, in ``rgb``, as a tuple
+    of floats ready for Cairo. ``key`` is a digest of the colours and font that
+    is stable across runs; palettes hash and compare by it, so render caches
+    can key sprites on the palette itself.
+    """
+
+    __slots__ = ROLES + ("name", "font", "rgb", "key")
+
+    def __init__(self, name, colors, font=DEFAULT_FONT):
+        colors = dict(colors)
+        font = tuple(colors.pop("font", font))
+        missing = {"background", "widget_bg", "accent", "text"}.difference(colors)
+        unknown = set(colors).difference(ROLES)
+        if missing or unknown:
+            raise ValueError(f"Theme {name!r}: missing colours {sorted(missing)}, unknown {sorted(unknown)}")
+        for role, color in colors.items():
+            if len(color.lstrip("#")) != 6:
+                raise ValueError(f"Theme {name!r}: {role} must be a '#rrggbb' colour, got {color!r}")
+        colors = {role: "#%06x" % int(color.lstrip("#"), 16) for role, color in colors.items()}
+        bg, text = colors["widget_bg"], colors["text"]
+        dark = _is_dark(bg)
+        colors.setdefault("hover", _mix(bg, "#ffffff" if dark else "#000000", 0.08))
+        colors.setdefault("active", _mix(bg, "#000000", 0.35 if dark else 0.2))
+        colors.setdefault("border", colors["hover"])
+        colors.setdefault("focus", _mix(colors["border"], text, 0.35))
+        colors.setdefault("placeholder", _mix(text, bg, 0.5))
+        colors.setdefault("error", "#f06a6a" if dark else "#d93636")
+        for role in ROLES:
+            object.__setattr__(self, role, colors[role])
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "font", font)
+        object.__setattr__(self, "rgb", MappingProxyType({role: _rgb(colors[role]) for role in ROLES}))
+        digest = hashlib.sha1(json.dumps([[colors[role] for role in ROLES], list(font)]).encode())
+        object.__setattr__(self, "key", digest.hexdigest()[:16])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Palette is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Palette is immutable")
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, Palette) and other.key == self.key
+
+    def __repr__(self):
+        return f"Palette({self.name!r}, key={self.key!r})"
+
+    def as_dict(self):
+        """Return the colours (and font) as a dict, the shape ``register_theme`` accepts."""
+        return dict({role: getattr(self, role) for role in ROLES}, font=list(self.font))
+
+
+def register_theme(name, colors):
+    """
+    Register a theme under ``name`` and return its Palette.
+
+    :param colors: A mapping of colour roles to '#rrggbb' strings, with an optional ``font``
+        as ``[family, size]``. ``background``, ``widget_bg``, ``accent`` and ``text`` are
+        required; the other roles are derived from them when omitted.
+    """
+    palette = _palettes[name] = colors if isinstance(colors, Palette) else Palette(name, colors)
+    return palette
+
+
+def load_themes(source):
+    """
+    Register every theme in ``source`` and return their names.
+
+    :param source: A dict of theme name to colours, or the path of a JSON or TOML
+        file holding one (TOML files need Python 3.11+ or the ``tomli`` package).
+    """
+    if not isinstance(source, dict):
+        path = str(source)
+        if path.lower().endswith(".toml"):
+            try:
+                import tomllib
+            except ImportError:
+                try:
+                    import tomli as tomllib
+                except ImportError:
+                    raise ImportError("Loading TOML themes requires Python 3.11+ or the tomli package")
+            with open(path, "rb") as file:
+                source = tomllib.load(file)
+        else:
+            with open(path, encoding="utf-8") as file:
+                source = json.load(file)
+    return [register_theme(name, colors).name for name, colors in source.items()]
+
+
+def get_palette(name):
+    try:
+        return _palettes[name]
+    except KeyError:
+        raise ValueError(f"Unsupported theme mode {name!r}: choose one of "
+                         f"{', '.join(map(repr, _palettes))}") from None
+
+
+def theme_names():
+    """Return the names of the registered themes."""
+    return list(_palettes)
+
+
+load_themes(BUILTIN_THEMES)
+
+
 class Theme:
     def __init__(self, mode="dark"):
+        # Widgets repainted on a theme switch; insertion-ordered, so parents repaint before their children
+        self._widgets = weakref.WeakKeyDictionary()
         self.set_mode(mode)
 
+    def register(self, widget):
+        """Repaint ``widget`` (through its ``_apply_theme`` method) whenever this theme switches; held weakly."""
+        self._widgets[widget] = None
+
+    def unregister(self, widget):
+        self._widgets.pop(widget, None)
+
+    def switch(self, mode):
+        """Switch to ``mode`` and repaint every registered widget."""
+        self.set_mode(mode)
+        self.repaint()
+
+    def repaint(self):
+        """
+        Repaint every registered widget in one pass.
+
+        The sprites the widgets need are rendered first, on worker threads and
+        into the shared sprite cache, so the pass itself is only configure calls
+        that Tk redraws together once the event loop is idle again.
+        """
+        widgets = []
+        for widget in list(self._widgets):
+            try:
+                if widget.winfo_exists():
+                    widgets.append(widget)
+            except tk.TclError:
+                pass
+        sprites.prerender([spec for widget in widgets if hasattr(widget, "_theme_sprites")
+                           for spec in widget._theme_sprites()])
+        for widget in widgets:
+            widget._apply_theme()
+
     def set_mode(self, mode):
+        """Take the colours of the registered theme ``mode``; see ``register_theme``."""
+        palette = get_palette(mode)
         self.mode = mode
-        self.font = ("Microsoft PhagsPa", 10)
-        if mode == "dark":
-            self.background = "#222222"
-            self.widget_bg = "#2b2b2b"
-            self.hover = "#3c3c3c"
-            self.active = "#1a1a1a"
-            self.accent = "#4da6ff"
-            self.border = "#3c3c3c"
-            self.focus = "#5e5e5e"
-            self.text = "#ffffff"
-            self.placeholder = "#777777"
-        elif mode == "light":
-            self.background = "#f0f0f0"
-            self.widget_bg = "#ffffff"
-            self.hover = "#e0e0e0"
-            self.active = "#cccccc"
-            self.accent = "#007aff"
-            self.border = "#cccccc"
-            self.focus = "#888888"
-            self.text = "#000000"
-            self.placeholder = "#aaaaaa"
-        elif mode == "solarized-dark":
-            self.background = "#002b36"
-            self.widget_bg = "#003847"
-            self.hover = "#405c63"
-            self.active = "#00303a"
-            self.accent = "#b58900"
-            self.border = "#4a6a71"
-            self.focus = "#56747b"
-            self.text = "#ffffff"
-            self.placeholder = "#3c5055"
-        elif mode == "solarized-light":
-            self.background = "#fdf6e3"
-            self.widget_bg = "#f5e8d2"
-            self.hover = "#d6cfc4"
-            self.active = "#e9ddc7"
-            self.accent = "#b58900"
-            self.border = "#a8b0ad"
-            self.focus = "#8a9997"
-            self.text = "#657b83"
-            self.placeholder = "#7a8a88"
-        elif mode == "cyborg":
-            self.background = "#060606"
-            self.widget_bg = "#2a2a2a"
-            self.hover = "#3e3e3e"
-            self.active = "#1c1c1c"
-            self.accent = "#2a9fd6"
-            self.border = "#3e3e3e"
-            self.focus = "#4e4e4e"
-            self.text = "#ffffff"
-            self.placeholder = "#6c757d"
-        elif mode == "flatly":
-            self.background = "#ecf0f1"
-            self.widget_bg = "#ffffff"
-            self.hover = "#d5d8dc"
-            self.active = "#bdc3c7"
-            self.accent = "#18bc9c"
-            self.border = "#bdc3c7"
-            self.focus = "#95a5a6"
-            self.text = "#2c3e50"
-            self.placeholder = "#7f8c8d"
-        else:
-            raise ValueError("Unsupported theme mode: choose 'dark', 'light', 'solarized-dark', 'solarized-light', 'cyborg', or 'flatly'")
+        self.palette = palette
+        self.font = palette.font
+        for role in ROLES:
+            setattr(self, role, getattr(palette, role))
+
+    @property
+    def rgb(self):
+        """The current colours as float RGB tuples, keyed by role."""
+        return self.palette.rgb
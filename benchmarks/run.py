@@ -0,0 +1,425 @@
+"""Benchmarks for the altkinter widgets.
+
+Measures, for every widget, construction time and Python memory per
+instance, plus the latency of synthesized interactions: button hover, entry
+focus, check-box select-all, combobox dropdown, list-box hover, scroll and
+select-all, progress-bar updates, scrollbar drag, a theme switch over a
+window holding every widget, and table load, scroll and select-all at several
+row counts. Labels have no interactive states, so they are covered by
+construction and the theme switch only.
+
+Run it on a desktop or headless; without a DISPLAY on Linux it starts Xvfb
+itself when Xvfb is installed (``xvfb-run -a`` works too):
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline baseline.json --tolerance 0.25
+
+With ``--baseline``, every timing more than ``tolerance`` slower than the
+baseline is reported and the script exits with status 1.
+"""
+import argparse
+import atexit
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Put the checkout first, so an installed altkinter cannot shadow the code being measured
+sys.path.insert(0, parent_dir)
+
+
+def ensure_display():
+    """Start a private Xvfb server when there is no display to draw on."""
+    if os.environ.get("DISPLAY") or not sys.platform.startswith("linux"):
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        sys.exit("No DISPLAY and Xvfb is not installed; run under xvfb-run or on a desktop.")
+    display = f":{100 + os.getpid() % 400}"
+    server = subprocess.Popen([xvfb, display, "-screen", "0", "1600x1200x24", "-nolisten", "tcp"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    atexit.register(server.terminate)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+
+
+def timed(fn, repeat=5):
+    """Run ``fn`` ``repeat`` times and return the median and minimum wall time in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {"ms": statistics.median(times), "min_ms": min(times), "runs": repeat}
+
+
+def settle(root, table=None):
+    """Process pending events until the table (if any) has nothing left to render."""
+    root.update()
+    for _ in range(10000):
+        if table is None or (table._render_after is None and not table._render_pending):
+            break
+        root.update()
+
+
+class Suite:
+    def __init__(self, sizes, repeat):
+        from altkinter.altk import Tk, Frame
+        self.Frame = Frame
+        self.sizes = sizes
+        self.repeat = repeat
+        self.root = Tk(theme_mode="dark")
+        self.root.geometry("1200x900+0+0")
+        self.root.update()
+        self.results = {}
+
+    def record(self, name, result):
+        self.results[name] = result
+        extra = "".join(f"  {key}={value:,.0f}" for key, value in result.items() if key.endswith("bytes"))
+        print(f"{name:<40} {result.get('ms', 0):10.3f} ms{extra}", flush=True)
+
+    def fresh_frame(self):
+        frame = self.Frame(self.root)
+        frame.pack(fill="both", expand=True)
+        return frame
+
+    # Construction
+
+    def construction(self, count=50):
+        from altkinter import (CustomButton, CustomCheckButton, CustomComboBox, CustomEntry, CustomLabel,
+                               CustomListBox, CustomProgressBar, CustomScrollbar, CustomTableView)
+        factories = {
+            "CustomButton": lambda m, i: CustomButton(m, text=f"Button {i}"),
+            "CustomCheckButton": lambda m, i: CustomCheckButton(m, text=f"Option {i}"),
+            "CustomComboBox": lambda m, i: CustomComboBox(m, values=[f"Option {k}" for k in range(100)]),
+            "CustomEntry": lambda m, i: CustomEntry(m, placeholder_text=f"Field {i}"),
+            "CustomLabel": lambda m, i: CustomLabel(m, text=f"Label {i}"),
+            "CustomListBox": lambda m, i: CustomListBox(m, items=[f"Item {k}" for k in range(100)]),
+            "CustomProgressBar": lambda m, i: CustomProgressBar(m, progress=0.5),
+            "CustomScrollbar": lambda m, i: CustomScrollbar(m),
+            "CustomTableView": lambda m, i: CustomTableView(m, columns=["a", "b", "c"],
+                                                            data=[[r, r * 2, r * 3] for r in range(100)]),
+        }
+        for name, factory in factories.items():
+            per = count if name != "CustomTableView" else max(1, count // 10)
+
+            def build():
+                frame = self.fresh_frame()
+                for i in range(per):
+                    factory(frame, i).pack()
+                settle(self.root)
+                frame.destroy()
+
+            result = timed(build, self.repeat)
+            result["ms"] /= per
+            result["min_ms"] /= per
+
+            # Python-side memory per instance, in a separate untimed pass
+            gc.collect()
+            tracemalloc.start()
+            frame = self.fresh_frame()
+            before = tracemalloc.get_traced_memory()[0]
+            for i in range(per):
+                factory(frame, i).pack()
+            settle(self.root)
+            result["bytes"] = (tracemalloc.get_traced_memory()[0] - before) / per
+            tracemalloc.stop()
+            frame.destroy()
+            self.record(f"construct.{name}", result)
+
+    # Interactions
+
+    def button_hover(self, count=200):
+        from altkinter import CustomButton
+        frame = self.fresh_frame()
+        button = CustomButton(frame, text="Hover me")
+        button.pack()
+        settle(self.root)
+
+        def hover():
+            for _ in range(count):
+                button.on_enter(None)
+                button.on_leave(None)
+            self.root.update_idletasks()
+
+        result = timed(hover, self.repeat)
+        result["ms"] /= 2 * count
+        result["min_ms"] /= 2 * count
+        self.record("interact.button_hover", result)
+        frame.destroy()
+
+    def entry_focus(self, count=200):
+        from altkinter import CustomEntry
+        frame = self.fresh_frame()
+        entry = CustomEntry(frame, placeholder_text="Focus me")
+        entry.pack()
+        settle(self.root)
+
+        def focus():
+            for _ in range(count):
+                entry.on_focus_in(None)
+                entry.on_focus_out(None)
+            self.root.update_idletasks()
+
+        result = timed(focus, self.repeat)
+        result["ms"] /= 2 * count
+        result["min_ms"] /= 2 * count
+        self.record("interact.entry_focus", result)
+        frame.destroy()
+
+    def checkbox_select_all(self, count=300):
+        from altkinter import CheckButtonGroup
+        frame = self.fresh_frame()
+        group = CheckButtonGroup()
+        for i in range(count):
+            group.create(frame, text=f"Option {i}").grid(row=i % 30, column=i // 30)
+        settle(self.root)
+        state = [True]
+
+        def toggle_all():
+            group.set_all(state[0])
+            state[0] = not state[0]
+            self.root.update_idletasks()
+
+        self.record(f"interact.checkbox_select_all.{count}", timed(toggle_all, self.repeat))
+        frame.destroy()
+
+    def combobox_dropdown(self, count=20, values=10000):
+        from altkinter import CustomComboBox
+        frame = self.fresh_frame()
+        combo = CustomComboBox(frame, values=[f"Option {k}" for k in range(values)])
+        combo.pack()
+        settle(self.root)
+
+        def toggle():
+            for _ in range(count):
+                combo.show_dropdown()
+                self.root.update_idletasks()
+                combo.hide_dropdown()
+            self.root.update_idletasks()
+
+        result = timed(toggle, self.repeat)
+        result["ms"] /= count
+        result["min_ms"] /= count
+        self.record(f"interact.combobox_dropdown.{values}", result)
+        frame.destroy()
+
+    def listbox(self, count=200, items=10000):
+        from altkinter import CustomListBox
+        frame = self.fresh_frame()
+        box = CustomListBox(frame, items=[f"Item {k}" for k in range(items)])
+        box.pack(fill="both", expand=True)
+        settle(self.root)
+        height = max(1, box.listbox.winfo_height())
+
+        def hover():
+            for i in range(count):
+                box.on_hover(SimpleNamespace(y=i * 7 % height))
+            box.on_leave(None)
+            self.root.update_idletasks()
+
+        result = timed(hover, self.repeat)
+        result["ms"] /= count
+        result["min_ms"] /= count
+        self.record("interact.listbox_hover", result)
+
+        rng = random.Random(items)
+
+        def scroll(steps=50):
+            for _ in range(steps):
+                box.listbox.yview_moveto(rng.random())
+                self.root.update_idletasks()
+
+        result = timed(scroll, self.repeat)
+        result["ms"] /= 50
+        result["min_ms"] /= 50
+        self.record(f"interact.listbox_scroll.{items}", result)
+
+        def select_all():
+            box.listbox.selection_set(0, "end")
+            self.root.update_idletasks()
+            box.clear_selection()
+            self.root.update_idletasks()
+
+        self.record(f"interact.listbox_select_all.{items}", timed(select_all, self.repeat))
+        frame.destroy()
+
+    def progressbar_update(self, count=200):
+        from altkinter import CustomProgressBar
+        frame = self.fresh_frame()
+        bar = CustomProgressBar(frame)
+        bar.pack()
+        settle(self.root)
+
+        def update():
+            for i in range(count):
+                bar.set_progress((i + 1) / count)
+            self.root.update_idletasks()
+
+        result = timed(update, self.repeat)
+        result["ms"] /= count
+        result["min_ms"] /= count
+        self.record("interact.progressbar_update", result)
+        frame.destroy()
+
+    def scrollbar_drag(self, count=200):
+        from altkinter import CustomScrollbar
+        frame = self.fresh_frame()
+        bar = CustomScrollbar(frame, command=lambda *args: None)
+        bar.pack(fill="y", expand=True)
+        bar.set(0.0, 0.1)
+        settle(self.root)
+        height = max(1, bar.winfo_height())
+
+        def drag():
+            bar.set(0.0, 0.1)
+            bar._click_thumb(SimpleNamespace(x=0, y=1))
+            for i in range(count):
+                bar._drag_thumb(SimpleNamespace(x=0, y=1 + i * height // count))
+            self.root.update_idletasks()
+
+        result = timed(drag, self.repeat)
+        result["ms"] /= count
+        result["min_ms"] /= count
+        self.record("interact.scrollbar_drag", result)
+        frame.destroy()
+
+    def theme_switch(self, count=200):
+        from altkinter import (CustomButton, CustomCheckButton, CustomComboBox, CustomEntry, CustomLabel,
+                               CustomListBox, CustomProgressBar, CustomScrollbar, CustomTableView)
+        frame = self.fresh_frame()
+        kinds = (lambda i: CustomButton(frame, text=f"Button {i}"),
+                 lambda i: CustomEntry(frame, placeholder_text=f"Field {i}"),
+                 lambda i: CustomCheckButton(frame, text=f"Option {i}"),
+                 lambda i: CustomLabel(frame, text=f"Label {i}"),
+                 lambda i: CustomComboBox(frame, values=[f"Option {k}" for k in range(10)]),
+                 lambda i: CustomProgressBar(frame, progress=i / count),
+                 lambda i: CustomScrollbar(frame),
+                 lambda i: CustomListBox(frame, items=[f"Item {k}" for k in range(10)], height=60))
+        for i in range(count):
+            kinds[i % len(kinds)](i).grid(row=i % 25, column=i // 25)
+        CustomTableView(frame, columns=["a", "b", "c"],
+                        data=[[r, r * 2, r * 3] for r in range(1000)]).grid(row=0, column=99, rowspan=25)
+        settle(self.root)
+        modes = ["light", "dark"]
+
+        def switch():
+            modes.reverse()
+            self.root.set_theme(modes[0])
+            self.root.update_idletasks()
+
+        self.record(f"interact.theme_switch.{count}_widgets", timed(switch, self.repeat))
+        frame.destroy()
+
+    def tables(self):
+        from altkinter import CustomTableView
+        columns = ["id", "name", "price", "qty", "region", "flag"]
+        regions = ["north", "south", "east", "west"]
+        for size in self.sizes:
+            rows = [[i, f"name {i % 5000}", i * 0.25, i % 97, regions[i % 4], i % 2 == 0] for i in range(size)]
+            frame = self.fresh_frame()
+            table = CustomTableView(frame, columns=columns, data=[])
+            table.pack(fill="both", expand=True)
+            settle(self.root, table)
+
+            def load():
+                table.set_data(rows)
+                settle(self.root, table)
+
+            result = timed(load, max(1, self.repeat if size <= 100000 else 1))
+            result["data_bytes"] = table.memory_usage()["total"]
+            self.record(f"table.load.{size}", result)
+
+            rng = random.Random(size)
+
+            def scroll(count=50):
+                for _ in range(count):
+                    table.canvas.yview_moveto(rng.random())
+                    settle(self.root, table)
+
+            result = timed(scroll, self.repeat)
+            result["ms"] /= 50
+            result["min_ms"] /= 50
+            self.record(f"table.scroll.{size}", result)
+
+            self.record(f"table.select_all.{size}",
+                        timed(lambda: (table._select_all(), settle(self.root, table)), max(2, self.repeat // 2)))
+            frame.destroy()
+            del rows
+            gc.collect()
+
+    def run(self):
+        self.construction()
+        self.button_hover()
+        self.entry_focus()
+        self.checkbox_select_all()
+        self.combobox_dropdown()
+        self.listbox()
+        self.progressbar_update()
+        self.scrollbar_drag()
+        self.theme_switch()
+        self.tables()
+        self.root.destroy()
+        import tkinter
+        return {
+            "meta": {
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "tk": tkinter.TkVersion,
+                "platform": platform.platform(),
+                "sizes": self.sizes,
+                "repeat": self.repeat,
+            },
+            "results": self.results,
+        }
+
+
+def compare(results, baseline, tolerance):
+    """Print timings slower than the baseline by more than ``tolerance``; return their names."""
+    regressions = []
+    for name, result in results["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or not before.get("ms"):
+            continue
+        ratio = result["ms"] / before["ms"]
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            print(f"REGRESSION {name}: {before['ms']:.3f} ms -> {result['ms']:.3f} ms ({ratio:.2f}x)")
+    if not regressions:
+        print(f"No regressions beyond {tolerance:.0%} against the baseline.")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="benchmark-results.json", help="Where to write the results as JSON.")
+    parser.add_argument("--baseline", help="Earlier results to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a regression.")
+    parser.add_argument("--sizes", default="1000,100000,1000000", help="Comma-separated table row counts.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the median is kept.")
+    args = parser.parse_args()
+
+    ensure_display()
+    results = Suite([int(size) for size in args.sizes.split(",")], args.repeat).run()
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
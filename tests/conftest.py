@@ -0,0 +1,16 @@
+import tkinter as tk
+
+import pytest
+
+
+@pytest.fixture
+def root():
+    """A themed root window; tests using it are skipped where no display is available."""
+    from altkinter.altk import Tk
+    try:
+        window = Tk(theme_mode="light")
+    except tk.TclError as error:
+        pytest.skip(f"no display: {error}")
+    window.withdraw()
+    yield window
+    window.destroy()
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from altkinter.completion import PrefixIndex
+
+
+@pytest.fixture(scope="module")
+def terms():
+    rng = random.Random(7)
+    letters = "abcdeXY"
+    words = {"".join(rng.choice(letters) for _ in range(rng.randint(1, 6))) for _ in range(3000)}
+    return sorted(words)
+
+
+def brute_force(terms, weights, prefix, k):
+    matches = [i for i, term in enumerate(terms) if term.casefold().startswith(prefix.casefold())]
+    matches.sort(key=lambda i: (-weights[i], terms[i].casefold()))
+    return [terms[i] for i in matches[:k]]
+
+
+def test_weighted_top_k_matches_brute_force(terms):
+    rng = random.Random(1)
+    weights = [rng.randint(0, 50) for _ in terms]
+    index = PrefixIndex(terms, weights)
+    for prefix in ["", "a", "ab", "x", "Xy", "abc", "zz"]:
+        for k in (1, 5, 20):
+            assert index.complete(prefix, k) == brute_force(terms, weights, prefix, k)
+
+
+def test_unweighted_completions_are_alphabetical():
+    index = PrefixIndex(["beta", "Alpha", "alpine", "al", "gamma"])
+    assert index.complete("al", 10) == ["al", "Alpha", "alpine"]
+    assert index.complete("AL", 2) == ["al", "Alpha"]
+    assert index.complete("q") == [] and index.complete("a", 0) == []
+
+
+def test_weights_must_match_terms():
+    with pytest.raises(ValueError):
+        PrefixIndex(["a", "b"], [1])
+
+
+def test_save_and_load_round_trip(tmp_path, terms):
+    weights = list(range(len(terms)))
+    index = PrefixIndex(terms, weights)
+    path = tmp_path / "index.json"
+    index.save(path)
+    loaded = PrefixIndex.load(path)
+    assert len(loaded) == len(index)
+    assert loaded.complete("a", 10) == index.complete("a", 10)
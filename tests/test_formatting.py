@@ -0,0 +1,39 @@
+import datetime
+import math
+
+from altkinter.formatting import ColorScale, DateFormat, NumberFormat, RegexMatch, ValueRange
+
+
+def test_value_range_is_inclusive_and_ignores_non_numbers():
+    rule = ValueRange(low=1, high=3, background="#ff0000")
+    assert rule.classify([0, 1, 2.5, 3, 4, "2", None, True]) == [0, 1, 1, 1, 0, 0, 0, 0]
+    assert ValueRange(high=0).classify([-5, 5]) == [1, 0]
+
+
+def test_color_scale_spans_the_column_range():
+    rule = ColorScale("#000000", "#ffffff", steps=5)
+    assert len(rule.styles) == 5 and not rule.local
+    assert rule.classify([0, 5, 10, None, math.nan]) == [1, 3, 5, 0, 0]
+
+
+def test_color_scale_with_fixed_bounds_is_local_and_clamps():
+    rule = ColorScale("#000000", "#ffffff", low=0, high=10, steps=3)
+    assert rule.local
+    assert rule.classify([-5, 5, 50]) == [1, 2, 3]
+
+
+def test_regex_match_uses_the_text_of_each_value():
+    rule = RegexMatch(r"^err", foreground="#ff0000")
+    assert rule.classify(["error", "no error", 12, None]) == [1, 0, 0, 0]
+
+
+def test_number_format():
+    money = NumberFormat(precision=1, thousands=True, prefix="$", na="-")
+    assert money.format_many([1234.56, None, math.nan, "n/a", 3]) == ["$1,234.6", "-", "-", "n/a", "$3.0"]
+    assert money(0.04) == "$0.0"
+
+
+def test_date_format():
+    fmt = DateFormat("%d/%m/%Y", na="?")
+    day = datetime.date(2024, 2, 29)
+    assert fmt.format_many([day, None, day, "later"]) == ["29/02/2024", "?", "29/02/2024", "later"]
@@ -0,0 +1,57 @@
+import math
+import random
+
+import pytest
+
+from altkinter.tableview import _RunningStats, _summarize
+
+
+def assert_matches(stats, values):
+    expected = _summarize(values)
+    summary = stats.summary()
+    assert summary["count"] == expected["count"]
+    for name in ("sum", "mean", "var", "std", "min", "max"):
+        if expected[name] is None:
+            assert summary[name] is None
+        else:
+            assert summary[name] == pytest.approx(expected[name], rel=1e-9, abs=1e-9)
+
+
+def test_ignores_non_numeric_values():
+    stats = _RunningStats([1, "x", None, math.nan, 3, True])
+    assert stats.summary()["count"] == 2
+    assert stats.summary()["sum"] == 4
+
+
+def test_edits_removals_and_evictions():
+    rng = random.Random(3)
+    values = [rng.uniform(-100, 100) for _ in range(500)]
+    stats = _RunningStats(values)
+    assert_matches(stats, values)
+    # Edits: remove the old value, add the new one
+    for _ in range(300):
+        i = rng.randrange(len(values))
+        stats.remove(values[i])
+        values[i] = rng.randint(-1000, 1000)
+        stats.add(values[i])
+    assert_matches(stats, values)
+    # Ring-buffer evictions: drop the oldest while appending
+    for _ in range(2000):
+        stats.remove(values.pop(0))
+        values.append(rng.uniform(0, 1))
+        stats.add(values[-1])
+    assert_matches(stats, values)
+    # Removing the extremes moves min and max
+    for value in sorted(values)[:10] + sorted(values)[-10:]:
+        values.remove(value)
+        stats.remove(value)
+    assert_matches(stats, values)
+
+
+def test_removing_everything_resets():
+    stats = _RunningStats([1, 2])
+    stats.remove(1)
+    stats.remove(2)
+    assert stats.summary()["count"] == 0 and stats.summary()["min"] is None
+    stats.add(5)
+    assert stats.summary()["max"] == 5
@@ -0,0 +1,87 @@
+from array import array
+
+import pytest
+
+from altkinter.storage import ColumnStore
+
+
+def values(store, col):
+    return [row[col] for row in store]
+
+
+def test_typed_columns():
+    store = ColumnStore(4, [[1, 1.5, "a"], [2, 2.5, "a"], [3, 3.5, "b"], [4, 4.5, "a"]])
+    ints, floats, strings = store.columns
+    assert ints.values.typecode == "q"
+    assert floats.values.typecode == "d"
+    assert strings.strings == ["a", "b"] and strings.values.typecode == "H"
+    assert values(store, 0) == [1, 2, 3, 4]
+    assert values(store, 3) == ["a", "a", "b", "a"]
+
+
+def test_mixed_and_distinct_columns_fall_back_to_lists():
+    store = ColumnStore(3, [[1, "a"], ["x", "b"], [3, "c"]])
+    assert all(isinstance(column.values, list) for column in store.columns)
+    assert values(store, 1) == [1, "x", 3]
+
+
+def test_set_downgrades_only_on_a_type_change():
+    store = ColumnStore(3, [[1, "a"], [2, "a"]])
+    store[0][1] = 5
+    store[1][2] = "b"
+    assert isinstance(store.columns[0].values, array) and store.columns[1].strings == ["a", "b"]
+    store[1][1] = "text"
+    assert isinstance(store.columns[0].values, list)
+    assert values(store, 1) == [5, "text"]
+
+
+def test_codes_widen_past_65536_strings():
+    store = ColumnStore(2, [[f"s{i % 70000}"] for i in range(150000)])
+    assert store.columns[0].values.typecode == "I"
+    assert store[-1][1] == f"s{149999 % 70000}"
+
+
+def test_extend_widens_without_corrupting_other_columns():
+    store = ColumnStore(3, [[i, f"a{i % 60000}"] for i in range(120000)])
+    store.extend([[0, j, f"b{j}"] for j in range(10000)])
+    assert len(store) == 130000
+    assert store.columns[1].values.typecode == "I"
+    assert store[-1][1:] == [9999, "b9999"]
+    assert len(store.columns[0].values) == len(store.columns[1].values) == 130000
+
+
+def test_eviction_renumbers_and_bounds_the_string_table():
+    store = ColumnStore(2, maxlen=1000)
+    for i in range(60000):
+        store.append([i + 1, f"msg {i}"])
+    assert len(store) == 1000
+    assert store[0][0] == 59001 and store[0][1] == "msg 59000"
+    column = store.columns[0]
+    assert len(column.strings or column.values) <= 3 * 1000 + 1024
+
+
+@pytest.mark.parametrize("batch", [3, 12])
+def test_row_numbers_follow_the_incoming_records(batch):
+    store = ColumnStore(2, maxlen=5)
+    number = 1
+    for start in range(0, 30, batch):
+        rows = [[f"r{i}"] for i in range(start, start + batch)]
+        first = number + max(0, len(rows) - 5)
+        store.extend([[n] + row for n, row in zip(range(first, first + 5), rows[-5:])])
+        number += len(rows)
+    assert values(store, 0) == list(range(number - 5, number))
+
+
+def test_take_keeps_order_and_renumbers():
+    store = ColumnStore(3, [[i, "even" if i % 2 == 0 else "odd"] for i in range(10)])
+    taken = store.take([7, 2, 4])
+    assert [list(row) for row in taken] == [[1, 7, "odd"], [2, 2, "even"], [3, 4, "even"]]
+    taken[0][2] = "new"
+    assert store[7][2] == "odd"
+
+
+def test_column_transform_runs_once_per_distinct_string():
+    store = ColumnStore(2, [["a"], ["b"], ["a"], ["a"]])
+    calls = []
+    assert store.column(1, lambda s: calls.append(s) or s.upper()) == ["A", "B", "A", "A"]
+    assert sorted(calls) == ["a", "b"]
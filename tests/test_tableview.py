@@ -0,0 +1,25 @@
+from altkinter.tableview import CustomTableView
+
+
+def test_streaming_under_a_search_keeps_new_rows(root):
+    table = CustomTableView(root, columns=["name"], data=[["a"], ["xa"], ["b"], ["xb"], ["c"]])
+    table.pack()
+    root.update()
+    table.start_streaming(max_rows=100)
+    assert table.search("x") == 2
+    table.push_rows([["x6"], ["y10"]])
+    table.stop_streaming()
+    assert [table.data[row][1] for row in table.view] == ["xa", "xb", "x6"]
+    table.clear_search()
+    assert len(table.view) == 7
+    assert table.search("y") == 1
+
+
+def test_set_column_width_before_layout(root):
+    table = CustomTableView(root, columns=["a", "b"], data=[[1, 2], [3, 4]])
+    table.set_column_width("b", 150)
+    table.pack()
+    root.update()
+    assert table.col_widths[2] == 150
+    table.set_column_width(0, 90)
+    assert table.col_widths[1] == 90
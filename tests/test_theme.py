@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from altkinter.theme import BUILTIN_THEMES, Palette, Theme, get_palette, load_themes, register_theme, theme_names
+
+COLORS = {"background": "#101010", "widget_bg": "#202020", "accent": "#3388ff", "text": "#eeeeee"}
+
+
+def test_builtin_themes_are_registered():
+    assert set(BUILTIN_THEMES) <= set(theme_names())
+    assert get_palette("light").name == "light"
+
+
+def test_missing_roles_are_derived():
+    palette = Palette("derived", COLORS)
+    for role in ("hover", "active", "border", "focus", "placeholder", "error"):
+        assert getattr(palette, role).startswith("#") and len(getattr(palette, role)) == 7
+    assert palette.rgb["text"] == pytest.approx((0xee / 255,) * 3)
+
+
+def test_invalid_palettes_are_rejected():
+    with pytest.raises(ValueError):
+        Palette("bad", {"background": "#000000"})
+    with pytest.raises(ValueError):
+        Palette("bad", dict(COLORS, sparkle="#ffffff"))
+    with pytest.raises(ValueError):
+        Palette("bad", dict(COLORS, text="white"))
+
+
+def test_palettes_are_immutable_and_keyed_by_content():
+    first = Palette("one", COLORS)
+    second = Palette("two", COLORS)
+    assert first == second and hash(first) == hash(second)
+    assert first != Palette("three", dict(COLORS, accent="#ff0000"))
+    with pytest.raises(AttributeError):
+        first.text = "#000000"
+
+
+def test_load_themes_from_json(tmp_path):
+    path = tmp_path / "themes.json"
+    path.write_text(json.dumps({"test-json": dict(COLORS, font=["Arial", 12])}))
+    assert load_themes(path) == ["test-json"]
+    palette = get_palette("test-json")
+    assert palette.font == ("Arial", 12)
+    assert Palette("copy", palette.as_dict()) == palette
+
+
+def test_unknown_theme():
+    with pytest.raises(ValueError):
+        get_palette("no-such-theme")
+
+
+def test_theme_follows_the_registry():
+    register_theme("test-theme", COLORS)
+    theme = Theme("test-theme")
+    assert theme.accent == "#3388ff" and theme.rgb is theme.palette.rgb
+    theme.switch("light")
+    assert theme.palette is get_palette("light")